@@ -0,0 +1,187 @@
+"""
+Compare the Playwright MCP and native tool backends.
+
+Per-call latency: each backend's browser tools are driven directly (no LLM)
+through the same sequence of navigate, snapshot, evaluate and click calls
+against a local test page or --url, and session startup is timed separately.
+
+Total run time (--full): runs FrontendTestCrew.test_website once per backend
+with the same scenario. Needs an LLM API key; LLM latency dominates, so
+compare it over several runs.
+
+Usage:
+    python benchmarks/backend_benchmark.py
+    python benchmarks/backend_benchmark.py --iterations 50 --backends native
+    python benchmarks/backend_benchmark.py --url https://example.com --full
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+_TEST_PAGE = b"""<!doctype html>
+<html><head><title>Backend benchmark</title></head>
+<body>
+  <h1>Backend benchmark</h1>
+  <nav><a href="/">Home</a> <a href="/?page=2">Page 2</a></nav>
+  <form id="login">
+    <label>Email <input id="email" name="email" type="email"></label>
+    <label>Password <input id="password" name="password" type="password"></label>
+    <button id="submit" type="button" onclick="document.getElementById('out').textContent='clicked'">Sign in</button>
+  </form>
+  <p id="out"></p>
+  <ul>""" + b"".join(b"<li>Item %d</li>" % i for i in range(200)) + b"""</ul>
+</body></html>"""
+
+# Operation -> (native tool and arguments, MCP tool and arguments)
+OPERATIONS: Dict[str, Tuple[Tuple[str, Dict[str, Any]], Tuple[str, Dict[str, Any]]]] = {
+    "navigate": (("navigate_to_url", {"url": "{url}"}), ("browser_navigate", {"url": "{url}"})),
+    "snapshot": (("take_snapshot", {}), ("browser_snapshot", {})),
+    "evaluate": (
+        ("evaluate_javascript", {"script": "() => document.title"}),
+        ("browser_evaluate", {"function": "() => document.title"}),
+    ),
+    "click": (("click_element", {"selector": "#submit"}), ("browser_click", {"element": "Sign in button", "ref": None})),
+}
+
+
+class _TestPageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(_TEST_PAGE)))
+        self.end_headers()
+        self.wfile.write(_TEST_PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def local_test_page() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TestPageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+
+
+@contextmanager
+def open_backend(backend: str, browser: str) -> Iterator[Dict[str, Any]]:
+    """Start a browser session and yield its tools by name"""
+    if backend == "native":
+        from frontend_test_crew.tools.playwright_tools import BrowserManager, native_tools
+
+        manager = BrowserManager(browser=browser)
+        try:
+            manager.start_browser()
+            yield {tool.name: tool for tool in native_tools(manager)}
+        finally:
+            manager.shutdown()
+    else:
+        from crewai_tools import MCPServerAdapter
+        from frontend_test_crew.mcp_config import get_playwright_mcp_params
+
+        with MCPServerAdapter(get_playwright_mcp_params(browser=browser, isolated=True)) as tools:
+            tools = {tool.name: tool for tool in tools}
+            # The MCP server launches its browser on the first browser call
+            tools["browser_navigate"].run(url="about:blank")
+            yield tools
+
+
+def _mcp_ref(tools: Dict[str, Any]) -> str:
+    """Find the snapshot ref of the submit button, which MCP clicks require"""
+    snapshot = str(tools["browser_snapshot"].run())
+    for line in snapshot.splitlines():
+        if "Sign in" in line and "[ref=" in line:
+            return line.split("[ref=", 1)[1].split("]", 1)[0]
+    raise RuntimeError("Submit button not found in the MCP snapshot")
+
+
+def measure_calls(backend: str, browser: str, url: str, iterations: int) -> Tuple[float, Dict[str, List[float]]]:
+    """
+    Returns:
+        Tuple of (session startup seconds, {operation: call latencies in ms})
+    """
+    started = time.perf_counter()
+    with open_backend(backend, browser) as tools:
+        startup = time.perf_counter() - started
+        native = backend == "native"
+        tools[OPERATIONS["navigate"][0 if native else 1][0]].run(url=url)
+        ref = None if native else _mcp_ref(tools)
+
+        latencies: Dict[str, List[float]] = {operation: [] for operation in OPERATIONS}
+        for _ in range(iterations):
+            for operation, variants in OPERATIONS.items():
+                name, arguments = variants[0 if native else 1]
+                arguments = {
+                    key: (url if value == "{url}" else ref if value is None else value)
+                    for key, value in arguments.items()
+                }
+                call_started = time.perf_counter()
+                tools[name].run(**arguments)
+                latencies[operation].append((time.perf_counter() - call_started) * 1000)
+    return startup, latencies
+
+
+def measure_full_run(backend: str, browser: str, url: str) -> Tuple[float, str]:
+    from frontend_test_crew.crew import FrontendTestCrew
+
+    crew = FrontendTestCrew(browser=browser, backend=backend, history_path=None)
+    started = time.perf_counter()
+    outcome = crew.test_website(
+        website_url=url,
+        test_scenario="Verify the page title and the main heading, then click the Sign in button"
+    )
+    return time.perf_counter() - started, outcome["status"]
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the MCP and native browser tool backends")
+    parser.add_argument("--backends", nargs="+", default=["mcp", "native"], choices=["mcp", "native"])
+    parser.add_argument("--browser", default="chromium", help="Browser type (default: chromium)")
+    parser.add_argument("--url", help="Page to benchmark against (default: a local test page)")
+    parser.add_argument("--iterations", type=int, default=20, help="Rounds of calls per backend (default: 20)")
+    parser.add_argument("--full", action="store_true", help="Also time a complete test_website run per backend")
+    args = parser.parse_args(argv)
+
+    with local_test_page() as local_url:
+        url = args.url or local_url
+        for backend in args.backends:
+            try:
+                startup, latencies = measure_calls(backend, args.browser, url, args.iterations)
+            except Exception as e:
+                print(f"{backend}: failed: {e}\n")
+                continue
+            print(f"{backend}")
+            print(f"  session startup: {startup * 1000:.0f} ms")
+            total = sum(sum(values) for values in latencies.values())
+            for operation, values in latencies.items():
+                print(f"  {operation:<9} median {statistics.median(values):7.1f} ms   "
+                      f"p95 {_percentile(values, 0.95):7.1f} ms")
+            print(f"  all calls: {total:.0f} ms over {sum(len(v) for v in latencies.values())} calls")
+            if args.full:
+                duration, status = measure_full_run(backend, args.browser, url)
+                print(f"  full run: {duration:.1f} s ({status})")
+            print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Measure cold-start import cost of the crew's entry points.
+
+Each target is imported in a fresh interpreter with `-X importtime`, so
+results reflect what a new CI job or process-pool worker pays. The report
+lists the wall time per target and the modules with the largest cumulative
+import time.
+
+Usage:
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py frontend_test_crew.crew --top 25 --repeat 5
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_TARGETS = [
+    "frontend_test_crew",
+    "frontend_test_crew.cli",
+    "frontend_test_crew.report_builder",
+    "frontend_test_crew.history",
+    "frontend_test_crew.crew",
+    "frontend_test_crew.tools.playwright_tools",
+]
+
+# "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(target: str) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        Tuple of (wall time in seconds, {module: (self us, cumulative us)})
+    """
+    env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, "src") + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    wall = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {target} failed:\n{completed.stderr.strip().splitlines()[-1]}")
+
+    modules = {}
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            modules[module] = (int(self_us), int(cumulative_us))
+    return wall, modules
+
+
+def report(target: str, repeat: int, top: int) -> List[str]:
+    walls = []
+    modules: Dict[str, Tuple[int, int]] = {}
+    for _ in range(repeat):
+        wall, modules = measure(target)
+        walls.append(wall)
+
+    top_level = {name: times for name, times in modules.items() if "." not in name}
+    lines = [
+        target,
+        f"  wall time: median {statistics.median(walls) * 1000:.0f} ms, "
+        f"min {min(walls) * 1000:.0f} ms over {repeat} run(s)",
+        f"  modules imported: {len(modules)}",
+        "  slowest top-level packages (cumulative):",
+    ]
+    slowest = sorted(top_level.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    for name, (self_us, cumulative_us) in slowest:
+        lines.append(f"    {cumulative_us / 1000:9.1f} ms  {name}")
+    return lines
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Report cold-start import time per entry point")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS, help="Modules to import")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per target (default: 3)")
+    parser.add_argument("--top", type=int, default=15, help="Packages listed per target (default: 15)")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for target in args.targets:
+        try:
+            print("\n".join(report(target, args.repeat, args.top)))
+        except RuntimeError as e:
+            print(str(e))
+            failed = True
+        print()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
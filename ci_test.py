@@ -5,11 +5,7 @@ Run suite in CI with essential output
 import os
 import subprocess
 
-import litellm.llms.anthropic.chat
-from crewai import LLM
 from dotenv import load_dotenv
-from src.frontend_test_crew.crew import FrontendTestCrew
-from litellm.llms.anthropic.chat import AnthropicChatCompletion
 
 
 def main():
@@ -40,6 +36,9 @@ def main():
         print("Please install Node.js from https://nodejs.org/")
         return
 
+    # Import the crew only once the environment checks passed; it loads CrewAI
+    from src.frontend_test_crew.crew import FrontendTestCrew
+
     # Create the crew
     crew = FrontendTestCrew(headless=False)
 
@@ -54,7 +53,7 @@ def main():
 
 
     if result['status'] == 'completed':
-        json_result = result['result'].json_dict
+        json_result = result['report']
         print(json_result)
         if json_result.get('success', True):
             exit(0)
@@ -5,11 +5,7 @@ Simple test to verify Playwright MCP integration with CrewAI
 import os
 import subprocess
 
-import litellm.llms.anthropic.chat
-from crewai import LLM
 from dotenv import load_dotenv
-from src.frontend_test_crew.crew import FrontendTestCrew
-from litellm.llms.anthropic.chat import AnthropicChatCompletion
 
 def main():
     """Run a simple test"""
@@ -41,6 +37,9 @@ def main():
     print("\n🤖 Frontend Test Crew - Playwright MCP Integration Test")
     print("="*60)
 
+    # Import the crew only once the environment checks passed; it loads CrewAI
+    from src.frontend_test_crew.crew import FrontendTestCrew
+
     # Create the crew
     crew = FrontendTestCrew( headless=False)
 
@@ -1,3 +1,27 @@
 """Frontend Test Crew - Multi-agent testing system using CrewAI and Playwright"""
 
+import importlib
+
 __version__ = "0.1.0"
+
+# Entry points are resolved lazily so that importing the package (for the CLI,
+# report merging or the results history) does not load CrewAI and its tools.
+_EXPORTS = {
+    "FrontendTestCrew": ".crew",
+    "test_website_standalone": ".crew",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -10,14 +10,14 @@ def create_test_planner(llm: Optional[Any] = None, tools: List = None, verbose =
 
     This agent is responsible for:
     - Analyzing the testing requirements
-    - Exploring the website using Playwright MCP tools
+    - Exploring the website using Playwright browser tools
     - Creating detailed test plans in semi-structured format
     - Breaking down complex test scenarios into executable steps
     - Considering edge cases and error scenarios
 
     Args:
         llm: Optional LLM instance
-        tools: List of tools from MCP server (provided by MCPServerAdapter)
+        tools: Browser tools (from the Playwright MCP server or the native tool set)
 
     Returns:
         Agent configured for test planning
@@ -30,7 +30,7 @@ def create_test_planner(llm: Optional[Any] = None, tools: List = None, verbose =
         goal="Create comprehensive, well-structured test plans for frontend web applications using Playwright",
         backstory=(
             "You are an experienced QA engineer with deep expertise in frontend testing and Playwright. "
-            "You have access to Playwright MCP tools to explore web applications in real-time. "
+            "You have access to Playwright browser tools to explore web applications in real-time. "
             "Before creating test plans, you navigate to the website, take snapshots, and analyze "
             "the page structure to understand what elements are available. "
             "Your test plans specify exact CSS selectors, element references, and interaction patterns "
@@ -53,7 +53,7 @@ def create_test_executor(llm: Optional[Any] = None, tools: List = None, verbose=
 
     This agent is responsible for:
     - Taking test plans from the planner
-    - Executing tests step-by-step using Playwright MCP tools
+    - Executing tests step-by-step using Playwright browser tools
     - Reporting test results with detailed logs
     - Handling test failures and providing diagnostic information
     - Taking screenshots when tests fail
@@ -61,7 +61,7 @@ def create_test_executor(llm: Optional[Any] = None, tools: List = None, verbose=
 
     Args:
         llm: Optional LLM instance
-        tools: List of tools from MCP server (provided by MCPServerAdapter)
+        tools: Browser tools (from the Playwright MCP server or the native tool set)
 
     Returns:
         Agent configured for test execution
@@ -74,7 +74,7 @@ def create_test_executor(llm: Optional[Any] = None, tools: List = None, verbose=
         goal="Execute frontend tests accurately using Playwright MCP and report comprehensive results",
         backstory=(
             "You are a skilled test automation engineer specializing in Playwright. "
-            "You have access to the complete Playwright MCP toolkit for browser automation. "
+            "You have access to a complete Playwright toolkit for browser automation. "
             "You execute test plans methodically, one step at a time, verifying each action succeeds "
             "before proceeding. You understand: "
             "- CSS selectors and element targeting strategies "
@@ -83,14 +83,27 @@ def create_test_executor(llm: Optional[Any] = None, tools: List = None, verbose=
             "- Element visibility and state verification "
             "- Screenshot capture for failure analysis "
             "- JavaScript evaluation for advanced checks "
+            "- Visual checks with assert_visual_match, when available, instead of reading the page "
+            "to judge layout or appearance "
+            "\n"
+            "If the start_test_case and end_test_case tools are available, call start_test_case "
+            "with the plan's test ID before each test case and end_test_case with its outcome after it, "
+            "so failed cases keep a full trace. "
+            "If the record_test_case tool is available, call it with each test case's result as soon "
+            "as the case is finished. "
+            "If a tool or message says the budget is exhausted, stop testing and give your final answer "
+            "right away, listing the test cases you did not run with status \"skipped\". "
             "\n"
             "When a test step fails, you: "
-            "1. Take a screenshot for debugging "
+            "1. Take a screenshot for debugging (skip this and step 2 when the case is traced; "
+            "the trace already records the page) "
             "2. Get the current page state (URL, visible text) "
             "3. Report the exact error with context "
             "4. Suggest potential causes "
             "\n"
-            "You always close the browser when testing completes. "
+            "If the reset_browser_context tool is available, call it between test scenarios to start "
+            "from a clean session. You never close the browser, it is shut down automatically when "
+            "testing completes. "
             "Your reports include pass/fail status for each step with clear, actionable information."
             "Test plan is always read from TEST_PLAN.md file."
         ),
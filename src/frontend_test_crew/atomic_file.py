@@ -0,0 +1,35 @@
+"""Atomic file replacement for files shared by parallel workers"""
+
+import os
+import tempfile
+from typing import Union
+
+
+def write_atomic(path: str, data: Union[str, bytes]):
+    """
+    Replace path with data by writing a temporary file next to it and
+    renaming it over path.
+
+    Readers see either the previous file or the new one, never a partial
+    write, and a crash mid-write leaves the previous file intact. The
+    temporary name is unique, so concurrent writers (threads or processes)
+    don't clobber each other's temporary files; the last rename wins.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp", delete=False
+    ) as f:
+        try:
+            f.write(data)
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    try:
+        os.replace(f.name, path)
+    except BaseException:
+        os.remove(f.name)
+        raise
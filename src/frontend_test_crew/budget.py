@@ -0,0 +1,213 @@
+"""Run-level and per-task budgets for wall-clock time, tokens and tool calls"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .llm_scheduler import text_tokens
+from .llm_wrapper import LLMWrapper
+from .models import SKIPPED_CASE_ID, ExecutionResultsModel, TestCaseResult
+from .tools.tool_wrapper import ToolWrapper
+
+
+class BudgetLimits(BaseModel):
+    """Upper bounds of a run, or of the tasks of one role; None is unlimited"""
+    wall_clock_s: Optional[float] = Field(None, description="Seconds since the run (or the role's first call) started")
+    tokens: Optional[int] = Field(None, description="Estimated prompt and completion tokens of all LLM calls")
+    tool_calls: Optional[int] = Field(None, description="Tool calls")
+
+
+class BudgetExceeded(Exception):
+    """Raised by a budgeted LLM when an agent keeps going after its budget ran out"""
+
+
+class _Scope:
+    """Usage of the run or of one role, against its limits"""
+
+    def __init__(self, name: str, limits: BudgetLimits):
+        self.name = name
+        self.limits = limits
+        self.started = time.monotonic()
+        self.tokens = 0.0
+        self.tool_calls = 0
+        self.llm_calls = 0
+        self.exhausted: Optional[str] = None
+
+    def check(self, now: float) -> Optional[str]:
+        # Sticky: once a limit is hit the scope stays exhausted
+        if self.exhausted is None:
+            limits = self.limits
+            if limits.wall_clock_s is not None and now - self.started >= limits.wall_clock_s:
+                self.exhausted = f"{self.name} wall-clock budget of {limits.wall_clock_s:g}s"
+            elif limits.tokens is not None and self.tokens >= limits.tokens:
+                self.exhausted = f"{self.name} budget of {limits.tokens} tokens"
+            elif limits.tool_calls is not None and self.tool_calls >= limits.tool_calls:
+                self.exhausted = f"{self.name} budget of {limits.tool_calls} tool calls"
+        return self.exhausted
+
+    def usage(self, now: float) -> Dict[str, Any]:
+        return {
+            "limits": self.limits.model_dump(exclude_none=True),
+            "elapsed_s": round(now - self.started, 2),
+            "tokens": int(self.tokens),
+            "tool_calls": self.tool_calls,
+            "llm_calls": self.llm_calls,
+            "exhausted": self.exhausted,
+        }
+
+
+class RunBudget:
+    """
+    Budget of one test_website run, enforced by the budgeted LLMs and tools
+    of every agent.
+
+    The run scope starts with the run; each role ("planner", "executor",
+    "reporter") has its own scope, started at the role's first call and
+    shared by all its tasks (e.g. every executor of a matrix run). An
+    exhausted run stops every role; an exhausted role stops only itself.
+
+    Thread-safe: matrix and pipelined runs charge from several executors.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[BudgetLimits] = None,
+        task_limits: Optional[Dict[str, BudgetLimits]] = None,
+        grace_calls: int = 2
+    ):
+        """
+        Args:
+            limits: Limits of the whole run
+            task_limits: Limits per role
+            grace_calls: LLM calls each agent gets after its budget ran out,
+                to give its final answer, before BudgetExceeded is raised
+        """
+        self.grace_calls = grace_calls
+        self.task_limits = task_limits or {}
+        self._run = _Scope("run", limits or BudgetLimits())
+        self._tasks: Dict[str, _Scope] = {}
+        self._lock = threading.Lock()
+
+    def _scopes(self, role: Optional[str]) -> List[_Scope]:
+        if role is None:
+            return [self._run]
+        if role not in self._tasks:
+            self._tasks[role] = _Scope(role, self.task_limits.get(role) or BudgetLimits())
+        return [self._run, self._tasks[role]]
+
+    def _check(self, role: Optional[str]) -> Optional[str]:
+        now = time.monotonic()
+        return next((reason for reason in (scope.check(now) for scope in self._scopes(role)) if reason), None)
+
+    def exhausted(self, role: Optional[str] = None) -> Optional[str]:
+        """The limit that ran out for the role (or the run), if any"""
+        with self._lock:
+            return self._check(role)
+
+    def charge_llm_call(self, role: str, tokens: float):
+        with self._lock:
+            for scope in self._scopes(role):
+                scope.llm_calls += 1
+                scope.tokens += tokens
+
+    def charge_tool_call(self, role: str) -> Optional[str]:
+        """Count a tool call; returns the exhausted limit instead if the call must not run"""
+        with self._lock:
+            reason = self._check(role)
+            if reason is None:
+                for scope in self._scopes(role):
+                    scope.tool_calls += 1
+            return reason
+
+    def usage(self) -> Dict[str, Any]:
+        """Usage of the run and of each role, for the report"""
+        with self._lock:
+            now = time.monotonic()
+            self._check(None)
+            usage = self._run.usage(now)
+            usage["tasks"] = {}
+            for role, scope in self._tasks.items():
+                scope.check(now)
+                usage["tasks"][role] = scope.usage(now)
+            return usage
+
+
+def stop_message(reason: str) -> str:
+    return (
+        f"Budget exhausted ({reason}). Do not call any more tools: give your Final Answer now "
+        "with the results you have. When executing tests, list every test case of the plan "
+        "you have not run with status \"skipped\"."
+    )
+
+
+def _with_note(messages: Any, note: str) -> Any:
+    if isinstance(messages, str):
+        return f"{messages}\n\n{note}"
+    return list(messages or []) + [{"role": "user", "content": note}]
+
+
+class BudgetedLLM(LLMWrapper):
+    """
+    LLM that charges every call of one agent to a RunBudget.
+
+    Once the budget is exhausted the agent gets a few grace calls, each
+    told to give its final answer; after that calls raise BudgetExceeded.
+    """
+
+    def __init__(self, llm: Any, budget: RunBudget, role: str):
+        self.budget = budget
+        self.role = role
+        self.grace_left = budget.grace_calls
+        super().__init__(llm)
+
+    def call(self, messages: Any, *args, **kwargs) -> Any:
+        reason = self.budget.exhausted(self.role)
+        if reason is not None:
+            if self.grace_left <= 0:
+                raise BudgetExceeded(f"Budget exhausted: {reason}")
+            self.grace_left -= 1
+            messages = _with_note(messages, stop_message(reason))
+        tokens = text_tokens(messages)
+        result = None
+        try:
+            result = self.llm.call(messages, *args, **kwargs)
+            return result
+        finally:
+            self.budget.charge_llm_call(self.role, tokens + text_tokens(result))
+
+
+class BudgetedTool(ToolWrapper):
+    """Counts calls against a RunBudget and refuses them once it is exhausted"""
+
+    budget: Any = Field(..., exclude=True)
+    role: str = Field(..., description="Role whose budget the calls are charged to")
+
+    def _run(self, **kwargs) -> Any:
+        reason = self.budget.charge_tool_call(self.role)
+        if reason is not None:
+            return f"✗ {stop_message(reason)}"
+        return self._call_inner(**kwargs)
+
+
+def budget_tools(tools: List[Any], budget: RunBudget, role: str) -> List[Any]:
+    """Wrap every tool of an agent of the given role"""
+    return [BudgetedTool(tool, budget=budget, role=role) for tool in tools]
+
+
+def skipped_results(
+    label: str,
+    reason: str,
+    cases: Iterable[TestCaseResult] = ()
+) -> ExecutionResultsModel:
+    """
+    Results of an execution stopped by the budget: the cases that finished
+    before the stop, and one skipped entry standing for the rest.
+    """
+    return ExecutionResultsModel(test_cases=list(cases) + [TestCaseResult(
+        test_id=SKIPPED_CASE_ID,
+        test_name=f"{label}: remaining test cases",
+        status="skipped",
+        errors=[reason],
+    )])
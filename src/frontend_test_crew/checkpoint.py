@@ -0,0 +1,196 @@
+"""Checkpoints of test runs, so an interrupted run resumes instead of starting over"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field, ValidationError
+
+from .atomic_file import write_atomic
+from .models import ExecutionResultsModel, TestCaseResult
+from .pipeline import PlannedSuite
+
+
+class RunCheckpoint(BaseModel):
+    """
+    Progress of one run.
+
+    Execution progress is kept per unit: the browser for sequential and
+    matrix runs, the suite (see suite_unit) for pipelined runs.
+    """
+    key: str
+    website_url: str
+    test_scenario: str
+    plan: Optional[str] = None
+    suites: List[PlannedSuite] = []
+    planning_done: bool = False
+    cases: Dict[str, List[TestCaseResult]] = {}
+    executions: Dict[str, ExecutionResultsModel] = {}
+    updated_at: float = 0.0
+
+
+def suite_unit(suite: PlannedSuite) -> str:
+    """
+    Execution unit of a pipelined suite. Suites are identified by their
+    position in the plan, since the planner may give two suites one title.
+    """
+    return f"suite:{suite.index}:{suite.title}"
+
+
+def run_key(website_url: str, test_scenario: str, **options: Any) -> str:
+    """Identify a run by its inputs; a resumed run must use the same ones"""
+    payload = json.dumps([website_url, test_scenario, options], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class Checkpointer:
+    """
+    Records a run's progress to a JSON file after every planning step,
+    test case and execution task.
+
+    Thread-safe: pipelined and matrix runs record from several executors.
+    """
+
+    def __init__(self, path: str, checkpoint: RunCheckpoint, resumed: bool = False):
+        self.path = path
+        self.checkpoint = checkpoint
+        self.resumed = resumed
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(
+        cls,
+        directory: str,
+        key: str,
+        website_url: str,
+        test_scenario: str,
+        resume: bool = False
+    ) -> "Checkpointer":
+        """
+        Load the checkpoint of this run if resuming, otherwise start a new one.
+
+        A missing or unreadable checkpoint resumes from the beginning.
+        """
+        path = os.path.join(directory, f"{key}.json")
+        checkpoint = None
+        if resume:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    checkpoint = RunCheckpoint.model_validate_json(f.read())
+            except (OSError, ValueError, ValidationError):
+                checkpoint = None
+        if checkpoint is None:
+            return cls(path, RunCheckpoint(key=key, website_url=website_url, test_scenario=test_scenario))
+        return cls(path, checkpoint, resumed=True)
+
+    def progress(self) -> Dict[str, Any]:
+        """What a resumed run can skip"""
+        with self._lock:
+            return {
+                "resumed": self.resumed,
+                "plan_reused": self.resumed and self.checkpoint.planning_done,
+                "cases_skipped": sum(len(cases) for cases in self.checkpoint.cases.values()),
+                "executions_skipped": len(self.checkpoint.executions),
+            }
+
+    def _save(self):
+        self.checkpoint.updated_at = time.time()
+        # A crash mid-write leaves the previous checkpoint intact
+        write_atomic(self.path, self.checkpoint.model_dump_json())
+
+    def record_plan(self, plan: str):
+        with self._lock:
+            self.checkpoint.plan = plan
+            self.checkpoint.planning_done = True
+            self._save()
+
+    def record_suite(self, suite: PlannedSuite):
+        """Record a published suite, replacing one published at the same index by an earlier attempt"""
+        with self._lock:
+            if suite in self.checkpoint.suites:
+                return
+            suites = [known for known in self.checkpoint.suites if known.index != suite.index]
+            self.checkpoint.suites = sorted(suites + [suite], key=lambda known: known.index)
+            self._save()
+
+    def record_case(self, unit: str, case: TestCaseResult):
+        """Record a finished test case, replacing an earlier result with the same ID"""
+        with self._lock:
+            cases = [known for known in self.checkpoint.cases.get(unit, []) if known.test_id != case.test_id]
+            self.checkpoint.cases[unit] = cases + [case]
+            self._save()
+
+    def record_execution(self, unit: str, results: ExecutionResultsModel):
+        with self._lock:
+            self.checkpoint.executions[unit] = results
+            self._save()
+
+    def completed_cases(self, unit: str) -> List[TestCaseResult]:
+        with self._lock:
+            return list(self.checkpoint.cases.get(unit, []))
+
+    def execution(self, unit: str) -> Optional[ExecutionResultsModel]:
+        with self._lock:
+            return self.checkpoint.executions.get(unit)
+
+    def merge(self, unit: str, results: ExecutionResultsModel) -> ExecutionResultsModel:
+        """
+        Combine an execution's results with the cases recorded for the unit
+        in earlier attempts, in the order they were completed.
+        """
+        new_ids = {case.test_id for case in results.test_cases}
+        earlier = [case for case in self.completed_cases(unit) if case.test_id not in new_ids]
+        return results.model_copy(update={"test_cases": earlier + list(results.test_cases)})
+
+    def resume_hint(self, unit: str) -> Optional[str]:
+        """Executor guidance listing the cases that don't need to run again"""
+        done = self.completed_cases(unit)
+        if not done:
+            return None
+        return (
+            "This run resumes an interrupted one. These test cases were already completed and "
+            f"must not be run again: {', '.join(case.test_id for case in done)}. "
+            "Continue with the remaining test cases; report only those."
+        )
+
+    def clear(self):
+        """Delete the checkpoint once the run has produced its report"""
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+class RecordTestCaseInput(BaseModel):
+    """Input for Record Test Case tool"""
+    test_id: str = Field(..., description="Test case ID from the plan, e.g. TC-001")
+    test_name: str = Field(..., description="Test case name")
+    status: str = Field(..., description="passed, failed or error")
+    passed: int = Field(0, description="Steps passed")
+    failed: int = Field(0, description="Steps failed")
+    errors: List[str] = Field(default_factory=list, description="Error messages")
+    duration_ms: Optional[float] = Field(None, description="How long the case took")
+
+
+class RecordTestCaseTool(BaseTool):
+    name: str = "record_test_case"
+    description: str = (
+        "Call after finishing each test case to checkpoint its result, "
+        "so an interrupted run does not repeat it."
+    )
+    args_schema: Type[BaseModel] = RecordTestCaseInput
+    checkpointer: Any = Field(..., exclude=True)
+    unit: str = Field(..., description="Execution unit the cases belong to")
+
+    def _run(self, **kwargs) -> str:
+        try:
+            case = TestCaseResult(**kwargs)
+            self.checkpointer.record_case(self.unit, case)
+            return f"✓ Recorded {case.test_id} ({case.status})"
+        except Exception as e:
+            return f"✗ Could not record test case: {str(e)}"
@@ -0,0 +1,470 @@
+"""Command line entry point for running and merging frontend test suites in CI"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+# Environment variable holding the URL for scenarios that don't define one
+DEFAULT_URL_ENV = "WEBSITE"
+
+
+def load_scenarios(paths: List[str], default_url: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Load scenarios from files.
+
+    JSON files contain one scenario object or a list of them, with the keys
+    id, website_url, test_scenario and optionally additional_context and
+    fail_fast. Any other file is read as the text of a single scenario whose
+    id is the file name without extension.
+
+    Raises:
+        ValueError: If a scenario has no URL or ids are not unique
+    """
+    scenarios = []
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        with open(path, encoding="utf-8") as f:
+            if path.endswith(".json"):
+                data = json.load(f)
+                entries = data if isinstance(data, list) else [data]
+                for i, entry in enumerate(entries):
+                    entry = dict(entry)
+                    entry.setdefault("id", stem if len(entries) == 1 else f"{stem}-{i + 1}")
+                    scenarios.append(entry)
+            else:
+                scenarios.append({"id": stem, "test_scenario": f.read()})
+
+    ids = set()
+    for scenario in scenarios:
+        scenario.setdefault("website_url", default_url)
+        if not scenario.get("website_url"):
+            raise ValueError(f"Scenario '{scenario['id']}' has no website_url and no --url was given")
+        if scenario["id"] in ids:
+            raise ValueError(f"Duplicate scenario id '{scenario['id']}'")
+        ids.add(scenario["id"])
+    return scenarios
+
+
+def load_planned_suites(path: str) -> List[Dict[str, Any]]:
+    """
+    Load the suites written by the plan command as scenarios of their own.
+
+    Each suite becomes a scenario with id "<scenario id>-<suite index>" that
+    executes the suite's plan, so shards are dealt suites instead of whole
+    scenarios. A scenario whose planning failed becomes one entry that
+    reports the error.
+    """
+    with open(path, encoding="utf-8") as f:
+        planned = json.load(f)
+    scenarios = []
+    for entry in planned:
+        scenario = {key: value for key, value in entry.items() if key not in ("suites", "error")}
+        if entry.get("error"):
+            scenarios.append({**scenario, "plan_error": entry["error"]})
+        for suite in entry.get("suites") or []:
+            scenarios.append({
+                **scenario,
+                "id": f"{entry['id']}-{suite['index']:02d}",
+                "suite": suite["title"],
+                "test_plan": suite["plan"],
+            })
+    return scenarios
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse an 'i/N' shard specification (1-based)"""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}', expected i/N (e.g. 2/4)")
+    if total < 1 or not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}', i must be between 1 and N")
+    return index, total
+
+
+def select_shard(scenarios: List[Dict[str, Any]], index: int, total: int) -> List[Dict[str, Any]]:
+    """
+    Deterministically pick the scenarios of one shard.
+
+    Scenarios are sorted by id and dealt round-robin, so every node computes
+    the same split regardless of file order and shards differ by at most one.
+    The suites of a planned scenario (see load_planned_suites) are dealt the
+    same way, so one large scenario is spread across shards.
+    """
+    ordered = sorted(scenarios, key=lambda s: s["id"])
+    return [s for i, s in enumerate(ordered) if i % total == index - 1]
+
+
+def run_scenario(scenario: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one scenario in its own working directory.
+
+    Executed in a worker process; returns only picklable data.
+    """
+    from .crew import FrontendTestCrew
+    from .budget import BudgetLimits
+
+    if scenario.get("plan_error"):
+        return {"id": scenario["id"], "status": "failed", "report": None,
+                "error": f"planning failed: {scenario['plan_error']}"}
+
+    scheduler = None
+    if options["rpm"] or options["tpm"]:
+        from .llm_scheduler import LLMScheduler
+
+        # Worker processes can't share a scheduler, so each gets an equal share of the budget
+        share = options["workers"]
+        scheduler = LLMScheduler(
+            requests_per_minute=options["rpm"] / share if options["rpm"] else None,
+            tokens_per_minute=options["tpm"] / share if options["tpm"] else None,
+            max_concurrency=options["llm_concurrency"]
+        )
+
+    work_dir = os.path.abspath(os.path.join(options["work_dir"], scenario["id"]))
+    os.makedirs(work_dir, exist_ok=True)
+    # TEST_PLAN.md, TEST_RESULTS.md and artifacts are written relative to the cwd
+    os.chdir(work_dir)
+
+    crew = FrontendTestCrew(
+        headless=options["headless"],
+        browser=options["browser"],
+        history_path=options["history_path"],
+        crawl_site=options["crawl_site"],
+        site_index_dir=options["site_index_dir"],
+        backend=options["backend"],
+        llm_scheduler=scheduler,
+        role_llms=options["role_llms"],
+        escalate=options["escalate"],
+        visual_baselines_dir=options["baselines"],
+        update_baselines=options["update_baselines"],
+        tracing=options["tracing"],
+        checkpoint_dir="checkpoints" if options["checkpoint"] else None,
+        budget=BudgetLimits(**options["budget"]) if options["budget"] else None
+    )
+    outcome = crew.test_website(
+        website_url=scenario["website_url"],
+        test_scenario=scenario["test_scenario"],
+        additional_context=scenario.get("additional_context"),
+        verbose=options["verbose"],
+        pipelined=options["pipelined"],
+        fail_fast=scenario.get("fail_fast", options["fail_fast"]),
+        browsers=options["browsers"],
+        resume=options["resume"],
+        test_plan=scenario.get("test_plan")
+    )
+    return {
+        "id": scenario["id"],
+        "status": outcome["status"],
+        "report": outcome.get("report"),
+        "error": outcome.get("error"),
+    }
+
+
+def plan_scenario(scenario: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Plan one scenario into suites in its own working directory.
+
+    Executed in a worker process; returns the scenario with its suites, or
+    with the error if planning failed.
+    """
+    from .crew import FrontendTestCrew
+
+    work_dir = os.path.abspath(os.path.join(options["work_dir"], scenario["id"]))
+    os.makedirs(work_dir, exist_ok=True)
+    os.chdir(work_dir)
+
+    crew = FrontendTestCrew(
+        headless=options["headless"],
+        browser=options["browser"],
+        history_path=None,
+        crawl_site=options["crawl_site"],
+        site_index_dir=options["site_index_dir"],
+        backend=options["backend"],
+        role_llms=options["role_llms"]
+    )
+    planned = dict(scenario)
+    try:
+        suites = crew.plan_test_suites(
+            website_url=scenario["website_url"],
+            test_scenario=scenario["test_scenario"],
+            additional_context=scenario.get("additional_context"),
+            verbose=options["verbose"]
+        )
+        planned["suites"] = [suite.model_dump() for suite in suites]
+    except Exception as e:
+        planned.update(suites=[], error=str(e))
+    return planned
+
+
+def collect_report(outcomes: List[Dict[str, Any]]):
+    """Merge scenario reports, turning scenarios without a report into errors"""
+    from .report_builder import merge_reports
+
+    merged = merge_reports([o["report"] for o in outcomes if o.get("report")])
+    missing = [
+        f"Scenario {o['id']} failed: {o.get('error') or 'no report produced'}"
+        for o in outcomes if not o.get("report")
+    ]
+    if missing:
+        merged = merged.model_copy(update={
+            "errors": merged.errors + missing,
+            "error_count": merged.error_count + len(missing),
+            "success": False,
+        })
+    return merged
+
+
+def write_report(report, output: Optional[str]):
+    payload = report.model_dump_json(indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(payload)
+    else:
+        print(payload)
+
+
+def command_run(args: argparse.Namespace) -> int:
+    if args.plans:
+        if args.scenarios:
+            raise ValueError("Pass either scenario files or --plans, not both")
+        if args.pipelined:
+            raise ValueError("--pipelined cannot be combined with --plans")
+        scenarios = load_planned_suites(args.plans)
+    elif args.scenarios:
+        scenarios = load_scenarios(args.scenarios, default_url=args.url or os.getenv(DEFAULT_URL_ENV))
+    else:
+        raise ValueError("No scenario files or --plans given")
+    index, total = args.shard
+    selected = select_shard(scenarios, index, total)
+    print(f"Shard {index}/{total}: {len(selected)} of {len(scenarios)} scenarios "
+          f"({', '.join(s['id'] for s in selected) or 'none'})", file=sys.stderr)
+
+    options = {
+        "work_dir": os.path.abspath(args.work_dir),
+        "headless": not args.headed,
+        "browser": args.browser,
+        "browsers": args.browsers,
+        "backend": args.backend,
+        "pipelined": args.pipelined,
+        "fail_fast": args.fail_fast,
+        "verbose": args.verbose,
+        "history_path": os.path.abspath(args.history) if args.history else None,
+        "crawl_site": args.crawl,
+        "rpm": args.rpm,
+        "tpm": args.tpm,
+        "llm_concurrency": args.llm_concurrency,
+        "role_llms": {
+            role: model for role, model in (
+                ("planner", args.planner_model),
+                ("executor", args.executor_model),
+                ("reporter", args.reporter_model),
+            ) if model
+        },
+        "escalate": not args.no_escalate,
+        "baselines": os.path.abspath(args.baselines) if args.baselines else None,
+        "update_baselines": args.update_baselines,
+        "tracing": args.trace,
+        "checkpoint": args.checkpoint or args.resume,
+        "resume": args.resume,
+        "budget": {
+            key: value for key, value in (
+                ("wall_clock_s", args.max_minutes * 60 if args.max_minutes else None),
+                ("tokens", args.max_tokens),
+                ("tool_calls", args.max_tool_calls),
+            ) if value
+        },
+        "workers": max(1, min(args.workers, len(selected))),
+        "site_index_dir": os.path.abspath(args.site_index) if args.site_index else None,
+    }
+
+    outcomes = []
+    if selected:
+        with ProcessPoolExecutor(max_workers=options["workers"]) as pool:
+            futures = [pool.submit(run_scenario, scenario, options) for scenario in selected]
+            for scenario, future in zip(selected, futures):
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    outcomes.append({"id": scenario["id"], "status": "failed", "report": None, "error": str(e)})
+
+    report = collect_report(outcomes)
+    write_report(report, args.output)
+    # An empty shard has nothing to fail
+    return 0 if report.success or not selected else 1
+
+
+def command_plan(args: argparse.Namespace) -> int:
+    scenarios = load_scenarios(args.scenarios, default_url=args.url or os.getenv(DEFAULT_URL_ENV))
+    options = {
+        "work_dir": os.path.abspath(args.work_dir),
+        "headless": not args.headed,
+        "browser": args.browser,
+        "backend": args.backend,
+        "verbose": args.verbose,
+        "crawl_site": args.crawl,
+        "site_index_dir": os.path.abspath(args.site_index) if args.site_index else None,
+        "role_llms": {"planner": args.planner_model} if args.planner_model else {},
+    }
+
+    planned = []
+    workers = max(1, min(args.workers, len(scenarios)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(plan_scenario, scenario, options) for scenario in scenarios]
+        for scenario, future in zip(scenarios, futures):
+            try:
+                planned.append(future.result())
+            except Exception as e:
+                planned.append({**scenario, "suites": [], "error": str(e)})
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(planned, f, indent=2)
+    for entry in planned:
+        outcome = f"failed: {entry['error']}" if entry.get("error") else f"{len(entry['suites'])} suites"
+        print(f"{entry['id']}: {outcome}", file=sys.stderr)
+    return 1 if any(entry.get("error") for entry in planned) else 0
+
+
+def command_merge(args: argparse.Namespace) -> int:
+    from .report_builder import merge_reports
+
+    reports = []
+    for path in args.reports:
+        with open(path, encoding="utf-8") as f:
+            reports.append(json.load(f))
+    report = merge_reports(reports)
+    write_report(report, args.output)
+    return 0 if report.success else 1
+
+
+def command_baseline(args: argparse.Namespace) -> int:
+    from .visual_regression import VisualBaselines
+
+    baselines = VisualBaselines(args.dir)
+    if args.action == "list":
+        for key in baselines.keys():
+            meta = baselines.load_meta(key)
+            size = f"{meta.width}x{meta.height}" if meta else "unreadable"
+            masks = f", {len(meta.masks)} masked regions" if meta and meta.masks else ""
+            print(f"{key}  {size}{masks}")
+        return 0
+    if args.action == "approve":
+        approved = baselines.approve(args.search, keys=args.names or None)
+        for key in approved:
+            print(f"Approved {key}")
+        missing = set(args.names) - set(approved)
+        if missing:
+            print(f"No failing capture found for: {', '.join(sorted(missing))}", file=sys.stderr)
+        return 1 if missing else 0
+    missing = [key for key in args.names if not baselines.delete(key)]
+    if missing:
+        print(f"No baseline named: {', '.join(missing)}", file=sys.stderr)
+    return 1 if missing else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="frontend-test-crew",
+        description="Run frontend test scenarios with the Frontend Test Crew"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    plan = subparsers.add_parser(
+        "plan", help="Plan scenarios into suites once, so run --plans can split them across shards"
+    )
+    plan.add_argument("scenarios", nargs="+", help="Scenario files (.json, or text files with one scenario each)")
+    plan.add_argument("--output", "-o", required=True, help="Write the planned suites here (JSON)")
+    plan.add_argument("--url", help=f"Website URL for scenarios that don't define one (default: ${DEFAULT_URL_ENV})")
+    plan.add_argument("--workers", type=int, default=1, help="Scenarios planned in parallel processes (default: 1)")
+    plan.add_argument("--work-dir", default="crew_runs", help="Per-scenario working directories (default: crew_runs)")
+    plan.add_argument("--browser", default="chromium", help="Browser: chromium, firefox, webkit (default: chromium)")
+    plan.add_argument("--backend", choices=["mcp", "native"], default="mcp",
+                      help="Browser tools: Playwright MCP server or in-process Playwright (default: mcp)")
+    plan.add_argument("--headed", action="store_true", help="Show the browser window")
+    plan.add_argument("--crawl", action="store_true", help="Crawl the site and give the planner a site map")
+    plan.add_argument("--site-index", default="site_index",
+                      help="Site maps kept between runs for --crawl (default: site_index)")
+    plan.add_argument("--planner-model", help="Model for the planner (default: the configured model)")
+    plan.add_argument("--verbose", action="store_true", help="Verbose agent output")
+    plan.set_defaults(handler=command_plan)
+
+    run = subparsers.add_parser("run", help="Run scenarios, optionally as one shard of a CI matrix")
+    run.add_argument("scenarios", nargs="*", help="Scenario files (.json, or text files with one scenario each)")
+    run.add_argument("--plans", help="Run the suites planned by the plan command instead of scenario files; "
+                                     "--shard then splits suites, not scenarios")
+    run.add_argument("--url", help=f"Website URL for scenarios that don't define one (default: ${DEFAULT_URL_ENV})")
+    run.add_argument("--shard", type=parse_shard, default=(1, 1), help="Run shard i of N, e.g. 2/4 (default: 1/1)")
+    run.add_argument("--workers", type=int, default=1, help="Scenarios run in parallel processes (default: 1)")
+    run.add_argument("--output", "-o", help="Write the merged JSON report here instead of stdout")
+    run.add_argument("--work-dir", default="crew_runs", help="Per-scenario working directories (default: crew_runs)")
+    run.add_argument("--browser", default="chromium", help="Browser: chromium, firefox, webkit (default: chromium)")
+    run.add_argument("--browsers", nargs="+", help="Run a cross-browser matrix on these browsers")
+    run.add_argument("--backend", choices=["mcp", "native"], default="mcp",
+                     help="Browser tools: Playwright MCP server or in-process Playwright (default: mcp)")
+    run.add_argument("--headed", action="store_true", help="Show the browser window")
+    run.add_argument("--pipelined", action="store_true", help="Overlap planning and execution")
+    run.add_argument("--crawl", action="store_true", help="Crawl the site and give the planner a site map")
+    run.add_argument("--site-index", default="site_index",
+                     help="Site maps kept between runs for --crawl, shared by all workers (default: site_index)")
+    run.add_argument("--fail-fast", action="store_true", help="Stop each scenario at its first failing case")
+    run.add_argument("--history", default="test_history.sqlite3",
+                     help="Results history database, shared by all workers (default: test_history.sqlite3)")
+    run.add_argument("--rpm", type=float, help="LLM requests per minute for this shard, split across workers")
+    run.add_argument("--tpm", type=float, help="LLM tokens per minute for this shard, split across workers")
+    run.add_argument("--llm-concurrency", type=int, default=4,
+                     help="LLM calls in flight per worker when --rpm or --tpm is set (default: 4)")
+    run.add_argument("--planner-model", help="Model for the planner (default: the configured model)")
+    run.add_argument("--executor-model", help="Fast model for the executor, e.g. gpt-4o-mini")
+    run.add_argument("--reporter-model", help="Fast model for the reporter")
+    run.add_argument("--no-escalate", action="store_true",
+                     help="Don't retry failed or invalid turns of the role models on the configured model")
+    run.add_argument("--baselines", help="Directory of visual baselines; enables visual assertions")
+    run.add_argument("--update-baselines", action="store_true",
+                     help="Replace the visual baselines with this run's captures")
+    run.add_argument("--trace", action="store_true",
+                     help="Record a Playwright trace per test case and keep those of failed cases")
+    run.add_argument("--checkpoint", action="store_true",
+                     help="Checkpoint each scenario's plan and finished test cases in its work directory")
+    run.add_argument("--resume", action="store_true",
+                     help="Continue interrupted scenarios from their checkpoints (implies --checkpoint)")
+    run.add_argument("--max-minutes", type=float,
+                     help="Wall-clock budget per scenario; test cases not reached are reported as skipped")
+    run.add_argument("--max-tokens", type=int, help="Estimated LLM token budget per scenario")
+    run.add_argument("--max-tool-calls", type=int, help="Tool call budget per scenario")
+    run.add_argument("--verbose", action="store_true", help="Verbose agent output")
+    run.set_defaults(handler=command_run)
+
+    merge = subparsers.add_parser("merge", help="Merge several TestReportModel JSON reports into one")
+    merge.add_argument("reports", nargs="+", help="Report JSON files")
+    merge.add_argument("--output", "-o", help="Write the merged report here instead of stdout")
+    merge.set_defaults(handler=command_merge)
+
+    baseline = subparsers.add_parser("baseline", help="List, approve or delete visual baselines")
+    baseline.add_argument("action", choices=["list", "approve", "delete"],
+                          help="approve promotes failing captures (*.actual.png) to baselines")
+    baseline.add_argument("names", nargs="*", help="Baseline names (default for approve: all failing captures)")
+    baseline.add_argument("--dir", default="visual_baselines", help="Baseline directory (default: visual_baselines)")
+    baseline.add_argument("--search", nargs="+", default=["crew_runs"],
+                          help="Directories searched for failing captures to approve (default: crew_runs)")
+    baseline.set_defaults(handler=command_baseline)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Console entry point"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+"""Deterministic parallel site crawler that builds a site map for the planner"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+# Resource types that don't contribute to page structure
+_BLOCKED_RESOURCES = {"image", "media", "font"}
+
+# Extracts the structure of the current page in one round trip
+_EXTRACT_SCRIPT = """(limits) => {
+    const text = el => (el.innerText || el.value || el.getAttribute('aria-label') || el.title || '')
+        .replace(/\\s+/g, ' ').trim().slice(0, 80);
+    const selector = el => {
+        if (el.id) return '#' + CSS.escape(el.id);
+        for (const attr of ['data-testid', 'data-test', 'name']) {
+            const value = el.getAttribute(attr);
+            if (value) return `${el.tagName.toLowerCase()}[${attr}="${value}"]`;
+        }
+        const label = text(el);
+        return label ? `${el.tagName.toLowerCase()}:has-text("${label.slice(0, 40)}")` : el.tagName.toLowerCase();
+    };
+    const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const labelFor = el => {
+        if (el.labels && el.labels.length) return text(el.labels[0]);
+        return el.getAttribute('aria-label') || el.placeholder || '';
+    };
+
+    const headings = [...document.querySelectorAll('h1, h2, h3')]
+        .filter(visible).slice(0, limits.headings)
+        .map(h => h.tagName.toLowerCase() + ': ' + text(h)).filter(h => !h.endsWith(': '));
+
+    const forms = [...document.forms].slice(0, limits.forms).map(form => ({
+        selector: selector(form),
+        action: form.getAttribute('action') || '',
+        method: (form.getAttribute('method') || 'get').toLowerCase(),
+        fields: [...form.elements].filter(el => el.type !== 'hidden').slice(0, limits.fields).map(el => ({
+            selector: selector(el),
+            tag: el.tagName.toLowerCase(),
+            type: el.type || '',
+            label: labelFor(el),
+            required: !!el.required,
+        })),
+    }));
+
+    const interactive = 'button, [role=button], input[type=submit], input[type=button], select, '
+        + 'input:not([type=hidden]), textarea, [onclick], [role=tab], [role=menuitem]';
+    const elements = [...document.querySelectorAll(interactive)]
+        .filter(el => visible(el) && !el.form)
+        .slice(0, limits.elements)
+        .map(el => ({ selector: selector(el), role: el.getAttribute('role') || el.tagName.toLowerCase(), text: text(el) }));
+
+    const links = [...document.querySelectorAll('a[href]')].map(a => a.href);
+    return { title: document.title, headings, forms, elements, links };
+}"""
+
+
+class FormField(BaseModel):
+    selector: str
+    tag: str
+    type: str = ""
+    label: str = ""
+    required: bool = False
+
+
+class FormSummary(BaseModel):
+    selector: str
+    action: str = ""
+    method: str = "get"
+    fields: List[FormField] = Field(default_factory=list)
+
+
+class PageSummary(BaseModel):
+    """Structure of one crawled route"""
+    url: str
+    depth: int
+    title: str = ""
+    status: Optional[int] = None
+    headings: List[str] = Field(default_factory=list)
+    forms: List[FormSummary] = Field(default_factory=list)
+    elements: List[Dict[str, str]] = Field(default_factory=list)
+    links: List[str] = Field(default_factory=list)
+    error: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = Field(None, description="SHA-1 of the HTML response body")
+    dom_hash: Optional[str] = Field(None, description="SHA-1 of the extracted page structure")
+
+    def fingerprint(self) -> str:
+        """Hash of the rendered structure, independent of HTTP metadata"""
+        structure = self.model_dump(include={"title", "headings", "forms", "elements", "links"})
+        return hashlib.sha1(json.dumps(structure, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class SiteMap(BaseModel):
+    """Result of a crawl, ordered by depth and URL"""
+    root_url: str
+    pages: List[PageSummary] = Field(default_factory=list)
+    truncated: bool = False
+
+    def to_markdown(self, max_chars: int = 12000) -> str:
+        """
+        Compact site-map document for the planner.
+
+        Pages are listed in BFS order; once max_chars is reached the remaining
+        pages are listed by URL only.
+        """
+        lines = [f"# Site map of {self.root_url}", ""]
+        omitted = []
+        for page in self.pages:
+            section = _page_markdown(page)
+            if sum(len(line) + 1 for line in lines) + len(section) > max_chars:
+                omitted.append(page.url)
+                continue
+            lines.append(section)
+        if omitted:
+            lines.append("## Further routes (not detailed)")
+            lines.extend(f"- {url}" for url in omitted)
+        if self.truncated:
+            lines.append("\n(Crawl stopped at its page limit; more routes may exist.)")
+        return "\n".join(lines)
+
+
+def _page_markdown(page: PageSummary) -> str:
+    lines = [f"## {page.url}" + (f" — {page.title}" if page.title else "")]
+    if page.error:
+        lines.append(f"- Error: {page.error}")
+    if page.headings:
+        lines.append("- Headings: " + "; ".join(page.headings))
+    for form in page.forms:
+        fields = ", ".join(
+            f"{f.label or f.type or f.tag} `{f.selector}`" + (" (required)" if f.required else "")
+            for f in form.fields
+        )
+        action = f" {form.action}" if form.action else ""
+        lines.append(f"- Form `{form.selector}` {form.method.upper()}{action}: {fields}")
+    if page.elements:
+        lines.append("- Controls: " + ", ".join(
+            f"{e['text'] or e['role']} `{e['selector']}`" for e in page.elements
+        ))
+    return "\n".join(lines) + "\n"
+
+
+def normalize_url(url: str) -> str:
+    """Drop the fragment and a trailing slash so equivalent routes compare equal"""
+    url = urldefrag(url)[0]
+    parsed = urlparse(url)
+    if parsed.path.endswith("/") and parsed.path != "/":
+        url = url.replace(parsed.path, parsed.path.rstrip("/"), 1)
+    return url
+
+
+class SiteCrawler:
+    """
+    Bounded breadth-first crawl of same-origin links.
+
+    Each BFS level is crawled in parallel across `concurrency` browser
+    contexts, but the frontier is sorted and cut to the page budget before a
+    level starts, so the set of crawled pages does not depend on timing.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 30,
+        max_depth: int = 3,
+        concurrency: int = 4,
+        browser: str = "chromium",
+        headless: bool = True,
+        timeout_ms: int = 15000,
+        limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        Args:
+            max_pages: Maximum number of routes to visit
+            max_depth: Maximum link distance from the start URL
+            concurrency: Browser contexts crawling in parallel
+            browser: Browser type - chromium, firefox, webkit
+            headless: Run the browser in headless mode
+            timeout_ms: Navigation timeout per page
+            limits: Per-page caps on extracted headings, forms, fields and elements
+        """
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.concurrency = max(1, concurrency)
+        self.browser = browser
+        self.headless = headless
+        self.timeout_ms = timeout_ms
+        self.limits = {"headings": 8, "forms": 5, "fields": 12, "elements": 25, **(limits or {})}
+
+    def crawl(self, url: str) -> SiteMap:
+        """Crawl the site starting at url"""
+        return asyncio.run(self.crawl_async(url))
+
+    async def crawl_async(self, url: str) -> SiteMap:
+        root = normalize_url(url)
+        pages, truncated = await self._run(
+            lambda contexts: self._bfs(contexts, [(root, 0)], {root}, self.max_pages)
+        )
+        return SiteMap(root_url=root, pages=pages, truncated=truncated)
+
+    def recrawl(self, routes: List[Tuple[str, int]], known: Set[str]) -> Tuple[List[PageSummary], bool]:
+        """
+        Visit the given (url, depth) routes again and crawl links to routes
+        outside `known`, within what is left of the page budget.
+
+        Returns:
+            Tuple of (visited pages, whether the crawl was truncated)
+        """
+        seen = set(known) | {url for url, _ in routes}
+        budget = len(routes) + max(0, self.max_pages - len(seen))
+        return asyncio.run(self._run(lambda contexts: self._bfs(contexts, list(routes), seen, budget)))
+
+    async def _run(self, crawl: Callable[[List[Any]], Awaitable[T]]) -> T:
+        """Launch the browser with `concurrency` contexts and run a crawl on them"""
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as playwright:
+            browser = await getattr(playwright, self.browser).launch(headless=self.headless)
+            try:
+                contexts = [await self._new_context(browser) for _ in range(self.concurrency)]
+                return await crawl(contexts)
+            finally:
+                await browser.close()
+
+    async def _bfs(
+        self,
+        contexts: List[Any],
+        frontier: List[Tuple[str, int]],
+        seen: Set[str],
+        budget: int
+    ) -> Tuple[List[PageSummary], bool]:
+        """Crawl level by level from the (url, depth) frontier, adding new same-origin links"""
+        origins = {urlparse(url).netloc for url, _ in frontier}
+        pages: List[PageSummary] = []
+        truncated = False
+        while frontier:
+            remaining = budget - len(pages)
+            if remaining <= 0:
+                truncated = True
+                break
+            level = sorted(frontier, key=lambda route: (route[1], route[0]))[:remaining]
+            truncated = truncated or len(frontier) > remaining
+            results = await self._crawl_level(contexts, level)
+            pages.extend(results)
+
+            frontier = []
+            for page in results:
+                for link in page.links:
+                    if urlparse(link).netloc not in origins or link in seen:
+                        continue
+                    if page.depth >= self.max_depth:
+                        truncated = True
+                        continue
+                    seen.add(link)
+                    frontier.append((link, page.depth + 1))
+        return pages, truncated
+
+    async def _new_context(self, browser: Any):
+        context = await browser.new_context()
+
+        async def block(route):
+            if route.request.resource_type in _BLOCKED_RESOURCES:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", block)
+        return context
+
+    async def _crawl_level(self, contexts: List[Any], routes: List[Tuple[str, int]]) -> List[PageSummary]:
+        queue: "asyncio.Queue[Tuple[int, Tuple[str, int]]]" = asyncio.Queue()
+        for item in enumerate(routes):
+            queue.put_nowait(item)
+        results: List[Optional[PageSummary]] = [None] * len(routes)
+
+        async def worker(context):
+            page = await context.new_page()
+            try:
+                while not queue.empty():
+                    index, (url, depth) = queue.get_nowait()
+                    results[index] = await self._visit(page, url, depth)
+            finally:
+                await page.close()
+
+        await asyncio.gather(*(worker(context) for context in contexts[:len(routes)]))
+        return [result for result in results if result is not None]
+
+    async def _visit(self, page: Any, url: str, depth: int) -> PageSummary:
+        try:
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout_ms)
+            data = await page.evaluate(_EXTRACT_SCRIPT, self.limits)
+        except Exception as e:
+            return PageSummary(url=url, depth=depth, error=str(e).splitlines()[0])
+
+        links = sorted({
+            normalize_url(urljoin(url, link)) for link in data.pop("links")
+            if urlparse(link).scheme in ("http", "https")
+        })
+        headers = response.headers if response else {}
+        try:
+            content_hash = hashlib.sha1(await response.body()).hexdigest() if response else None
+        except Exception:
+            # Redirect responses have no body
+            content_hash = None
+        summary = PageSummary(
+            url=url,
+            depth=depth,
+            status=response.status if response else None,
+            links=links,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            content_hash=content_hash,
+            **data
+        )
+        summary.dom_hash = summary.fingerprint()
+        return summary
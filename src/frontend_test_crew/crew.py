@@ -1,18 +1,63 @@
 """Main crew orchestration for frontend testing with Playwright MCP"""
 
-from crewai import Crew, Process, LLM
-from crewai_tools import MCPServerAdapter
-from typing import Optional, Dict, Any
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Iterator, Tuple, Union
 
-from crewai_tools.tools.file_read_tool.file_read_tool import FileReadTool
-from crewai_tools.tools.file_writer_tool.file_writer_tool import FileWriterTool
-from openai.types.beta import FileSearchTool
+from crewai import Crew, Process, LLM
 
 from .agents.test_agents import create_test_planner, create_test_executor, \
     create_test_reporter
 from .tasks.test_tasks import create_planning_task, create_execution_task, \
-    create_report_task
-from .mcp_config import get_playwright_mcp_params
+    create_report_task, create_suite_execution_task, TestReportModel
+from .models import ExecutionResultsModel
+from .tools.output_compaction import OutputCompactor, ReadArtifactTool, compact_tools
+from .tools.warmup import gate_tools, start_mcp_warmup
+from .tools.resource_monitor import child_processes_rss_mb
+from .tools.memoization import ToolCallCache, memoize_tools, mcp_dom_probe
+from .tools.tool_profiles import prepare_agent_tools
+from .tools.tracing import TracingOptions, TraceRecorder, NativeCaseTracer, McpCaseTracer, case_tools, \
+    MCP_TRACING_TOOLS, MCP_START_TRACING, MCP_STOP_TRACING
+from .history import ResultsHistory
+from .report_builder import build_report, parse_execution_results, report_to_dict, \
+    tag_report, merge_reports, attach_traces
+from .crawler import SiteCrawler
+from .site_index import SiteIndex
+from .checkpoint import Checkpointer, RecordTestCaseTool, run_key, suite_unit
+from .budget import BudgetLimits, BudgetExceeded, RunBudget, budget_tools, skipped_results
+from .pipeline import SuitePipeline, SuiteCollector, PlannedSuite, SuiteResult, PublishTestSuiteTool, \
+    format_suite_result
+
+# Playwright MCP tool that tears down the browser
+MCP_CLOSE_TOOL = "browser_close"
+
+# Structured final answers each role must produce; used to validate fast-tier output
+ROLE_OUTPUT_MODELS = {"executor": ExecutionResultsModel, "reporter": TestReportModel}
+
+# Browser tool backends: Playwright MCP server over stdio, or in-process Playwright
+BACKENDS = ("mcp", "native")
+
+
+def _file_tools(write: bool = True) -> List[Any]:
+    """
+    File tools for the agents.
+
+    crewai_tools loads every bundled tool on import, so it is imported on
+    first use rather than when this module is imported.
+    """
+    from crewai_tools.tools.file_read_tool.file_read_tool import FileReadTool
+    from crewai_tools.tools.file_writer_tool.file_writer_tool import FileWriterTool
+
+    return [FileWriterTool(), FileReadTool()] if write else [FileReadTool()]
+
+
+def _join_hints(*hints: Optional[str]) -> Optional[str]:
+    joined = "\n".join(hint for hint in hints if hint)
+    return joined or None
 
 
 class FrontendTestCrew:
@@ -21,13 +66,42 @@ class FrontendTestCrew:
 
     The crew consists of:
     1. Test Planner: Explores websites and creates detailed test plans
-    2. Test Executor: Executes tests using Playwright MCP and reports results
-    3. Test Reporter: Generates comprehensive test reports
+    2. Test Executor: Executes tests using Playwright MCP and reports typed per-case results
+    3. Test Reporter: Generates comprehensive test reports (only when
+       deterministic_report is disabled; otherwise the report is aggregated
+       directly from the executor's results)
 
-    Both agents connect to the Playwright MCP server via stdio for browser automation.
+    Both agents drive the browser through the Playwright MCP server via stdio, or
+    through in-process Playwright tools with the native backend.
     """
 
-    def __init__(self, llm: Optional[LLM] = None, headless: bool = True, browser: str = "chromium"):
+    def __init__(
+        self,
+        llm: Optional[LLM] = None,
+        headless: bool = True,
+        browser: str = "chromium",
+        output_token_budget: Optional[int] = 2000,
+        history_path: Optional[str] = "test_history.sqlite3",
+        deterministic_report: bool = True,
+        warm_up: bool = True,
+        memoize_reads: bool = True,
+        crawl_site: bool = False,
+        crawl_options: Optional[Dict[str, Any]] = None,
+        site_index_dir: Optional[str] = "site_index",
+        backend: str = "mcp",
+        tool_profiles: bool = True,
+        minify_tools: bool = True,
+        llm_scheduler: Optional[Any] = None,
+        role_llms: Optional[Dict[str, Any]] = None,
+        escalate: bool = True,
+        visual_baselines_dir: Optional[str] = None,
+        update_baselines: bool = False,
+        visual_options: Optional[Dict[str, Any]] = None,
+        tracing: Union[bool, TracingOptions] = False,
+        checkpoint_dir: Optional[str] = None,
+        budget: Optional[BudgetLimits] = None,
+        task_budgets: Optional[Dict[str, BudgetLimits]] = None
+    ):
         """
         Initialize the Frontend Test Crew.
 
@@ -36,93 +110,1052 @@ class FrontendTestCrew:
                  agents will use the default LLM from environment.
             headless: Run browser in headless mode (default: True)
             browser: Browser type - chromium, firefox, webkit (default: chromium)
+            output_token_budget: Per-call token budget for browser tool outputs.
+                 Larger outputs are compacted and stored as artifacts the agents
+                 can read on demand. None disables compaction (default: 2000)
+            history_path: SQLite file where every report is recorded and from
+                 which execution order, flaky-case quarantine and fail-fast
+                 hints are derived. None disables the history store
+            deterministic_report: Build the TestReportModel from the executor's
+                 typed results instead of running the LLM reporter (default: True)
+            warm_up: Launch each browser and pre-navigate to the website on a
+                 background thread as soon as its session starts, so browser
+                 startup overlaps the first LLM call (default: True)
+            memoize_reads: Serve repeated identical read-only browser calls
+                 (snapshots, evaluations) from a cache that is invalidated by
+                 mutating tools and DOM changes (default: True)
+            crawl_site: Crawl same-origin routes in parallel before planning and
+                 give the planner the resulting site map (default: False)
+            crawl_options: Keyword arguments for the SiteCrawler, e.g.
+                 max_pages, max_depth or concurrency
+            site_index_dir: Directory where site maps are persisted between
+                 runs; later crawls only revalidate them and re-crawl changed
+                 routes. None crawls from scratch every run
+            backend: Browser tool backend. "mcp" drives the browser through the
+                 Playwright MCP server (Node, stdio); "native" uses the in-process
+                 Playwright tools, without the extra process (default: "mcp")
+            tool_profiles: Give the planner a read-mostly explorer tool set and the
+                 executor an action set instead of every browser tool (default: True)
+            minify_tools: Shorten tool descriptions and drop rarely used optional
+                 parameters from tool schemas (default: True)
+            llm_scheduler: LLMScheduler shared with other crews in this process;
+                 every agent's LLM calls then go through its rate limits,
+                 concurrency cap and coordinated 429 backoff, with executor
+                 turns served before planner turns
+            role_llms: Per-role models (LLM instances or model names) for
+                 "planner", "executor" and "reporter"; roles not listed use llm
+            escalate: Repeat a turn of a role with its own model on llm (the
+                 strong model) when it fails or its output doesn't validate
+                 (default: True)
+            visual_baselines_dir: Directory of baseline screenshots; gives the
+                 executor the assert_visual_match tool, which compares pages with
+                 their baselines. None (default) disables visual assertions
+            update_baselines: Replace baselines with the captures of this run
+            visual_options: Keyword arguments for VisualBaselines, e.g.
+                 threshold, tolerance or diff_dir
+            tracing: Record a Playwright trace per test case (True, or
+                 TracingOptions for what is recorded and where). Traces of
+                 passing cases are discarded; failed cases link theirs in the
+                 report summary as trace_path (default: False)
+            checkpoint_dir: Directory for run checkpoints. The plan, every
+                 finished execution task and every test case the executor
+                 records are saved there, so test_website(resume=True) can
+                 continue an interrupted run. None (default) disables it
+            budget: Wall-clock, token and tool-call limits of each test_website
+                 run. When one runs out the agents are told to give their final
+                 answer, remaining test cases are reported as skipped, and agents
+                 that keep going are stopped; the report is built from the
+                 results so far and includes the budget usage
+            task_budgets: Limits per role ("planner", "executor", "reporter"),
+                 shared by all tasks of that role in a run
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of: {', '.join(BACKENDS)}")
         self.llm = llm
+        self.backend = backend
         self.headless = headless
         self.browser = browser
+        self.output_token_budget = output_token_budget
+        self.history = ResultsHistory(history_path) if history_path else None
+        self.deterministic_report = deterministic_report
+        self.warm_up = warm_up
+        self.memoize_reads = memoize_reads
+        self.crawl_site = crawl_site
+        self.crawl_options = crawl_options or {}
+        self.site_index = SiteIndex(site_index_dir) if site_index_dir else None
+        self.tool_profiles = tool_profiles
+        self.minify_tools = minify_tools
+        self._tool_prompt: Dict[str, Dict[str, Any]] = {}
+        self.llm_scheduler = llm_scheduler
+        self.role_llms = role_llms or {}
+        self.escalate = escalate
+        self._tiered_llms: List[Tuple[str, Any]] = []
+        self.checkpoint_dir = checkpoint_dir
+        self.budget = budget
+        self.task_budgets = task_budgets or {}
+        self._budget: Optional[RunBudget] = None
+        self.trace_recorder = None
+        if tracing:
+            self.trace_recorder = TraceRecorder(tracing if isinstance(tracing, TracingOptions) else None)
+        self.visual_baselines = None
+        if visual_baselines_dir:
+            from .visual_regression import VisualBaselines
+
+            self.visual_baselines = VisualBaselines(
+                visual_baselines_dir, update=update_baselines, **(visual_options or {})
+            )
+        self._peak_browser_rss_mb: Optional[float] = None
+        self._tool_caches: List[ToolCallCache] = []
+        self._native_resources: List[Dict[str, Any]] = []
+
+    def _compact_browser_tools(self, tools: List[Any]) -> List[Any]:
+        """Apply the output token budget to browser tools"""
+        if self.output_token_budget is None:
+            return list(tools)
+        compactor = OutputCompactor(token_budget=self.output_token_budget)
+        return compact_tools(list(tools), compactor) + [ReadArtifactTool(store=compactor.store)]
+
+    @contextmanager
+    def _browser_tools(
+        self,
+        browser: str,
+        isolated: bool = False,
+        warm_up_url: Optional[str] = None,
+        tracers: Optional[List[Any]] = None
+    ) -> Iterator[List[Any]]:
+        """
+        Start a browser session for the given browser and yield its tools.
+
+        With the MCP backend a Playwright MCP server is started; pass
+        isolated=True when several sessions run at the same time, so they
+        don't compete for the same persistent browser profile. The native
+        backend gives every session its own in-process browser. With warm-up
+        enabled the browser is launched and pointed at warm_up_url in the
+        background; tool calls wait for it only if it is still in progress.
+        With tracing on, the session's case tracer is appended to `tracers`,
+        so a caller running several suites can scope traces to each of them.
+        """
+        open_session = self._native_session if self.backend == "native" else self._mcp_session
+        with open_session(browser, isolated, warm_up_url, tracers) as tools:
+            try:
+                yield self._compact_browser_tools(tools)
+            finally:
+                # Sample while the browser is still running
+                self._sample_browser_rss()
+
+    @contextmanager
+    def _mcp_session(
+        self,
+        browser: str,
+        isolated: bool,
+        warm_up_url: Optional[str],
+        tracers: Optional[List[Any]] = None
+    ) -> Iterator[List[Any]]:
+        from crewai_tools import MCPServerAdapter
+        from .mcp_config import get_playwright_mcp_params
+
+        server_params = get_playwright_mcp_params(
+            headless=self.headless,
+            browser=browser,
+            isolated=isolated,
+            caps=["tracing"] if self.trace_recorder else None,
+            output_dir=self._trace_dir(browser) if self.trace_recorder else None
+        )
+        # Use context manager to automatically manage MCP server lifecycle
+        with MCPServerAdapter(server_params) as mcp_tools:
+            # The browser is closed when the server shuts down; letting agents close it
+            # mid-run only forces a relaunch on the next step
+            tools = [tool for tool in mcp_tools if tool.name != MCP_CLOSE_TOOL]
+            tools += self._visual_tools(browser)
+            warmup = start_mcp_warmup(tools, warm_up_url) if self.warm_up else None
+            if self.memoize_reads:
+                tools = self._memoize(tools, mcp_dom_probe(tools))
+            if warmup is not None:
+                tools = gate_tools(tools, warmup)
+            tracer = None
+            if self.trace_recorder is not None:
+                # The tracing tools are driven per test case by the case tools, not by agents
+                by_name = {tool.name: tool for tool in tools}
+                tools = [tool for tool in tools if tool.name not in MCP_TRACING_TOOLS]
+                if MCP_TRACING_TOOLS <= by_name.keys():
+                    tracer = McpCaseTracer(
+                        self.trace_recorder, browser, by_name[MCP_START_TRACING], by_name[MCP_STOP_TRACING]
+                    )
+                    tools += case_tools(tracer)
+                    if tracers is not None:
+                        tracers.append(tracer)
+            try:
+                yield tools
+            finally:
+                if tracer is not None:
+                    tracer.close()
+
+    @contextmanager
+    def _native_session(
+        self,
+        browser: str,
+        isolated: bool,
+        warm_up_url: Optional[str],
+        tracers: Optional[List[Any]] = None
+    ) -> Iterator[List[Any]]:
+        from .tools.playwright_tools import BrowserManager, native_tools
+
+        # Each session owns its browser, so sessions are always isolated
+        manager = BrowserManager(
+            browser=browser,
+            headless=self.headless,
+            tracing=self.trace_recorder.options if self.trace_recorder else None
+        )
+        if self.warm_up:
+            # Tool actions queue behind the warm-up on the browser thread
+            manager.warm_up(warm_up_url)
+        tools = native_tools(manager) + self._visual_tools(browser, manager)
+        if self.memoize_reads:
+            tools = self._memoize(tools, manager.dom_version)
+        tracer = None
+        if self.trace_recorder is not None:
+            tracer = NativeCaseTracer(self.trace_recorder, browser, manager)
+            tools += case_tools(tracer)
+            if tracers is not None:
+                tracers.append(tracer)
+        try:
+            yield tools
+        finally:
+            if tracer is not None:
+                tracer.close()
+            try:
+                self._native_resources.append(manager.resource_metrics())
+            except Exception:
+                pass
+            manager.shutdown()
+
+    def _trace_dir(self, browser: str) -> str:
+        return os.path.abspath(os.path.join(self.trace_recorder.options.output_dir, browser))
+
+    def _visual_tools(self, browser: str, manager: Optional[Any] = None) -> List[Any]:
+        """The visual assertion tool for a session; baselines are kept per browser"""
+        if self.visual_baselines is None:
+            return []
+        from .tools.visual_assert import VisualAssertTool
+
+        return [VisualAssertTool(baselines=self.visual_baselines, browser_manager=manager, variant=browser)]
+
+    def _llm(self, role: str) -> Optional[Any]:
+        """
+        The LLM for a new agent of the given role.
+
+        Applies the role's model, escalation to the strong model, the
+        scheduler and the run's budget. Every agent gets its own tiered LLM,
+        since escalation state belongs to one conversation.
+        """
+        configured = self.role_llms.get(role)
+        if configured is None:
+            if self.llm_scheduler is None and self._budget is None:
+                return self.llm
+            llm = self._role_llm(role, self.llm)
+        elif not self.escalate:
+            llm = self._role_llm(role, configured)
+        else:
+            from .model_tiers import TieredLLM, react_step_validator
+
+            llm = TieredLLM(self._role_llm(role, configured), self._role_llm(role, self.llm),
+                            validator=react_step_validator(ROLE_OUTPUT_MODELS.get(role)))
+            self._tiered_llms.append((role, llm))
+        if self._budget is not None:
+            from .budget import BudgetedLLM
+
+            llm = BudgetedLLM(llm, self._budget, role)
+        return llm
+
+    def _role_llm(self, role: str, llm: Any) -> Any:
+        """Resolve a model name or the environment default and route it through the scheduler"""
+        from crewai.utilities.llm_utils import create_llm
+
+        llm = create_llm(llm)
+        if self.llm_scheduler is not None:
+            from .llm_scheduler import ScheduledLLM
+
+            llm = ScheduledLLM(llm, self.llm_scheduler, role)
+        return llm
+
+    def _agent_tools(self, role: str, tools: List[Any]) -> List[Any]:
+        """
+        Apply the role's tool profile and schema minification, recording the
+        prompt savings, and charge the tools' calls to the run's budget
+        """
+        selected, report = prepare_agent_tools(
+            role, tools, use_profile=self.tool_profiles, minify=self.minify_tools
+        )
+        self._tool_prompt[role] = report
+        if self._budget is not None:
+            selected = budget_tools(selected, self._budget, role)
+        return selected
+
+    def _memoize(self, tools: List[Any], probe: Any) -> List[Any]:
+        cache = ToolCallCache(probe=probe)
+        self._tool_caches.append(cache)
+        return memoize_tools(tools, cache)
+
+    def _sample_browser_rss(self):
+        rss_mb = child_processes_rss_mb()
+        if rss_mb is not None:
+            self._peak_browser_rss_mb = max(self._peak_browser_rss_mb or 0, rss_mb)
+
+    def _browser_resources(self) -> Optional[Dict[str, Any]]:
+        """
+        Browser resource usage of the run.
+
+        Includes the resource monitor of every native browser session (heap,
+        DOM, RSS, context recycles) and the peak RSS of all browser processes
+        (and MCP servers) started by this process.
+        """
+        resources: Dict[str, Any] = {}
+        if self._native_resources:
+            resources["native_sessions"] = list(self._native_resources)
+        if self._peak_browser_rss_mb is not None:
+            resources["peak_rss_mb"] = self._peak_browser_rss_mb
+        return resources or None
 
     def test_website(
         self,
         website_url: str,
         test_scenario: str,
         verbose: bool = False,
-        additional_context: Optional[str] = None
+        additional_context: Optional[str] = None,
+        pipelined: bool = False,
+        executor_workers: int = 1,
+        fail_fast: bool = False,
+        browsers: Optional[List[str]] = None,
+        resume: bool = False,
+        test_plan: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Execute a complete testing workflow for a website.
 
-        This method uses a context manager to automatically start and stop
-        the Playwright MCP server connection.
+        Browser sessions (Playwright MCP servers or native browsers) are
+        started and stopped automatically around the tasks that use them.
 
         Args:
             website_url: URL of the website to test
             test_scenario: Description of what needs to be tested
             additional_context: Optional additional context or requirements
+            pipelined: Start executing each test suite as soon as the planner
+                publishes it instead of waiting for the whole plan
+            executor_workers: Number of concurrent suite executors in pipelined
+                mode, each with its own browser (default: 1)
+            fail_fast: Stop execution at the first failing test case
+            browsers: Run a cross-browser matrix: plan once, then execute the
+                plan concurrently on each listed browser (e.g. ["chromium",
+                "firefox", "webkit"]), each with its own MCP server. The
+                per-browser reports are merged with a browser dimension
+            resume: Continue from the checkpoint of an interrupted run with the
+                same inputs: the saved plan is reused and finished executions
+                and recorded test cases are not run again. Needs checkpoint_dir
+            test_plan: Execute this plan (e.g. one suite from plan_test_suites)
+                instead of planning; not available in pipelined mode
 
         Returns:
-            Dictionary containing test results and reports
+            Dictionary containing test results and reports. "report" holds the
+            TestReportModel as a dict (with the budget usage, if the crew has
+            a budget), "browser_resources" the memory and DOM metrics of the
+            browsers used and "tool_cache" the hit counts of memoized browser
+            reads
         """
-        # Configure Playwright MCP server parameters
-        server_params = get_playwright_mcp_params(
-            headless=self.headless,
-            browser=self.browser
-        )
+        started_at = time.time()
+        self._peak_browser_rss_mb = None
+        self._tool_caches = []
+        self._native_resources = []
+        self._tool_prompt = {}
+        self._tiered_llms = []
+        self._budget = None
+        if self.budget is not None or self.task_budgets:
+            self._budget = RunBudget(self.budget, self.task_budgets)
+        if self.trace_recorder is not None:
+            self.trace_recorder.reset()
+        crawl_info: Dict[str, Any] = {}
+        execution_hints = ResultsHistory.FAIL_FAST_HINT if fail_fast else None
+        history_error = None
+        if self.history:
+            try:
+                execution_hints = self.history.execution_hints(website_url, test_scenario, fail_fast=fail_fast)
+            except sqlite3.Error as e:
+                # History is an optimization; run without its hints rather than fail
+                history_error = str(e)
 
+        checkpointer = None
         try:
-            # Use context manager to automatically manage MCP server lifecycle
-            with MCPServerAdapter(server_params) as tools:
-                file_tools = [FileWriterTool(), FileReadTool()]
-                # Create agents with tools from MCP server
-                test_planner = create_test_planner(llm=self.llm, tools=tools + file_tools, verbose=verbose)
-                test_executor = create_test_executor(llm=self.llm, tools=tools + file_tools, verbose=verbose)
-                test_reporter = create_test_reporter(llm=self.llm, tools=file_tools, verbose=verbose)
-
-                # Create tasks
-                planning_task = create_planning_task(
-                    agent=test_planner,
-                    website_url=website_url,
-                    test_scenario=test_scenario,
-                    additional_context=additional_context
-                )
+            if browsers and pipelined:
+                raise ValueError("Cross-browser matrix and pipelined mode cannot be combined")
+            if test_plan is not None and pipelined:
+                raise ValueError("A given test_plan cannot be executed in pipelined mode")
+            if resume and not self.checkpoint_dir:
+                raise ValueError("resume needs a checkpoint_dir")
 
-                execution_task = create_execution_task(
-                    agent=test_executor
+            if self.checkpoint_dir:
+                key = run_key(
+                    website_url, test_scenario,
+                    additional_context=additional_context,
+                    pipelined=pipelined,
+                    browsers=browsers or [self.browser],
+                    test_plan=test_plan
                 )
-
-                # Execution task depends on planning task output
-                execution_task.context = [planning_task]
-
-                report_task = create_report_task(
-                    agent=test_reporter,
+                checkpointer = Checkpointer.open(
+                    self.checkpoint_dir, key, website_url, test_scenario, resume=resume
                 )
+                resume_info = checkpointer.progress()
 
-                report_task.context = [execution_task]
+            plan = test_plan
+            if plan is None and checkpointer is not None:
+                plan = checkpointer.checkpoint.plan
+            # A run with a given or saved plan doesn't plan again, so it needs no site map
+            planned = plan is not None or (checkpointer is not None and checkpointer.checkpoint.planning_done)
+            site_map = self._site_map(website_url, crawl_info) if self.crawl_site and not planned else None
 
-                # Create and configure crew
-                crew = Crew(
-                    agents=[test_planner, test_executor, test_reporter],
-                    tasks=[planning_task, execution_task, report_task],
-                    process=Process.sequential,
-                    verbose=verbose,
+            browser_results = None
+            if browsers:
+                result, report, browser_results = self._run_matrix(
+                    website_url, test_scenario, additional_context, verbose, browsers, execution_hints,
+                    site_map, checkpointer, plan
+                )
+                suite_results = None
+            elif pipelined:
+                result, report, suite_results = self._run_pipelined(
+                    website_url, test_scenario, additional_context, verbose, executor_workers,
+                    execution_hints, site_map, checkpointer
                 )
+            else:
+                result, report = self._run_sequential(
+                    website_url, test_scenario, additional_context, verbose, execution_hints, site_map,
+                    checkpointer, plan
+                )
+                suite_results = None
 
-                # Execute the crew
-                result = crew.kickoff()
+            if self.trace_recorder is not None:
+                report = attach_traces(report, self.trace_recorder.traces)
+            outcome = {
+                "status": "completed",
+                "result": result,
+                "report": report_to_dict(report),
+                "website_url": website_url,
+                "test_scenario": test_scenario
+            }
+            if self._budget is not None and outcome["report"] is not None:
+                outcome["report"]["budget"] = self._budget.usage()
+            if suite_results is not None:
+                outcome["suite_results"] = [r.model_dump() for r in suite_results]
+            if browser_results is not None:
+                outcome["browser_results"] = browser_results
+            resources = self._browser_resources()
+            if resources:
+                outcome["browser_resources"] = resources
+            if crawl_info:
+                outcome["site_map"] = crawl_info
+            if checkpointer is not None:
+                outcome["checkpoint"] = resume_info
+                # The run produced its report; a later resume has nothing to continue
+                checkpointer.clear()
+            if self.trace_recorder is not None:
+                outcome["traces"] = self.trace_recorder.paths()
+            if self._tool_prompt:
+                outcome["tool_prompt"] = dict(self._tool_prompt)
+            if self._tiered_llms:
+                from .model_tiers import merge_tier_reports
 
-                return {
-                    "status": "completed",
-                    "result": result,
-                    "website_url": website_url,
-                    "test_scenario": test_scenario
+                outcome["llm_tiers"] = {
+                    role: merge_tier_reports([llm.report() for r, llm in self._tiered_llms if r == role])
+                    for role in dict.fromkeys(r for r, _ in self._tiered_llms)
+                }
+            if self.llm_scheduler is not None:
+                outcome["llm_scheduler"] = self.llm_scheduler.snapshot()
+            if self._tool_caches:
+                outcome["tool_cache"] = {
+                    key: sum(cache.stats()[key] for cache in self._tool_caches)
+                    for key in ("hits", "misses", "invalidations")
                 }
 
         except Exception as e:
-            return {
+            outcome = {
                 "status": "failed",
                 "error": str(e),
                 "website_url": website_url,
                 "test_scenario": test_scenario
             }
+            if checkpointer is not None:
+                # Progress so far is saved; test_website(..., resume=True) continues from it
+                outcome["resumable"] = True
+            if self._budget is not None:
+                outcome["budget"] = self._budget.usage()
+
+        if self.trace_recorder is not None:
+            # Every session has ended, so no trace can still need a pruned resource
+            self.trace_recorder.prune_resources()
+        if history_error:
+            outcome["history_error"] = history_error
+        self._record_history(outcome, started_at, ",".join(browsers) if browsers else self.browser)
+        return outcome
+
+    def plan_test_suites(
+        self,
+        website_url: str,
+        test_scenario: str,
+        additional_context: Optional[str] = None,
+        verbose: bool = False
+    ) -> List[PlannedSuite]:
+        """
+        Plan a scenario into test suites without executing them.
+
+        Each suite can then run on its own, e.g. on different CI shards, with
+        test_website(..., test_plan=suite.plan). A planner that publishes no
+        suites yields its whole plan as a single suite.
+        """
+        self._tool_prompt = {}
+        self._tiered_llms = []
+        self._budget = None
+        site_map = self._site_map(website_url, {}) if self.crawl_site else None
+        collector = SuiteCollector()
+        plan = self._plan_and_publish(collector, website_url, test_scenario, additional_context, verbose, site_map)
+        if collector.published == 0:
+            collector.publish("Test plan", str(plan))
+        return list(collector.suites)
+
+    def _site_map(self, website_url: str, info: Dict[str, Any]) -> Optional[str]:
+        """
+        Crawl the website and return the site map document for the planner.
+
+        Crawl statistics (or the error) are written to info. A failed crawl
+        is not fatal: the planner then explores the site itself.
+        """
+        started = time.monotonic()
+        crawler = SiteCrawler(**{"browser": self.browser, "headless": self.headless, **self.crawl_options})
+        try:
+            if self.site_index:
+                site_map, stats = self.site_index.refresh(website_url, crawler)
+                info["routes"] = stats
+            else:
+                site_map = crawler.crawl(website_url)
+        except Exception as e:
+            info["error"] = str(e)
+            return None
+        info.update(
+            pages=len(site_map.pages),
+            truncated=site_map.truncated,
+            duration_s=round(time.monotonic() - started, 2)
+        )
+        return site_map.to_markdown()
+
+    def _record_history(self, outcome: Dict[str, Any], started_at: float, browser: str):
+        """Feed the run and its report summary into the results history"""
+        if not self.history:
+            return
+        try:
+            self.history.record_run(
+                outcome.get("report"),
+                website_url=outcome["website_url"],
+                test_scenario=outcome["test_scenario"],
+                status=outcome["status"],
+                started_at=started_at,
+                duration_s=round(time.time() - started_at, 2),
+                browser=browser,
+                metadata={"error": outcome.get("error")} if outcome.get("error") else None
+            )
+        except sqlite3.Error as e:
+            # History is an optimization; never fail a run because it could not be stored
+            outcome["history_error"] = str(e)
+
+    def _run_sequential(
+        self,
+        website_url: str,
+        test_scenario: str,
+        additional_context: Optional[str],
+        verbose: bool,
+        execution_hints: Optional[str] = None,
+        site_map: Optional[str] = None,
+        checkpointer: Optional[Checkpointer] = None,
+        plan: Optional[str] = None
+    ) -> Tuple[Any, Any]:
+        """
+        Plan, execute and report as sequential tasks on one browser.
+
+        With a plan (given, or saved by an interrupted run) planning is
+        skipped and only execution (and reporting) remain.
+        """
+        if plan is not None:
+            if checkpointer is not None and not checkpointer.checkpoint.planning_done:
+                checkpointer.record_plan(plan)
+            return self._execute_plan(
+                self.browser, website_url, plan, verbose, execution_hints,
+                checkpointer=checkpointer, isolated=False, results_file="TEST_RESULTS.md"
+            )
+
+        unit = self.browser
+        with self._browser_tools(self.browser, warm_up_url=website_url) as tools:
+            file_tools = _file_tools()
+            # Create agents with their tool profiles
+            executor_tools = self._agent_tools("executor", tools + file_tools) + self._record_tools(checkpointer, unit)
+            test_planner = create_test_planner(
+                llm=self._llm("planner"), tools=self._agent_tools("planner", tools + file_tools), verbose=verbose
+            )
+            test_executor = create_test_executor(llm=self._llm("executor"), tools=executor_tools, verbose=verbose)
+
+            # Create tasks
+            planning_task = create_planning_task(
+                agent=test_planner,
+                website_url=website_url,
+                test_scenario=test_scenario,
+                additional_context=additional_context,
+                site_map=site_map
+            )
+            if checkpointer is not None:
+                planning_task.callback = lambda output: checkpointer.record_plan(str(output))
+
+            execution_task = create_execution_task(
+                agent=test_executor,
+                execution_hints=execution_hints
+            )
+            self._checkpoint_execution(execution_task, checkpointer, unit)
+
+            # Execution task depends on planning task output
+            execution_task.context = [planning_task]
+
+            agents = [test_planner, test_executor]
+            tasks = [planning_task, execution_task]
+            if not self.deterministic_report:
+                test_reporter = create_test_reporter(llm=self._llm("reporter"), tools=file_tools, verbose=verbose)
+                report_task = create_report_task(
+                    agent=test_reporter,
+                )
+                report_task.context = [execution_task]
+                agents.append(test_reporter)
+                tasks.append(report_task)
+
+            # Create and configure crew
+            crew = Crew(
+                agents=agents,
+                tasks=tasks,
+                process=Process.sequential,
+                verbose=verbose,
+            )
+
+            # Execute the crew
+            try:
+                result = crew.kickoff()
+            except BudgetExceeded as e:
+                report = build_report(self._budget_stopped(e, execution_task.output, checkpointer, unit))
+                return report, report
+
+        if self.deterministic_report:
+            return result, self._execution_report(execution_task.output, checkpointer, unit)
+        return result, result.json_dict
+
+    def _execute_plan(
+        self,
+        browser: str,
+        website_url: str,
+        plan: str,
+        verbose: bool,
+        execution_hints: Optional[str] = None,
+        checkpointer: Optional[Checkpointer] = None,
+        isolated: bool = True,
+        results_file: Optional[str] = None
+    ) -> Tuple[Any, Any]:
+        """
+        Execute an existing plan on the given browser and report the results.
+
+        With a checkpoint, an execution that already finished is not run
+        again and test cases recorded earlier are skipped.
+        """
+        unit = browser
+        finished = checkpointer.execution(unit) if checkpointer is not None else None
+        if finished is not None and self.deterministic_report:
+            return finished, build_report(finished)
+
+        results_file = results_file or f"TEST_RESULTS_{browser}.md"
+        with self._browser_tools(browser, isolated=isolated, warm_up_url=website_url) as tools:
+            file_tools = _file_tools()
+            agents = []
+            tasks = []
+            execution_task = None
+            if finished is None:
+                executor_tools = self._agent_tools("executor", tools + file_tools) + \
+                    self._record_tools(checkpointer, unit)
+                test_executor = create_test_executor(
+                    llm=self._llm("executor"), tools=executor_tools, verbose=verbose
+                )
+                execution_task = create_execution_task(
+                    agent=test_executor,
+                    test_plan_context=plan,
+                    execution_hints=_join_hints(
+                        execution_hints, checkpointer.resume_hint(unit) if checkpointer else None
+                    ),
+                    results_file=results_file
+                )
+                self._checkpoint_execution(execution_task, checkpointer, unit)
+                agents.append(test_executor)
+                tasks.append(execution_task)
+
+            if not self.deterministic_report:
+                test_reporter = create_test_reporter(llm=self._llm("reporter"), tools=file_tools, verbose=verbose)
+                context = f"(detailed results are in {results_file})"
+                if finished is not None:
+                    earlier = finished.test_cases
+                else:
+                    earlier = checkpointer.completed_cases(unit) if checkpointer is not None else []
+                if earlier:
+                    context += (
+                        "\nResults of test cases completed before the run was resumed "
+                        "(include them in the report):\n"
+                        + json.dumps([case.model_dump() for case in earlier], indent=2)
+                    )
+                report_task = create_report_task(agent=test_reporter, test_execution_context=context)
+                if execution_task is not None:
+                    report_task.context = [execution_task]
+                agents.append(test_reporter)
+                tasks.append(report_task)
+
+            try:
+                result = Crew(
+                    agents=agents,
+                    tasks=tasks,
+                    process=Process.sequential,
+                    verbose=verbose,
+                ).kickoff()
+            except BudgetExceeded as e:
+                output = execution_task.output if execution_task is not None else finished
+                report = build_report(self._budget_stopped(e, output, checkpointer, unit))
+                return report, report
+
+        if self.deterministic_report:
+            return result, self._execution_report(execution_task.output, checkpointer, unit)
+        return result, TestReportModel.model_validate(result.json_dict)
+
+    def _record_tools(self, checkpointer: Optional[Checkpointer], unit: str) -> List[Any]:
+        """The executor's tool for checkpointing each finished test case"""
+        if checkpointer is None:
+            return []
+        return [RecordTestCaseTool(checkpointer=checkpointer, unit=unit)]
+
+    @staticmethod
+    def _checkpoint_execution(task: Any, checkpointer: Optional[Checkpointer], unit: str):
+        """Save the task's results, merged with earlier attempts, as soon as it finishes"""
+        if checkpointer is None:
+            return
+
+        def save(output: Any):
+            try:
+                checkpointer.record_execution(unit, checkpointer.merge(unit, parse_execution_results(output)))
+            except ValueError:
+                # Unstructured output; the cases recorded one by one are still checkpointed
+                pass
+
+        task.callback = save
+
+    @staticmethod
+    def _execution_results(output: Any, checkpointer: Optional[Checkpointer], unit: str) -> ExecutionResultsModel:
+        results = parse_execution_results(output)
+        return checkpointer.merge(unit, results) if checkpointer is not None else results
+
+    @classmethod
+    def _execution_report(cls, output: Any, checkpointer: Optional[Checkpointer], unit: str) -> TestReportModel:
+        """
+        Report of an execution task. Output without structured results is a
+        run error; the cases checkpointed by the executor are still reported.
+        """
+        try:
+            return build_report(cls._execution_results(output, checkpointer, unit))
+        except ValueError as e:
+            completed = checkpointer.completed_cases(unit) if checkpointer is not None else []
+            return build_report(
+                ExecutionResultsModel(test_cases=completed),
+                run_errors=[f"Execution results could not be read: {e}"]
+            )
+
+    def _budget_stopped(
+        self,
+        reason: Any,
+        output: Any,
+        checkpointer: Optional[Checkpointer],
+        unit: str,
+        label: str = "Test plan"
+    ) -> ExecutionResultsModel:
+        """
+        Results of an execution the budget stopped: the executor's final
+        answer if it gave one (it lists the cases it skipped), otherwise the
+        cases it checkpointed and one skipped entry for the rest.
+        """
+        try:
+            return self._execution_results(output, checkpointer, unit)
+        except ValueError:
+            completed = checkpointer.completed_cases(unit) if checkpointer is not None else []
+            return skipped_results(label, str(reason), completed)
+
+    def _plan(
+        self,
+        website_url: str,
+        test_scenario: str,
+        additional_context: Optional[str],
+        verbose: bool,
+        site_map: Optional[str] = None
+    ) -> str:
+        """Run the planner alone and return the plan"""
+        with self._browser_tools(self.browser, warm_up_url=website_url) as tools:
+            file_tools = _file_tools()
+            test_planner = create_test_planner(
+                llm=self._llm("planner"), tools=self._agent_tools("planner", tools + file_tools), verbose=verbose
+            )
+            planning_task = create_planning_task(
+                agent=test_planner,
+                website_url=website_url,
+                test_scenario=test_scenario,
+                additional_context=additional_context,
+                site_map=site_map
+            )
+            return str(Crew(
+                agents=[test_planner],
+                tasks=[planning_task],
+                process=Process.sequential,
+                verbose=verbose,
+            ).kickoff())
+
+    def _run_matrix(
+        self,
+        website_url: str,
+        test_scenario: str,
+        additional_context: Optional[str],
+        verbose: bool,
+        browsers: List[str],
+        execution_hints: Optional[str] = None,
+        site_map: Optional[str] = None,
+        checkpointer: Optional[Checkpointer] = None,
+        plan: Optional[str] = None
+    ) -> Tuple[Any, Any, Dict[str, Dict[str, Any]]]:
+        """
+        Plan once (unless a plan is given), then execute the plan
+        concurrently on several browsers.
+
+        Each browser gets its own MCP server and executor. The per-browser
+        reports are tagged with the browser and merged into one report.
+        """
+        if plan is not None and checkpointer is not None and not checkpointer.checkpoint.planning_done:
+            checkpointer.record_plan(plan)
+        if plan is None:
+            try:
+                plan = self._plan(website_url, test_scenario, additional_context, verbose, site_map)
+            except BudgetExceeded as e:
+                # Nothing to execute without a plan
+                report = build_report(skipped_results("Test plan", str(e)))
+                return report, report, {}
+            if checkpointer is not None:
+                checkpointer.record_plan(plan)
+
+        browser_results: Dict[str, Dict[str, Any]] = {}
+        reports = []
+        run_errors = []
+        with ThreadPoolExecutor(max_workers=len(browsers), thread_name_prefix="browser-matrix") as pool:
+            futures = {
+                browser: pool.submit(
+                    self._execute_plan, browser, website_url, plan, verbose, execution_hints, checkpointer
+                )
+                for browser in browsers
+            }
+            for browser, future in futures.items():
+                try:
+                    _, report = future.result()
+                except Exception as e:
+                    browser_results[browser] = {"status": "failed", "error": str(e)}
+                    run_errors.append(f"[{browser}] execution failed: {e}")
+                    continue
+                report = tag_report(report, browser)
+                reports.append(report)
+                browser_results[browser] = {"status": "completed", "report": report.model_dump()}
+
+        merged = merge_reports(reports)
+        if run_errors:
+            merged = merged.model_copy(update={
+                "errors": merged.errors + run_errors,
+                "error_count": merged.error_count + len(run_errors),
+                "success": False,
+            })
+        return merged, merged, browser_results
+
+    def _plan_and_publish(
+        self,
+        pipeline: Union[SuitePipeline, SuiteCollector],
+        website_url: str,
+        test_scenario: str,
+        additional_context: Optional[str],
+        verbose: bool,
+        site_map: Optional[str] = None,
+        checkpointer: Optional[Checkpointer] = None
+    ) -> Any:
+        """Run the planner with the publish_test_suite tool and return its plan"""
+        with self._browser_tools(self.browser, isolated=True, warm_up_url=website_url) as tools:
+            file_tools = _file_tools()
+            planner_tools = tools + file_tools + [PublishTestSuiteTool(pipeline=pipeline)]
+            test_planner = create_test_planner(
+                llm=self._llm("planner"),
+                tools=self._agent_tools("planner", planner_tools),
+                verbose=verbose
+            )
+            planning_task = create_planning_task(
+                agent=test_planner,
+                website_url=website_url,
+                test_scenario=test_scenario,
+                additional_context=additional_context,
+                publish_suites=True,
+                site_map=site_map
+            )
+            if checkpointer is not None:
+                planning_task.callback = lambda output: checkpointer.record_plan(str(output))
+            return Crew(
+                agents=[test_planner],
+                tasks=[planning_task],
+                process=Process.sequential,
+                verbose=verbose,
+            ).kickoff()
+
+    def _run_pipelined(
+        self,
+        website_url: str,
+        test_scenario: str,
+        additional_context: Optional[str],
+        verbose: bool,
+        executor_workers: int,
+        execution_hints: Optional[str] = None,
+        site_map: Optional[str] = None,
+        checkpointer: Optional[Checkpointer] = None
+    ) -> Tuple[Any, Any, List[SuiteResult]]:
+        """
+        Overlap planning and execution.
+
+        The planner publishes suites through the publish_test_suite tool while
+        executor workers, each on its own browser, run them as they arrive.
+        The report is built once all suites have finished.
+
+        With a checkpoint, published suites and finished suite executions are
+        saved; a resumed run republishes the saved suites without planning
+        again (if planning had finished) and does not re-run finished suites.
+        """
+        @contextmanager
+        def open_executor():
+            tracers: List[Any] = []
+            with self._browser_tools(self.browser, isolated=True, warm_up_url=website_url, tracers=tracers) as tools:
+                executor_tools = self._agent_tools("executor", tools + _file_tools(write=False))
+
+                def execute_suite(suite: PlannedSuite) -> Any:
+                    # Suites may reuse case IDs; keep their traces apart
+                    for tracer in tracers:
+                        tracer.suite = suite.index
+                    unit = suite_unit(suite)
+                    finished = checkpointer.execution(unit) if checkpointer is not None else None
+                    if finished is not None:
+                        return finished.model_dump()
+                    exhausted = self._budget.exhausted("executor") if self._budget is not None else None
+                    if exhausted is not None:
+                        return self._budget_stopped(exhausted, None, checkpointer, unit, suite.title).model_dump()
+                    test_executor = create_test_executor(
+                        llm=self._llm("executor"),
+                        tools=executor_tools + self._record_tools(checkpointer, unit),
+                        verbose=verbose
+                    )
+                    suite_task = create_suite_execution_task(
+                        agent=test_executor,
+                        suite_title=suite.title,
+                        suite_plan=suite.plan,
+                        execution_hints=_join_hints(
+                            execution_hints, checkpointer.resume_hint(unit) if checkpointer else None
+                        )
+                    )
+                    crew = Crew(
+                        agents=[test_executor],
+                        tasks=[suite_task],
+                        process=Process.sequential,
+                        verbose=verbose,
+                    )
+                    try:
+                        output = crew.kickoff()
+                    except BudgetExceeded as e:
+                        return self._budget_stopped(e, suite_task.output, checkpointer, unit, suite.title).model_dump()
+                    if checkpointer is None:
+                        return output
+                    try:
+                        results = checkpointer.merge(unit, parse_execution_results(output))
+                    except ValueError:
+                        return output
+                    checkpointer.record_execution(unit, results)
+                    return results.model_dump()
+
+                yield execute_suite
+
+        pipeline = SuitePipeline(
+            open_executor,
+            workers=executor_workers,
+            on_publish=checkpointer.record_suite if checkpointer is not None else None
+        )
+        pipeline.start()
+        planning_stopped = None
+        try:
+            if checkpointer is not None and checkpointer.checkpoint.planning_done:
+                plan = checkpointer.checkpoint.plan
+                for suite in checkpointer.checkpoint.suites:
+                    pipeline.publish(suite.title, suite.plan)
+            else:
+                try:
+                    plan = self._plan_and_publish(
+                        pipeline, website_url, test_scenario, additional_context, verbose, site_map, checkpointer
+                    )
+                except BudgetExceeded as e:
+                    # Suites published before the stop still run (or are skipped if the budget is out)
+                    plan, planning_stopped = None, e
+
+            if pipeline.published == 0 and planning_stopped is None:
+                # The planner did not publish incrementally; run the whole plan as one suite
+                pipeline.publish("Test plan", str(plan))
+        finally:
+            suite_results = pipeline.finish()
+
+        def aggregate() -> TestReportModel:
+            executions, suites = [], []
+            # Suites that crashed or answered without typed results; surface them as errors
+            run_errors = []
+            for r in suite_results:
+                if r.status != "completed":
+                    run_errors.append(f"Suite {r.index} ({r.title}): {r.error}")
+                    continue
+                try:
+                    if r.execution is None:
+                        raise ValueError("no structured test case results")
+                    executions.append(parse_execution_results(r.execution))
+                    suites.append(r.index)
+                except ValueError as e:
+                    run_errors.append(f"Suite {r.index} ({r.title}): {e}")
+            if planning_stopped is not None:
+                executions.append(skipped_results("Unplanned suites", str(planning_stopped)))
+                suites.append(None)
+            return build_report(executions, run_errors=run_errors, suites=suites)
+
+        if self.deterministic_report:
+            report = aggregate()
+            return report, report, suite_results
+
+        test_reporter = create_test_reporter(
+            llm=self._llm("reporter"), tools=_file_tools(write=False), verbose=verbose
+        )
+        report_task = create_report_task(
+            agent=test_reporter,
+            test_execution_context="".join(format_suite_result(r) for r in suite_results)
+        )
+        try:
+            result = Crew(
+                agents=[test_reporter],
+                tasks=[report_task],
+                process=Process.sequential,
+                verbose=verbose,
+            ).kickoff()
+        except BudgetExceeded:
+            # The reporter ran out of budget; fall back to the aggregated report
+            report = aggregate()
+            return report, report, suite_results
+        return result, result.json_dict, suite_results
 
 
 def test_website_standalone(
@@ -131,7 +1164,8 @@ def test_website_standalone(
     additional_context: Optional[str] = None,
     llm: Optional[Any] = None,
     headless: bool = True,
-    browser: str = "chromium"
+    browser: str = "chromium",
+    backend: str = "mcp"
 ) -> Dict[str, Any]:
     """
     Standalone function to test a website using Playwright MCP.
@@ -146,11 +1180,12 @@ def test_website_standalone(
         llm: Optional LLM instance
         headless: Run browser in headless mode (default: True)
         browser: Browser type - chromium, firefox, webkit (default: chromium)
+        backend: Browser tool backend - mcp or native (default: mcp)
 
     Returns:
         Dictionary containing test results and reports
     """
-    crew = FrontendTestCrew(llm=llm, headless=headless, browser=browser)
+    crew = FrontendTestCrew(llm=llm, headless=headless, browser=browser, backend=backend)
     return crew.test_website(
         website_url=website_url,
         test_scenario=test_scenario,
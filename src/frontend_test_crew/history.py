@@ -0,0 +1,250 @@
+"""Local SQLite store of historical test results"""
+
+import json
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .models import SKIPPED_CASE_ID
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    duration_s REAL,
+    website_url TEXT NOT NULL,
+    test_scenario TEXT NOT NULL,
+    browser TEXT,
+    status TEXT NOT NULL,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS case_results (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    test_id TEXT NOT NULL,
+    test_name TEXT,
+    passed INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    duration_ms REAL,
+    browser TEXT,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_target ON runs(website_url, test_scenario);
+CREATE INDEX IF NOT EXISTS idx_case_results_test ON case_results(test_id);
+"""
+
+# Columns added to case_results after its first release, created on older databases
+_CASE_COLUMNS = {"browser": "TEXT", "status": "TEXT"}
+
+
+class CaseStats(BaseModel):
+    """Aggregated history of a single test case"""
+    test_id: str
+    test_name: Optional[str] = None
+    browser: Optional[str] = None
+    runs: int
+    failures: int
+    last_failed: bool
+    avg_duration_ms: Optional[float] = None
+    flip_rate: float = 0.0
+    flaky: bool = False
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.runs if self.runs else 0.0
+
+
+class ResultsHistory:
+    """
+    Stores per-case results of every report and derives execution hints.
+
+    Runs are scoped by website URL and test scenario, since case ids are only
+    stable within the plan of a given scenario. Cases are tracked per browser,
+    so a case failing on one browser of a matrix run is not mistaken for a
+    flaky one.
+    """
+
+    FAIL_FAST_HINT = (
+        "Fail fast: stop executing as soon as a test case fails (after its retry if it is "
+        "quarantined) and report the remaining cases as not run."
+    )
+
+    def __init__(
+        self,
+        path: str = "test_history.sqlite3",
+        window: int = 10,
+        flaky_min_runs: int = 3,
+        flaky_flip_rate: float = 0.3
+    ):
+        """
+        Args:
+            path: SQLite database file
+            window: Number of most recent runs considered per case
+            flaky_min_runs: Minimum runs in the window before a case can be flagged flaky
+            flaky_flip_rate: Fraction of pass/fail transitions above which a case is flaky
+        """
+        self.path = path
+        self.window = window
+        self.flaky_min_runs = flaky_min_runs
+        self.flaky_flip_rate = flaky_flip_rate
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(case_results)")}
+            for column, column_type in _CASE_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE case_results ADD COLUMN {column} {column_type}")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record_run(
+        self,
+        report: Optional[Dict[str, Any]],
+        website_url: str,
+        test_scenario: str,
+        status: str,
+        started_at: Optional[float] = None,
+        duration_s: Optional[float] = None,
+        browser: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Record a run and the summary entries of its report.
+
+        Args:
+            report: TestReportModel as a dict; None for runs that produced no report
+            website_url: URL of the tested website
+            test_scenario: Scenario the run was planned from
+            status: Run status (completed/failed)
+            started_at: Unix timestamp of the run start (default: now)
+            duration_s: Wall-clock duration of the run
+            browser: Browser the run executed on; summary entries without a
+                browser of their own (single-browser runs) are recorded on it.
+                Skipped entries are stored with their status but never count
+                as runs of a case
+            metadata: Any additional run metadata to keep as JSON
+
+        Returns:
+            The id of the stored run
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (started_at, duration_s, website_url, test_scenario, browser, status, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    started_at or time.time(), duration_s, website_url, test_scenario.strip(),
+                    browser, status, json.dumps(metadata or {}, default=str)
+                )
+            )
+            run_id = cursor.lastrowid
+            for case in (report or {}).get("summary") or []:
+                conn.execute(
+                    "INSERT INTO case_results "
+                    "(run_id, test_id, test_name, passed, failed, errors, duration_ms, browser, status) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        run_id, str(case.get("test_id")), case.get("test_name"),
+                        int(case.get("passed") or 0), int(case.get("failed") or 0),
+                        int(case.get("errors") or 0), case.get("duration_ms"),
+                        case.get("browser") or browser, case.get("status")
+                    )
+                )
+        return run_id
+
+    def case_stats(self, website_url: str, test_scenario: str) -> List[CaseStats]:
+        """
+        Aggregate the recent history of every case of a scenario, per browser.
+
+        Cases that were not run (skipped, or the entry standing for the cases
+        a stopped execution never reached) are left out.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT c.test_id, c.test_name, c.failed, c.errors, c.duration_ms, c.browser "
+                "FROM case_results c JOIN runs r ON r.run_id = c.run_id "
+                "WHERE r.website_url = ? AND r.test_scenario = ? "
+                "AND (c.status IS NULL OR c.status != 'skipped') AND c.test_id != ? "
+                "ORDER BY r.started_at DESC, r.run_id DESC",
+                (website_url, test_scenario.strip(), SKIPPED_CASE_ID)
+            ).fetchall()
+
+        history: Dict[Tuple[str, Optional[str]], List[sqlite3.Row]] = {}
+        for row in rows:
+            runs = history.setdefault((row["test_id"], row["browser"]), [])
+            if len(runs) < self.window:
+                runs.append(row)
+
+        stats = []
+        for (test_id, browser), runs in history.items():
+            # runs are newest first
+            outcomes = [bool(r["failed"] or r["errors"]) for r in runs]
+            durations = [r["duration_ms"] for r in runs if r["duration_ms"] is not None]
+            flips = sum(1 for a, b in zip(outcomes, outcomes[1:]) if a != b)
+            flip_rate = flips / (len(outcomes) - 1) if len(outcomes) > 1 else 0.0
+            stats.append(CaseStats(
+                test_id=test_id,
+                test_name=runs[0]["test_name"],
+                browser=browser,
+                runs=len(runs),
+                failures=sum(outcomes),
+                last_failed=outcomes[0],
+                avg_duration_ms=sum(durations) / len(durations) if durations else None,
+                flip_rate=round(flip_rate, 3),
+                flaky=len(runs) >= self.flaky_min_runs and flip_rate >= self.flaky_flip_rate,
+            ))
+        return stats
+
+    def execution_order(self, website_url: str, test_scenario: str) -> List[CaseStats]:
+        """
+        Order known cases failure-first and slowest-last.
+
+        Cases that failed last time come first, then by historical failure
+        rate; ties are broken by running faster cases earlier.
+        """
+        return sorted(
+            self.case_stats(website_url, test_scenario),
+            key=lambda s: (
+                not s.last_failed,
+                -s.failure_rate,
+                s.avg_duration_ms if s.avg_duration_ms is not None else float("inf"),
+                s.test_id,
+                s.browser or "",
+            )
+        )
+
+    def flaky_cases(self, website_url: str, test_scenario: str) -> List[CaseStats]:
+        """Cases whose outcome keeps flipping between runs"""
+        return [s for s in self.case_stats(website_url, test_scenario) if s.flaky]
+
+    def execution_hints(self, website_url: str, test_scenario: str, fail_fast: bool = False) -> str:
+        """Render execution guidance for the executor from the recorded history"""
+        ordered = self.execution_order(website_url, test_scenario)
+        lines = []
+        if ordered:
+            lines.append(
+                "Execute the test cases in this order (known failures first, slowest last); "
+                "cases not listed run afterwards in plan order:"
+            )
+            for s in ordered:
+                label = f"{s.test_id} ({s.test_name})" if s.test_name else s.test_id
+                lines.append(f"- {label}: failed {s.failures}/{s.runs} recent runs{_on_browser(s)}")
+
+            flaky = [s for s in ordered if s.flaky]
+            if flaky:
+                lines.append(
+                    "Known flaky cases (quarantined): "
+                    + ", ".join(f"{s.test_id}{_on_browser(s)}" for s in flaky)
+                    + ". Retry a quarantined case once before reporting it as failed, "
+                    "and mention in the results that it is flaky."
+                )
+        if fail_fast:
+            lines.append(self.FAIL_FAST_HINT)
+        return "\n".join(lines)
+
+
+def _on_browser(stats: CaseStats) -> str:
+    return f" on {stats.browser}" if stats.browser else ""
@@ -0,0 +1,265 @@
+"""Rate-limit-aware scheduling of LLM calls shared by concurrent crews"""
+
+import itertools
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from .llm_wrapper import LLMWrapper
+from .tools.output_compaction import CHARS_PER_TOKEN
+
+T = TypeVar("T")
+
+# Lower values are served first: executor turns make progress on a running
+# test, planner turns only add work
+ROLE_PRIORITIES: Dict[str, int] = {"executor": 0, "reporter": 1, "planner": 2}
+
+# Completion tokens reserved per call until the actual size is known
+_COMPLETION_ESTIMATE = 500
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `per_minute` units per minute.
+
+    Reservations may overdraw the bucket when the actual cost turns out to be
+    higher than estimated; later reservations then wait for the debt.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = float(per_minute)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` units are available"""
+        self._refill(now)
+        # A single request larger than the bucket is allowed once the bucket is full
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float, now: float):
+        self._refill(now)
+        self.level -= amount
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Recognize provider rate-limit errors (HTTP 429) across client libraries"""
+    if "ratelimit" in type(error).__name__.lower():
+        return True
+    if getattr(error, "status_code", None) == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "rate limit" in message or "rate_limit" in message
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMScheduler:
+    """
+    Admission control for LLM calls from any number of agents and crews.
+
+    Calls wait for a concurrency slot and for room in the requests-per-minute
+    and tokens-per-minute buckets; waiting calls are admitted by priority,
+    then in arrival order. A 429 from the provider pauses admission for every
+    caller (coordinated backoff) instead of letting each one retry into the
+    limit on its own.
+
+    Share one instance between crews in the same process. Separate processes
+    (e.g. CLI workers) need their own instance with a share of the budget.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        base_backoff_s: float = 2.0,
+        max_backoff_s: float = 60.0
+    ):
+        """
+        Args:
+            requests_per_minute: Request budget; None for unlimited
+            tokens_per_minute: Prompt plus completion token budget; None for unlimited
+            max_concurrency: Maximum calls in flight
+            max_retries: Retries of a rate-limited call before giving up
+            base_backoff_s: First backoff after a 429 without Retry-After
+            max_backoff_s: Upper bound for the backoff
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.base_backoff_s = base_backoff_s
+        self.max_backoff_s = max_backoff_s
+
+        self._condition = threading.Condition()
+        self._waiting: List[tuple] = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._consecutive_limits = 0
+        self.stats: Dict[str, Any] = {
+            "calls": 0,
+            "rate_limited": 0,
+            "failed": 0,
+            "wait_s": 0.0,
+            "wait_s_by_priority": {},
+        }
+
+    def _admission_delay(self, estimated_tokens: float, now: float) -> float:
+        """Seconds until the call at the head of the queue may start (0 = now)"""
+        if self._in_flight >= self.max_concurrency:
+            return float("inf")
+        delay = max(0.0, self._paused_until - now)
+        if self.requests:
+            delay = max(delay, self.requests.wait_time(1, now))
+        if self.tokens:
+            delay = max(delay, self.tokens.wait_time(estimated_tokens, now))
+        return delay
+
+    def acquire(self, priority: int, estimated_tokens: float):
+        """Block until the call may start, then reserve its budget and slot"""
+        entry = (priority, next(self._sequence))
+        started = time.monotonic()
+        with self._condition:
+            self._waiting.append(entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    if min(self._waiting) == entry:
+                        delay = self._admission_delay(estimated_tokens, now)
+                        if delay <= 0:
+                            break
+                    else:
+                        delay = float("inf")
+                    # Woken by releases and new arrivals; time-based budgets need a timeout
+                    self._condition.wait(None if delay == float("inf") else delay)
+            finally:
+                self._waiting.remove(entry)
+            self._in_flight += 1
+            if self.requests:
+                self.requests.take(1, now)
+            if self.tokens:
+                self.tokens.take(estimated_tokens, now)
+            waited = time.monotonic() - started
+            self.stats["wait_s"] += waited
+            by_priority = self.stats["wait_s_by_priority"]
+            by_priority[priority] = by_priority.get(priority, 0.0) + waited
+            self._condition.notify_all()
+
+    def release(self, extra_tokens: float = 0.0, rate_limited: bool = False, retry_after: Optional[float] = None):
+        """
+        Free the slot of a finished call.
+
+        Args:
+            extra_tokens: Actual minus estimated tokens, charged to the bucket
+            rate_limited: The provider rejected the call with a 429
+            retry_after: The provider's Retry-After, if given
+        """
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if self.tokens and extra_tokens:
+                self.tokens.take(extra_tokens, now)
+            if rate_limited:
+                self._consecutive_limits += 1
+                backoff = retry_after or min(
+                    self.max_backoff_s, self.base_backoff_s * 2 ** (self._consecutive_limits - 1)
+                )
+                # Jitter so paused callers don't all hit the provider in the same instant
+                self._paused_until = max(self._paused_until, now + backoff * random.uniform(1.0, 1.2))
+                self.stats["rate_limited"] += 1
+            else:
+                self._consecutive_limits = 0
+            self._condition.notify_all()
+
+    def run(
+        self,
+        call: Callable[[], T],
+        priority: int = 1,
+        estimated_tokens: float = 0,
+        count_tokens: Optional[Callable[[T], float]] = None
+    ) -> T:
+        """
+        Run an LLM call under the scheduler, retrying rate-limit errors.
+
+        Args:
+            call: The provider call
+            priority: Lower runs first (see ROLE_PRIORITIES)
+            estimated_tokens: Tokens reserved before the call
+            count_tokens: Returns the actual tokens of a result, to settle the reservation
+        """
+        attempt = 0
+        while True:
+            self.acquire(priority, estimated_tokens)
+            try:
+                result = call()
+            except Exception as e:
+                limited = is_rate_limit_error(e)
+                self.release(rate_limited=limited, retry_after=_retry_after(e) if limited else None)
+                if not limited or attempt >= self.max_retries:
+                    with self._condition:
+                        self.stats["failed"] += 1
+                    raise
+                attempt += 1
+                continue
+            actual = count_tokens(result) if count_tokens else estimated_tokens
+            self.release(extra_tokens=actual - estimated_tokens)
+            with self._condition:
+                self.stats["calls"] += 1
+            return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of the statistics, with waits rounded"""
+        with self._condition:
+            stats = dict(self.stats)
+            stats["wait_s"] = round(stats["wait_s"], 2)
+            stats["wait_s_by_priority"] = {
+                priority: round(waited, 2) for priority, waited in stats["wait_s_by_priority"].items()
+            }
+            return stats
+
+
+def text_tokens(value: Any) -> float:
+    """Estimated tokens of a prompt or completion (messages, strings or nested containers)"""
+    if isinstance(value, str):
+        return len(value) / CHARS_PER_TOKEN
+    if isinstance(value, dict):
+        return sum(text_tokens(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(text_tokens(item) for item in value)
+    return len(str(value)) / CHARS_PER_TOKEN if value is not None else 0
+
+
+class ScheduledLLM(LLMWrapper):
+    """LLM that sends every call of one agent role through an LLMScheduler"""
+
+    def __init__(self, llm: Any, scheduler: LLMScheduler, role: str):
+        self.scheduler = scheduler
+        self.role = role
+        self.priority = ROLE_PRIORITIES.get(role, 1)
+        super().__init__(llm)
+
+    def call(self, messages: Any, *args, **kwargs) -> Any:
+        prompt_tokens = text_tokens(messages)
+        return self.scheduler.run(
+            lambda: self.llm.call(messages, *args, **kwargs),
+            priority=self.priority,
+            estimated_tokens=prompt_tokens + _COMPLETION_ESTIMATE,
+            count_tokens=lambda result: prompt_tokens + text_tokens(result)
+        )
@@ -0,0 +1,42 @@
+"""Base class for LLMs that decorate other CrewAI LLMs"""
+
+from typing import Any, List, Optional
+
+from crewai.llms.base_llm import BaseLLM
+
+
+class LLMWrapper(BaseLLM):
+    """
+    LLM that exposes a wrapped LLM's model and capabilities and delegates to it.
+
+    The first wrapped LLM is the primary one (`self.llm`); wrappers that
+    route between several models pass the others too. Stop words set by
+    CrewAI on this object are forwarded to every wrapped LLM, and the
+    reported capabilities are the ones all of them share. Subclasses
+    implement `call`.
+    """
+
+    def __init__(self, llm: Any, *others: Any):
+        self.llm = llm
+        self.wrapped: List[Any] = [llm, *others]
+        super().__init__(model=llm.model, temperature=getattr(llm, "temperature", None), stop=llm.stop)
+
+    @property
+    def stop(self) -> Optional[List[str]]:
+        return self.llm.stop
+
+    @stop.setter
+    def stop(self, value: Optional[List[str]]):
+        # Set by BaseLLM.__init__ before the wrapped LLMs exist on some versions
+        if "wrapped" in self.__dict__:
+            for llm in self.wrapped:
+                llm.stop = value
+
+    def supports_function_calling(self) -> bool:
+        return all(llm.supports_function_calling() for llm in self.wrapped)
+
+    def supports_stop_words(self) -> bool:
+        return self.llm.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return min(llm.get_context_window_size() for llm in self.wrapped)
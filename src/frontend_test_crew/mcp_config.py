@@ -1,16 +1,29 @@
 """Playwright MCP Server configuration for CrewAI"""
 
 import os
+from typing import List, Optional
+
 from mcp import StdioServerParameters
 
 
-def get_playwright_mcp_params(headless: bool = True, browser: str = "chromium") -> StdioServerParameters:
+def get_playwright_mcp_params(
+    headless: bool = True,
+    browser: str = "chromium",
+    isolated: bool = False,
+    caps: Optional[List[str]] = None,
+    output_dir: Optional[str] = None
+) -> StdioServerParameters:
     """
     Get Playwright MCP server parameters for stdio connection.
 
     Args:
         headless: Run browser in headless mode (default: True)
         browser: Browser type - chromium, firefox, webkit (default: chromium)
+        isolated: Keep the browser profile in memory instead of the shared
+            persistent profile, so several servers can run concurrently
+        caps: Additional capabilities, e.g. ["tracing"] for the
+            browser_start_tracing / browser_stop_tracing tools
+        output_dir: Directory for files the server writes (screenshots, traces)
 
     Returns:
         StdioServerParameters configured for Playwright MCP server
@@ -25,6 +38,15 @@ def get_playwright_mcp_params(headless: bool = True, browser: str = "chromium")
     if browser != "chromium":
         args.extend(["--browser", browser])
 
+    if isolated:
+        args.append("--isolated")
+
+    if caps:
+        args.extend(["--caps", ",".join(caps)])
+
+    if output_dir:
+        args.extend(["--output-dir", output_dir])
+
     return StdioServerParameters(
         command="npx",
         args=args,
@@ -0,0 +1,169 @@
+"""Per-role model tiers: a fast model first, escalating to the strong model when needed"""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from .llm_wrapper import LLMWrapper
+from .tools.output_compaction import estimate_tokens
+
+_FINAL_ANSWER = "Final Answer:"
+
+
+def _message_text(messages: Any) -> str:
+    if isinstance(messages, str):
+        return messages
+    return "".join(
+        str(message.get("content", "")) if isinstance(message, dict) else str(message)
+        for message in messages or []
+    )
+
+
+def _parse_final_json(answer: str) -> Any:
+    """Decode the first JSON value in a final answer, ignoring code fences and prose"""
+    starts = [i for i in (answer.find("{"), answer.find("[")) if i >= 0]
+    if not starts:
+        raise ValueError("no JSON in final answer")
+    data, _ = json.JSONDecoder().raw_decode(answer[min(starts):])
+    return data
+
+
+def react_step_validator(final_model: Optional[Type[BaseModel]] = None) -> Callable[[Any], bool]:
+    """
+    Validator for one agent turn.
+
+    A turn is valid if it is a native tool call (non-text result), a ReAct
+    action with its input, or a final answer. With final_model, the final
+    answer must also contain JSON that validates against the model.
+    """
+    def validate(output: Any) -> bool:
+        if not isinstance(output, str):
+            return output is not None
+        if _FINAL_ANSWER in output:
+            if final_model is None:
+                return bool(output.split(_FINAL_ANSWER, 1)[1].strip())
+            try:
+                final_model.model_validate(_parse_final_json(output.split(_FINAL_ANSWER, 1)[1]))
+                return True
+            except (ValueError, ValidationError):
+                return False
+        return "Action:" in output and "Action Input:" in output
+
+    return validate
+
+
+class TierStats:
+    """Calls, estimated tokens and latency of one model tier"""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.calls = 0
+        self.failures = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latency_s = 0.0
+
+    def record(self, prompt_tokens: int, output: Any, latency_s: float, failed: bool):
+        self.calls += 1
+        self.failures += int(failed)
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += estimate_tokens(output if isinstance(output, str) else str(output or ""))
+        self.latency_s += latency_s
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "calls": self.calls,
+            "failures": self.failures,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency_s": round(self.latency_s, 2),
+            "avg_latency_s": round(self.latency_s / self.calls, 2) if self.calls else None,
+        }
+
+
+class TieredLLM(LLMWrapper):
+    """
+    Runs each agent turn on the fast model and repeats it on the strong model
+    when the fast model raises or its output fails validation.
+
+    After `sticky_after` consecutive escalations the agent stays on the strong
+    model, since its conversation has evidently outgrown the fast one.
+    """
+
+    def __init__(
+        self,
+        fast: Any,
+        strong: Any,
+        validator: Optional[Callable[[Any], bool]] = None,
+        sticky_after: int = 2
+    ):
+        self.fast = fast
+        self.strong = strong
+        self.validator = validator or react_step_validator()
+        self.sticky_after = sticky_after
+        self.escalations = 0
+        self._consecutive_escalations = 0
+        self._lock = threading.Lock()
+        self.tiers = {"fast": TierStats(fast.model), "strong": TierStats(strong.model)}
+        # The fast model is the primary one; CrewAI's ReAct stop words reach both tiers
+        super().__init__(fast, strong)
+
+    def _call_tier(self, tier: str, llm: Any, messages: Any, prompt_tokens: int, *args, **kwargs) -> Tuple[Any, bool]:
+        started = time.monotonic()
+        try:
+            output = llm.call(messages, *args, **kwargs)
+        except Exception:
+            with self._lock:
+                self.tiers[tier].record(prompt_tokens, None, time.monotonic() - started, failed=True)
+            raise
+        valid = self.validator(output)
+        with self._lock:
+            self.tiers[tier].record(prompt_tokens, output, time.monotonic() - started, failed=not valid)
+        return output, valid
+
+    def call(self, messages: Any, *args, **kwargs) -> Any:
+        prompt_tokens = estimate_tokens(_message_text(messages))
+        if self._consecutive_escalations < self.sticky_after:
+            try:
+                output, valid = self._call_tier("fast", self.fast, messages, prompt_tokens, *args, **kwargs)
+                if valid:
+                    self._consecutive_escalations = 0
+                    return output
+            except Exception:
+                pass
+            with self._lock:
+                self.escalations += 1
+                self._consecutive_escalations += 1
+        # The strong model's answer is used even if it doesn't validate; CrewAI handles that turn
+        output, _ = self._call_tier("strong", self.strong, messages, prompt_tokens, *args, **kwargs)
+        return output
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "escalations": self.escalations,
+            "fast": self.tiers["fast"].to_dict(),
+            "strong": self.tiers["strong"].to_dict(),
+        }
+
+
+def merge_tier_reports(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum the reports of several TieredLLMs (e.g. all executors of a run)"""
+    merged: Dict[str, Any] = {"escalations": sum(report["escalations"] for report in reports)}
+    for tier in ("fast", "strong"):
+        stats = [report[tier] for report in reports]
+        calls = sum(s["calls"] for s in stats)
+        latency = sum(s["latency_s"] for s in stats)
+        merged[tier] = {
+            "model": stats[0]["model"] if stats else None,
+            "calls": calls,
+            "failures": sum(s["failures"] for s in stats),
+            "prompt_tokens": sum(s["prompt_tokens"] for s in stats),
+            "completion_tokens": sum(s["completion_tokens"] for s in stats),
+            "latency_s": round(latency, 2),
+            "avg_latency_s": round(latency / calls, 2) if calls else None,
+        }
+    return merged
@@ -0,0 +1,92 @@
+"""Pydantic models for execution results and test reports
+
+Kept free of CrewAI imports so reports can be built, merged and stored
+without loading the agent framework.
+"""
+
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, field_validator, model_validator
+
+
+CaseStatus = Literal["passed", "failed", "error", "skipped"]
+
+# Spellings agents use for the case statuses
+_STATUS_ALIASES = {
+    "pass": "passed", "passed": "passed", "success": "passed", "ok": "passed",
+    "fail": "failed", "failed": "failed", "failure": "failed",
+    "error": "error", "errored": "error",
+    "skip": "skipped", "skipped": "skipped", "not run": "skipped", "not_run": "skipped",
+}
+
+# Test ID of the entry standing for the cases an execution never reached
+SKIPPED_CASE_ID = "SKIPPED"
+
+
+# Pydantic model for the expected JSON output
+class TestCaseSummary(BaseModel):
+    test_name: str
+    test_id: str
+    passed: int
+    failed: int
+    errors: int
+    status: Optional[CaseStatus] = None  # Missing in reports written by the reporter agent
+    duration_ms: Optional[float] = None
+    browser: Optional[str] = None
+    suite: Optional[int] = None  # Index of the pipelined suite the case ran in
+    trace_path: Optional[str] = None  # Playwright trace of a failed case
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def _normalize_status(cls, value: Any) -> Optional[str]:
+        """Same spellings as TestCaseResult; any other status is an error"""
+        if value is None:
+            return None
+        return _STATUS_ALIASES.get(str(value).strip().lower(), "error")
+
+
+class TestCaseResult(BaseModel):
+    test_id: str
+    test_name: str
+    status: CaseStatus
+    passed: int = 0
+    failed: int = 0
+    errors: List[str] = []
+    duration_ms: Optional[float] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_status(cls, data: Any) -> Any:
+        """
+        Accept status spellings like "FAIL" or "Passed"; any other status
+        (e.g. "blocked", "timeout") makes the case an error, keeping the
+        original status in its errors, so it can't count as a pass.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("status"), str):
+            return data
+        raw = data["status"].strip()
+        status = _STATUS_ALIASES.get(raw.lower())
+        if status is None:
+            status = "error"
+            data = {**data, "errors": list(data.get("errors") or []) + [f"unrecognized status '{raw}'"]}
+        return {**data, "status": status}
+
+
+class ExecutionResultsModel(BaseModel):
+    test_cases: List[TestCaseResult]
+    recommendations: List[str] = []
+
+
+class TestReportModel(BaseModel):
+    pass_count: int
+    fail_count: int
+    error_count: int
+    test_cases: int
+    success: bool
+    fails: List[str]
+    errors: List[str]
+    summary: List[TestCaseSummary]
+    recommendations: Optional[List[str]]
+    skip_count: int = 0
+    skipped: List[str] = []  # cases not run, e.g. because the budget ran out
+    budget: Optional[Dict[str, Any]] = None  # budget usage of the run, if it had one
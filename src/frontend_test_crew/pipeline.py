@@ -0,0 +1,207 @@
+"""Streaming planner-to-executor pipeline for test suites"""
+
+import logging
+import queue
+import threading
+import time
+from contextlib import AbstractContextManager, ExitStack
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+
+class PlannedSuite(BaseModel):
+    """A test suite finalized by the planner"""
+    index: int
+    title: str
+    plan: str
+
+
+class SuiteResult(BaseModel):
+    """Execution outcome of a single test suite"""
+    index: int
+    title: str
+    status: str
+    output: str = ""
+    execution: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    duration_s: float = 0.0
+
+
+logger = logging.getLogger(__name__)
+
+# Opens an executor (for example its own browser session) and yields a
+# function that runs one suite and returns the execution output.
+SuiteExecutorFactory = Callable[[], AbstractContextManager]
+
+
+class SuitePipeline:
+    """
+    Runs test suites on executor workers while the planner is still planning.
+
+    The planner publishes each suite as soon as it is finalized; worker
+    threads pick suites up immediately and append their results to the
+    results file, so the reporter sees results accumulate incrementally.
+    """
+
+    _SENTINEL = None
+
+    def __init__(
+        self,
+        open_executor: SuiteExecutorFactory,
+        workers: int = 1,
+        results_file: str = "TEST_RESULTS.md",
+        on_result: Optional[Callable[[SuiteResult], None]] = None,
+        on_publish: Optional[Callable[[PlannedSuite], None]] = None
+    ):
+        self.open_executor = open_executor
+        self.workers = max(1, workers)
+        self.results_file = results_file
+        self.on_result = on_result
+        self.on_publish = on_publish
+        self.results: List[SuiteResult] = []
+        self._queue: "queue.Queue[Optional[PlannedSuite]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._published = 0
+
+    @property
+    def published(self) -> int:
+        """Number of suites published so far"""
+        return self._published
+
+    def start(self):
+        """Reset the results file and start the executor workers"""
+        with open(self.results_file, "w", encoding="utf-8") as f:
+            f.write("# Test Results\n")
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"suite-executor-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def publish(self, title: str, plan: str) -> PlannedSuite:
+        """Queue a finalized suite for execution"""
+        with self._lock:
+            self._published += 1
+            suite = PlannedSuite(index=self._published, title=title, plan=plan)
+        if self.on_publish:
+            self.on_publish(suite)
+        self._queue.put(suite)
+        return suite
+
+    def finish(self) -> List[SuiteResult]:
+        """Wait for all published suites to finish and return their results in plan order"""
+        for _ in self._threads:
+            self._queue.put(self._SENTINEL)
+        for thread in self._threads:
+            thread.join()
+        return sorted(self.results, key=lambda r: r.index)
+
+    def _work(self):
+        stack = ExitStack()
+        try:
+            execute_suite = stack.enter_context(self.open_executor())
+        except Exception as e:
+            # The executor could not be opened; fail whatever this worker would have run
+            self._drain(None, startup_error=str(e))
+            return
+        try:
+            with stack:
+                self._drain(execute_suite)
+        except Exception:
+            # The queue was drained up to this worker's sentinel; draining again would block forever
+            logger.exception("Suite executor %s failed to shut down", threading.current_thread().name)
+
+    def _drain(self, execute_suite: Optional[Callable[[PlannedSuite], Any]], startup_error: Optional[str] = None):
+        while True:
+            suite = self._queue.get()
+            if suite is self._SENTINEL:
+                return
+            started = time.monotonic()
+            if execute_suite is None:
+                result = SuiteResult(index=suite.index, title=suite.title, status="failed", error=startup_error)
+            else:
+                try:
+                    output = execute_suite(suite)
+                    result = SuiteResult(
+                        index=suite.index,
+                        title=suite.title,
+                        status="completed",
+                        output=str(output),
+                        execution=_structured_output(output)
+                    )
+                except Exception as e:
+                    result = SuiteResult(index=suite.index, title=suite.title, status="failed", error=str(e))
+            result.duration_s = round(time.monotonic() - started, 2)
+            try:
+                self._record(result)
+            except Exception:
+                logger.exception("Could not record the result of suite %s (%s)", suite.index, suite.title)
+
+    def _record(self, result: SuiteResult):
+        with self._lock:
+            self.results.append(result)
+            with open(self.results_file, "a", encoding="utf-8") as f:
+                f.write(format_suite_result(result))
+        if self.on_result:
+            self.on_result(result)
+
+
+class SuiteCollector:
+    """
+    Collects the suites a planner publishes without executing them, so they
+    can be executed separately (e.g. split across CI shards).
+    """
+
+    def __init__(self):
+        self.suites: List[PlannedSuite] = []
+        self._lock = threading.Lock()
+
+    @property
+    def published(self) -> int:
+        return len(self.suites)
+
+    def publish(self, title: str, plan: str) -> PlannedSuite:
+        with self._lock:
+            suite = PlannedSuite(index=len(self.suites) + 1, title=title, plan=plan)
+            self.suites.append(suite)
+        return suite
+
+
+def _structured_output(output: Any) -> Optional[Dict[str, Any]]:
+    """Structured payload of a crew output, if the task produced one"""
+    to_dict = getattr(output, "to_dict", None)
+    if callable(to_dict):
+        return to_dict() or None
+    return output if isinstance(output, dict) else None
+
+
+def format_suite_result(result: SuiteResult) -> str:
+    """Render a suite result as a markdown section"""
+    body = result.output if result.status == "completed" else f"Execution failed: {result.error}"
+    return (
+        f"\n## Suite {result.index}: {result.title}\n"
+        f"Status: {result.status} ({result.duration_s}s)\n\n"
+        f"{body}\n"
+    )
+
+
+class PublishTestSuiteInput(BaseModel):
+    """Input for Publish Test Suite tool"""
+    title: str = Field(..., description="Title of the test suite")
+    plan: str = Field(..., description="Complete plan of the suite: test cases, steps and expected results")
+
+
+class PublishTestSuiteTool(BaseTool):
+    name: str = "publish_test_suite"
+    description: str = (
+        "Hand a finalized test suite to the executor so it starts running immediately. "
+        "Call this once per suite, as soon as the suite is complete, then continue planning."
+    )
+    args_schema: Type[BaseModel] = PublishTestSuiteInput
+    pipeline: Any = Field(..., exclude=True)
+
+    def _run(self, title: str, plan: str) -> str:
+        suite = self.pipeline.publish(title, plan)
+        return f"✓ Suite {suite.index} '{title}' queued for execution"
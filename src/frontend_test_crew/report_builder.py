@@ -0,0 +1,207 @@
+"""Deterministic aggregation of typed execution results into a TestReportModel"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from .models import (
+    ExecutionResultsModel,
+    TestCaseResult,
+    TestCaseSummary,
+    TestReportModel,
+)
+
+
+def parse_execution_results(output: Any) -> ExecutionResultsModel:
+    """
+    Extract typed execution results from a task or crew output.
+
+    Accepts an ExecutionResultsModel, a dict, a JSON string, or a CrewAI
+    TaskOutput/CrewOutput carrying one of those.
+
+    Raises:
+        ValueError: If no execution results can be extracted
+    """
+    if isinstance(output, ExecutionResultsModel):
+        return output
+    if isinstance(output, dict):
+        return ExecutionResultsModel.model_validate(output)
+
+    structured = getattr(output, "pydantic", None)
+    if isinstance(structured, ExecutionResultsModel):
+        return structured
+    if getattr(output, "json_dict", None):
+        return ExecutionResultsModel.model_validate(output.json_dict)
+
+    raw = output if isinstance(output, str) else getattr(output, "raw", None)
+    if isinstance(raw, str):
+        start, end = raw.find("{"), raw.rfind("}")
+        if start >= 0 and end > start:
+            return ExecutionResultsModel.model_validate_json(raw[start:end + 1])
+    raise ValueError("Execution output does not contain structured test case results")
+
+
+def build_report(
+    executions: Union[ExecutionResultsModel, Iterable[ExecutionResultsModel]],
+    recommendations: Optional[List[str]] = None,
+    run_errors: Optional[List[str]] = None,
+    suites: Optional[List[Optional[int]]] = None
+) -> TestReportModel:
+    """
+    Build the test report from typed per-case results.
+
+    Args:
+        executions: Results of one execution, or of several (e.g. one per suite)
+        recommendations: Free-text recommendations; defaults to the ones
+            collected from the executions
+        run_errors: Errors not attributable to a single case (e.g. a crashed suite)
+        suites: Suite index of each execution, in the same order, recorded on
+            its summary entries (pipelined runs, where case IDs may repeat)
+
+    Returns:
+        TestReportModel with counts, failures, errors and per-case summary
+    """
+    if isinstance(executions, ExecutionResultsModel):
+        executions = [executions]
+
+    executions = list(executions)
+    suites = suites or [None] * len(executions)
+    cases: List[Tuple[TestCaseResult, Optional[int]]] = []
+    collected_recommendations: List[str] = []
+    for execution, suite in zip(executions, suites):
+        cases.extend((case, suite) for case in execution.test_cases)
+        collected_recommendations.extend(execution.recommendations)
+
+    fails: List[str] = []
+    skipped: List[str] = []
+    errors: List[str] = list(run_errors or [])
+    summary: List[TestCaseSummary] = []
+    pass_count = fail_count = 0
+    for case, suite in cases:
+        status = case.status
+        case_errors = list(case.errors)
+        if status == "error" and not case_errors:
+            case_errors = ["execution error"]
+
+        if status == "passed":
+            pass_count += 1
+        elif status == "failed":
+            fail_count += 1
+            fails.append(f"{case.test_id}: {case.test_name}")
+        elif status == "skipped":
+            # Not run; the reason (e.g. the exhausted budget) is not an error of the application
+            skipped.append(f"{case.test_id}: {case.test_name}")
+            case_errors = []
+        errors.extend(f"{case.test_id}: {message}" for message in case_errors)
+
+        summary.append(TestCaseSummary(
+            test_name=case.test_name,
+            test_id=case.test_id,
+            passed=case.passed,
+            failed=case.failed,
+            errors=len(case_errors),
+            status=status,
+            duration_ms=case.duration_ms,
+            suite=suite,
+        ))
+
+    return TestReportModel(
+        pass_count=pass_count,
+        fail_count=fail_count,
+        error_count=len(errors),
+        test_cases=len(cases),
+        success=bool(cases) and fail_count == 0 and not errors and not skipped,
+        fails=fails,
+        errors=errors,
+        summary=summary,
+        recommendations=_dedupe(recommendations if recommendations is not None else collected_recommendations),
+        skip_count=len(skipped),
+        skipped=skipped,
+    )
+
+
+def tag_report(report: TestReportModel, browser: str) -> TestReportModel:
+    """Attach a browser dimension to every summary entry, failure and error"""
+    return report.model_copy(update={
+        "fails": [f"[{browser}] {item}" for item in report.fails],
+        "skipped": [f"[{browser}] {item}" for item in report.skipped],
+        "errors": [f"[{browser}] {item}" for item in report.errors],
+        "summary": [case.model_copy(update={"browser": browser}) for case in report.summary],
+    })
+
+
+def merge_reports(reports: Iterable[Union[TestReportModel, Dict[str, Any]]]) -> TestReportModel:
+    """
+    Combine several reports into one.
+
+    Counts are summed, fails/skipped/errors/summary are concatenated in order and
+    recommendations are de-duplicated. The merged run succeeds only if every
+    report succeeded.
+    """
+    reports = [TestReportModel.model_validate(r) if isinstance(r, dict) else r for r in reports]
+    recommendations: List[str] = []
+    for report in reports:
+        recommendations.extend(report.recommendations or [])
+
+    return TestReportModel(
+        pass_count=sum(r.pass_count for r in reports),
+        fail_count=sum(r.fail_count for r in reports),
+        error_count=sum(r.error_count for r in reports),
+        test_cases=sum(r.test_cases for r in reports),
+        success=bool(reports) and all(r.success for r in reports),
+        fails=[item for r in reports for item in r.fails],
+        errors=[item for r in reports for item in r.errors],
+        summary=[case for r in reports for case in r.summary],
+        recommendations=_dedupe(recommendations),
+        skip_count=sum(r.skip_count for r in reports),
+        skipped=[item for r in reports for item in r.skipped],
+    )
+
+
+def attach_traces(
+    report: Optional[Union[TestReportModel, Dict[str, Any]]],
+    traces: Dict[Tuple[str, str, Optional[int]], str]
+) -> Optional[Union[TestReportModel, Dict[str, Any]]]:
+    """
+    Link kept Playwright traces (those of failed cases, unless passing
+    ones are kept too) to the report's summary entries.
+
+    A report that is missing or doesn't validate (e.g. a partial answer of
+    the reporter agent) is returned unchanged.
+
+    Args:
+        report: The run's report
+        traces: Trace file per test ID, browser and suite index (TraceRecorder.traces)
+    """
+    if isinstance(report, dict):
+        try:
+            report = TestReportModel.model_validate(report)
+        except ValidationError:
+            return report
+    if not isinstance(report, TestReportModel):
+        return report
+    summary = []
+    for case in report.summary:
+        candidates = {
+            suite: path for (test_id, browser, suite), path in traces.items()
+            if test_id == case.test_id.strip() and (case.browser is None or browser == case.browser)
+        }
+        path = candidates.get(case.suite)
+        if path is None and case.suite is None and len(candidates) == 1:
+            # Entries written by the reporter agent carry no suite; link only when unambiguous
+            path = next(iter(candidates.values()))
+        if path:
+            case = case.model_copy(update={"trace_path": path})
+        summary.append(case)
+    return report.model_copy(update={"summary": summary})
+
+
+def report_to_dict(report: Optional[Union[TestReportModel, Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """Normalize a report to a plain dict"""
+    if report is None or isinstance(report, dict):
+        return report
+    return report.model_dump()
+
+
+def _dedupe(items: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(item.strip() for item in items if item and item.strip()))
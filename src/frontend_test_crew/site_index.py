@@ -0,0 +1,143 @@
+"""Persisted site-map index that is revalidated instead of re-crawled"""
+
+import hashlib
+import os
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from pydantic import ValidationError
+
+from .atomic_file import write_atomic
+from .crawler import PageSummary, SiteCrawler, SiteMap, normalize_url
+
+# Statuses after which a route is dropped from the index
+_GONE_STATUSES = {404, 410}
+
+
+def _conditional_get(page: PageSummary, timeout: float) -> Tuple[bool, PageSummary]:
+    """
+    Check whether a route's HTML changed since it was indexed.
+
+    Sends If-None-Match / If-Modified-Since from the stored validators; a 304
+    or an identical body means unchanged. Any error counts as changed, so the
+    route is handed to the browser.
+
+    Returns:
+        Tuple of (unchanged, page with refreshed validators)
+    """
+    headers = {}
+    if page.etag:
+        headers["If-None-Match"] = page.etag
+    if page.last_modified:
+        headers["If-Modified-Since"] = page.last_modified
+    request = urllib.request.Request(page.url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+        return e.code == 304, page
+    except (urllib.error.URLError, OSError, ValueError):
+        return False, page
+
+    unchanged = page.content_hash is not None and hashlib.sha1(body).hexdigest() == page.content_hash
+    return unchanged, page.model_copy(update={"etag": etag, "last_modified": last_modified})
+
+
+class SiteIndex:
+    """
+    Site maps stored per start URL as JSON files.
+
+    `refresh` revalidates every indexed route with a conditional HTTP request
+    and only opens the browser for routes whose HTML changed (or that can't
+    be validated over HTTP). A re-rendered route whose structure hash is
+    unchanged keeps its entry; links to routes not yet in the index are
+    crawled within the crawler's page budget.
+    """
+
+    def __init__(self, directory: str = "site_index", max_workers: int = 8, timeout: float = 10.0):
+        """
+        Args:
+            directory: Where the index files are stored
+            max_workers: Concurrent conditional requests
+            timeout: Timeout per conditional request in seconds
+        """
+        self.directory = directory
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def path_for(self, url: str) -> str:
+        root = normalize_url(url)
+        digest = hashlib.sha1(root.encode("utf-8")).hexdigest()[:12]
+        host = urlparse(root).netloc.replace(":", "_") or "site"
+        return os.path.join(self.directory, f"{host}-{digest}.json")
+
+    def load(self, url: str) -> Optional[SiteMap]:
+        """Return the stored site map, or None if there is none or it is unreadable"""
+        try:
+            with open(self.path_for(url), encoding="utf-8") as f:
+                return SiteMap.model_validate_json(f.read())
+        except (OSError, ValueError, ValidationError):
+            return None
+
+    def save(self, site_map: SiteMap):
+        # Concurrent CI workers never read a partial file
+        write_atomic(self.path_for(site_map.root_url), site_map.model_dump_json())
+
+    def refresh(self, url: str, crawler: SiteCrawler) -> Tuple[SiteMap, Dict[str, int]]:
+        """
+        Return an up-to-date site map, crawling only what changed.
+
+        Returns:
+            Tuple of (site map, statistics: unchanged, changed, new and
+            removed routes, and whether a full crawl was needed)
+        """
+        indexed = self.load(url)
+        if indexed is None or not indexed.pages:
+            site_map = crawler.crawl(url)
+            self.save(site_map)
+            return site_map, {"full_crawl": 1, "new": len(site_map.pages)}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            checks = list(pool.map(lambda page: _conditional_get(page, self.timeout), indexed.pages))
+
+        pages: Dict[str, PageSummary] = {}
+        stale: List[PageSummary] = []
+        for unchanged, page in checks:
+            if unchanged and not page.error:
+                pages[page.url] = page
+            else:
+                stale.append(page)
+
+        stats = {"full_crawl": 0, "unchanged": len(pages), "changed": 0, "new": 0, "removed": 0}
+        truncated = indexed.truncated
+        if stale:
+            visited, recrawl_truncated = crawler.recrawl(
+                [(page.url, page.depth) for page in stale],
+                known={page.url for page in indexed.pages}
+            )
+            truncated = truncated or recrawl_truncated
+            previous = {page.url: page for page in stale}
+            for page in visited:
+                if page.status in _GONE_STATUSES:
+                    stats["removed"] += 1
+                    continue
+                pages[page.url] = page
+                if page.url not in previous:
+                    stats["new"] += 1
+                elif page.dom_hash == previous[page.url].dom_hash:
+                    stats["unchanged"] += 1
+                else:
+                    stats["changed"] += 1
+
+        site_map = SiteMap(
+            root_url=indexed.root_url,
+            pages=sorted(pages.values(), key=lambda page: (page.depth, page.url)),
+            truncated=truncated
+        )
+        self.save(site_map)
+        return site_map, stats
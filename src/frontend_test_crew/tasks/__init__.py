@@ -1,5 +1,5 @@
 """Task definitions for the frontend testing crew"""
 
-from .test_tasks import create_planning_task, create_execution_task
+from .test_tasks import create_planning_task, create_execution_task, create_suite_execution_task
 
-__all__ = ["create_planning_task", "create_execution_task"]
+__all__ = ["create_planning_task", "create_execution_task", "create_suite_execution_task"]
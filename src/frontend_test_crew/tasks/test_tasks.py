@@ -3,14 +3,33 @@
 from crewai import Task, Agent
 from typing import Optional
 
-from pydantic import BaseModel
+from ..models import ExecutionResultsModel, TestReportModel
+
+
+# Structured per-case output shared by the execution tasks; the report is
+# aggregated from it without another LLM call.
+EXECUTION_RESULTS_OUTPUT = """
+    A JSON object with:
+    - test_cases -> list of objects, one per executed test case, each containing:
+       - test_id -> id of the case as numbered in the plan
+       - test_name -> name of the case
+       - status -> "passed", "failed", "error" (error: the case could not be executed) or
+         "skipped" (not run because the budget ran out)
+       - passed -> integer number of passed assertions/steps in the case
+       - failed -> integer number of failed assertions/steps in the case
+       - errors -> list of error messages encountered in the case
+       - duration_ms -> execution time of the case in milliseconds, if known
+    - recommendations -> list of suggestions about the application or the test suite
+    """
 
 
 def create_planning_task(
     agent: Agent,
     website_url: str,
     test_scenario: str,
-    additional_context: Optional[str] = None
+    additional_context: Optional[str] = None,
+    publish_suites: bool = False,
+    site_map: Optional[str] = None
 ) -> Task:
     """
     Create a test planning task.
@@ -20,17 +39,36 @@ def create_planning_task(
         website_url: URL of the website to test
         test_scenario: Description of what needs to be tested
         additional_context: Any additional context or requirements
+        publish_suites: Ask the planner to publish each suite for execution
+            as soon as it is finalized (pipelined mode)
+        site_map: Pre-crawled site map (routes, forms, controls, headings)
 
     Returns:
         Task object for test planning
     """
     context_section = f"\n\nAdditional Context:\n{additional_context}" if additional_context else ""
+    site_map_section = f"""
+
+    A crawler has already mapped the website. Design the tests from this site map and take
+    selectors for your steps from it; only interact with the website to explore flows and
+    states the map does not cover (e.g. pages behind a login or content revealed by clicks).
+
+{site_map}
+    """ if site_map else ""
+    publish_section = """
+
+    Group the test cases into test suites. As soon as a suite is finalized, call the
+    publish_test_suite tool with its title and its complete plan (test cases, steps and
+    expected results), then continue planning the next suite. Published suites start
+    executing immediately, so each published plan must be self-contained.
+    Do not publish the same suite twice.
+    """ if publish_suites else ""
 
     description = f"""
     Create a detailed test plan for the following web application testing scenario:
 
     Website URL: {website_url}
-    Test Scenario: {test_scenario}{context_section}
+    Test Scenario: {test_scenario}{context_section}{site_map_section}
     
     The plan should be formulated while exploring deeply the website to infer features and interactions.
     You should look accurately at the website HTML and visual structure to infer features.
@@ -52,7 +90,7 @@ def create_planning_task(
     Step 1: Navigate to {website_url}
     Step 2: Click on "Login" button
     Step 3: Type "testuser@example.com" into email field
-    Step 4: Verify that dashboard is displayed
+    Step 4: Verify that dashboard is displayed{publish_section}
     """
 
     expected_output = """
@@ -73,46 +111,103 @@ def create_planning_task(
 
 def create_execution_task(
     agent: Agent,
-    test_plan_context: str = ""
+    test_plan_context: str = "",
+    execution_hints: Optional[str] = None,
+    results_file: str = "TEST_RESULTS.md"
 ) -> Task:
     """
     Create a test execution task.
 
     Args:
         agent: The test executor agent
-        test_plan_context: Context from the planning task (will be provided automatically)
+        test_plan_context: Context from the planning task (will be provided automatically
+            when the task is chained to the planning task; pass the plan explicitly otherwise)
+        execution_hints: Optional ordering, quarantine and fail-fast guidance
+            derived from historical results
+        results_file: File the detailed execution report is written to
 
     Returns:
         Task object for test execution
     """
-    description = """
+    description = f"""
     Execute the test plan provided by the Test Planner using Playwright.
 
     Steps:
     1. Review the test plan from the previous task
     2. Execute each test step using the Playwright Test Executor tool
-    3. Document the results of each step
+    3. Document the results of each step and how long each test case took
     4. Report any failures or issues encountered
-    5. Provide a summary of the test execution and write into TEST_RESULTS.md file fail/passes
+    5. Provide a summary of the test execution and write into {results_file} file fail/passes
 
     Make sure to execute all steps in order and report comprehensive results.
     """
+    if test_plan_context:
+        description += f"""
+    Test plan (do not read it from TEST_PLAN.md):
+    {test_plan_context}
+    """
+    if execution_hints:
+        description += f"""
+    Execution guidance from previous runs:
+    {execution_hints}
+    """
 
-    expected_output = """
-    A detailed test execution report including:
-    - Status of each test step (passed/failed)
-    - Any errors or issues encountered
-    - Screenshots or evidence where applicable
-    - Overall test result summary
-    - Recommendations for any failures found
-    
-    All results should be documented in TEST_RESULTS.md file.
+    expected_output = EXECUTION_RESULTS_OUTPUT + f"""
+    The detailed report (status of each step, errors, evidence and overall summary)
+    should be documented in {results_file} file.
     """
 
     return Task(
         description=description,
         expected_output=expected_output,
         agent=agent,
+        output_pydantic=ExecutionResultsModel
+    )
+
+def create_suite_execution_task(
+    agent: Agent,
+    suite_title: str,
+    suite_plan: str,
+    execution_hints: Optional[str] = None
+) -> Task:
+    """
+    Create an execution task for a single published test suite.
+
+    Args:
+        agent: The test executor agent
+        suite_title: Title of the suite
+        suite_plan: The suite's plan as published by the planner
+        execution_hints: Optional guidance derived from historical results
+
+    Returns:
+        Task object for suite execution
+    """
+    description = f"""
+    Execute the following test suite using Playwright.
+    The suite plan is given below; do not read or write TEST_PLAN.md or TEST_RESULTS.md.
+
+    Suite: {suite_title}
+
+    {suite_plan}
+
+    Steps:
+    1. Execute each test step in order
+    2. Document the result of each step and how long each test case took
+    3. Report any failures or issues encountered
+    """
+    if execution_hints:
+        description += f"""
+    Execution guidance from previous runs:
+    {execution_hints}
+    """
+
+    expected_output = EXECUTION_RESULTS_OUTPUT
+
+    return Task(
+        description=description,
+        expected_output=expected_output,
+        agent=agent,
+        output_pydantic=ExecutionResultsModel
     )
 
 def create_report_task(
@@ -140,6 +235,11 @@ def create_report_task(
     Make sure to execute all steps in order and report accurate results.
     Report should NOT be saved on file.
     """
+    if test_execution_context:
+        description += f"""
+    Test execution results:
+    {test_execution_context}
+    """
 
     expected_output = """
     A JSON report with:
@@ -150,39 +250,21 @@ def create_report_task(
     - success -> boolean indicating overall test success
     - fails -> list of failed test cases
     - errors -> list of errors encountered
+    - skip_count -> integer representing the number of test cases skipped (not run)
+    - skipped -> list of skipped test cases
     - summary -> list of objects, each object containing:
        - test_name -> name of the case
        - test_id -> id of the case
        - passed -> integer representing the number of passed assertions in the case
        - failed -> integer representing the number of failed assertions in the case
        - errors -> integer representing the number of errors encountered in the case
+       - status -> "passed", "failed", "error" or "skipped"
+       - duration_ms -> execution time of the case in milliseconds, if known
     - recommendations -> suggestions made by the executor about the application or the test suite
     
     The json report will contain ONLY the specified fields and be formatted as valid JSON.
     """
 
-    # Pydantic model for the expected JSON output
-    from typing import List, Optional
-    class TestCaseSummary(BaseModel):
-        test_name: str
-        test_id: str
-        passed: int
-        failed: int
-        errors: int
-
-    class TestReportModel(BaseModel):
-        pass_count: int
-        fail_count: int
-        error_count: int
-        test_cases: int
-        success: bool
-        fails: List[str]
-        errors: List[str]
-        summary: List[TestCaseSummary]
-        recommendations: Optional[List[str]]
-
-    json_model: type[BaseModel] = TestReportModel
-
     return Task(
         description=description,
         expected_output=expected_output,
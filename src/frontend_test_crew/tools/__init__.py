@@ -1,33 +1,70 @@
-"""Tools for the frontend testing crew"""
-
-from .playwright_tools import (
-    NavigateTool,
-    ClickTool,
-    TypeTool,
-    SnapshotTool,
-    ScreenshotTool,
-    FillFormTool,
-    WaitForTool,
-    EvaluateTool,
-    VerifyElementTool,
-    GetCurrentUrlTool,
-    GetPageTextTool,
-    CloseBrowserTool,
-    BrowserManager
-)
-
-__all__ = [
-    "NavigateTool",
-    "ClickTool",
-    "TypeTool",
-    "SnapshotTool",
-    "ScreenshotTool",
-    "FillFormTool",
-    "WaitForTool",
-    "EvaluateTool",
-    "VerifyElementTool",
-    "GetCurrentUrlTool",
-    "GetPageTextTool",
-    "CloseBrowserTool",
-    "BrowserManager"
-]
+"""Tools for the frontend testing crew
+
+Tool classes are imported lazily on first access, so using one tool module
+(e.g. output compaction with the MCP backend) does not load Playwright.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "NavigateTool": ".playwright_tools",
+    "ClickTool": ".playwright_tools",
+    "TypeTool": ".playwright_tools",
+    "SnapshotTool": ".playwright_tools",
+    "ScreenshotTool": ".playwright_tools",
+    "FillFormTool": ".playwright_tools",
+    "WaitForTool": ".playwright_tools",
+    "EvaluateTool": ".playwright_tools",
+    "VerifyElementTool": ".playwright_tools",
+    "GetCurrentUrlTool": ".playwright_tools",
+    "GetPageTextTool": ".playwright_tools",
+    "PressKeyTool": ".playwright_tools",
+    "SelectOptionTool": ".playwright_tools",
+    "HoverTool": ".playwright_tools",
+    "GoBackTool": ".playwright_tools",
+    "ResetBrowserContextTool": ".playwright_tools",
+    "CloseBrowserTool": ".playwright_tools",
+    "BrowserManager": ".playwright_tools",
+    "PlaywrightTool": ".playwright_tools",
+    "native_tools": ".playwright_tools",
+    "RetryPolicy": ".retry_policy",
+    "RetryError": ".retry_policy",
+    "RecyclePolicy": ".resource_monitor",
+    "ResourceMonitor": ".resource_monitor",
+    "ToolWrapper": ".tool_wrapper",
+    "OutputCompactor": ".output_compaction",
+    "ArtifactStore": ".output_compaction",
+    "CompactedTool": ".output_compaction",
+    "ReadArtifactTool": ".output_compaction",
+    "compact_tools": ".output_compaction",
+    "BrowserWarmup": ".warmup",
+    "WarmupGatedTool": ".warmup",
+    "gate_tools": ".warmup",
+    "ToolCallCache": ".memoization",
+    "MemoizedTool": ".memoization",
+    "memoize_tools": ".memoization",
+    "TOOL_PROFILES": ".tool_profiles",
+    "MinifiedTool": ".tool_profiles",
+    "prepare_agent_tools": ".tool_profiles",
+    "VisualAssertTool": ".visual_assert",
+    "TracingOptions": ".tracing",
+    "TraceRecorder": ".tracing",
+    "StartTestCaseTool": ".tracing",
+    "EndTestCaseTool": ".tracing",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
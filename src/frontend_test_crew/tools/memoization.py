@@ -0,0 +1,172 @@
+"""Memoization of read-only browser tool calls between page mutations"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from crewai.tools import BaseTool
+from pydantic import Field
+
+from .tool_wrapper import ToolWrapper
+
+# Tools whose output only depends on their arguments and the page state.
+# Script evaluation is left out: a script may change the page, so it is
+# treated as mutating.
+READ_ONLY_TOOLS = {
+    # Native tools
+    "get_page_text",
+    "take_snapshot",
+    "verify_element",
+    # Playwright MCP tools
+    "browser_snapshot",
+    "browser_console_messages",
+    "browser_network_requests",
+}
+
+# Tools that don't change the page state and gain nothing from the cache;
+# they bypass it. Every other tool is treated as mutating and invalidates it.
+NEUTRAL_TOOLS = {
+    "get_current_url",  # reads page.url without a browser round trip; a cache probe would cost more
+    "take_screenshot",
+    "browser_take_screenshot",
+    "read_tool_artifact",
+    "assert_visual_match",
+    "start_test_case",
+    "end_test_case",
+}
+
+# Native tools mark failures with this prefix; failed reads are never cached
+_FAILURE_MARKER = "✗"
+
+# Installs a MutationObserver on first use and returns a token that changes
+# whenever the DOM mutates or a new document is loaded
+DOM_VERSION_SCRIPT = """() => {
+    if (!window.__ftcDomVersion) {
+        const state = { id: Math.random().toString(36).slice(2), count: 0 };
+        new MutationObserver(records => { state.count += records.length; })
+            .observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+        window.__ftcDomVersion = state;
+    }
+    return location.href + '|' + window.__ftcDomVersion.id + '|' + window.__ftcDomVersion.count;
+}"""
+
+
+class ToolCallCache:
+    """
+    Results of read-only tool calls, keyed by tool name and arguments.
+
+    Entries are dropped whenever a mutating tool runs. If a DOM version probe
+    is given, an entry is only served while the page reports the same DOM
+    version it had when the entry was stored, which also catches changes the
+    page makes on its own (timers, late XHR responses).
+    """
+
+    def __init__(self, probe: Optional[Callable[[], Any]] = None, max_entries: int = 64):
+        """
+        Args:
+            probe: Returns the current DOM version; called once per read-only
+                tool call, and its result is used both to validate a cached
+                entry and to tag the output of a call that runs
+            max_entries: Least recently used entries beyond this are evicted
+        """
+        self.probe = probe
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def version(self) -> Any:
+        """Current DOM version, or None without a probe"""
+        if self.probe is None:
+            return None
+        try:
+            return self.probe()
+        except Exception:
+            # Without a version the entry can't be validated; a fresh object never matches
+            return object()
+
+    def lookup(self, key: str, version: Any) -> Optional[Any]:
+        """Return the output cached for a call at this DOM version, or None if it must run"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return None
+
+    def store(self, key: str, output: Any, version: Any):
+        """
+        Cache the output of a call under the DOM version taken before it ran.
+
+        A page that changes during or after the call reports a different
+        version on the next lookup, so the entry is never served stale.
+        """
+        with self._lock:
+            self._entries[key] = (version, output)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "invalidations": self.invalidations}
+
+
+class MemoizedTool(ToolWrapper):
+    """
+    Wraps a tool with the shared call cache.
+
+    Read-only tools are served from the cache; any other tool except the
+    neutral ones invalidates it before and after running.
+    """
+
+    cache: Any = Field(..., exclude=True)
+
+    def _run(self, **kwargs) -> Any:
+        if self.name in NEUTRAL_TOOLS:
+            return self._call_inner(**kwargs)
+        if self.name not in READ_ONLY_TOOLS:
+            self.cache.invalidate()
+            try:
+                return self._call_inner(**kwargs)
+            finally:
+                self.cache.invalidate()
+
+        key = self.name + json.dumps(kwargs, sort_keys=True, default=str)
+        # One probe per call: it validates the cached entry and tags a fresh one
+        version = self.cache.version()
+        cached = self.cache.lookup(key, version)
+        if cached is not None:
+            return cached
+        output = self._call_inner(**kwargs)
+        if not (isinstance(output, str) and output.startswith(_FAILURE_MARKER)):
+            self.cache.store(key, output, version)
+        return output
+
+
+def memoize_tools(tools: List[BaseTool], cache: ToolCallCache) -> List[BaseTool]:
+    """Wrap every tool in the list with the shared call cache"""
+    return [MemoizedTool(tool, cache=cache) for tool in tools]
+
+
+def mcp_dom_probe(tools: List[BaseTool]) -> Optional[Callable[[], Any]]:
+    """
+    DOM version probe for Playwright MCP tools.
+
+    Pass the unwrapped tools, so the probe itself is not memoized. Returns
+    None if the server exposes no evaluate tool.
+    """
+    evaluate = next((tool for tool in tools if tool.name == "browser_evaluate"), None)
+    if evaluate is None:
+        return None
+    return lambda: evaluate.run(function=DOM_VERSION_SCRIPT)
@@ -0,0 +1,205 @@
+"""Token-budgeted compaction of tool outputs before they reach the agents"""
+
+import hashlib
+import json
+import os
+from typing import Any, List, Optional, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from .tool_wrapper import ToolWrapper
+
+# Rough conversion used for budgeting; exact tokenization depends on the model.
+CHARS_PER_TOKEN = 4
+
+# Progressively tighter limits tried when summarizing structured output:
+# (items kept per list, characters kept per string, maximum nesting depth)
+_STRUCTURE_LIMITS = [
+    (20, 400, 6),
+    (10, 200, 5),
+    (5, 120, 4),
+    (3, 80, 3),
+    (1, 60, 2),
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a piece of text"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+class ArtifactStore:
+    """Keeps full tool outputs on disk so agents can fetch them by reference"""
+
+    def __init__(self, directory: str = "tool_artifacts"):
+        self.directory = directory
+
+    def save(self, tool_name: str, payload: str) -> str:
+        """Store a payload and return its artifact id"""
+        digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+        artifact_id = f"{tool_name}-{digest}"
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(artifact_id)
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(payload)
+        return artifact_id
+
+    def read(self, artifact_id: str) -> str:
+        """Load a stored payload"""
+        with open(self._path(artifact_id), encoding="utf-8") as f:
+            return f.read()
+
+    def _path(self, artifact_id: str) -> str:
+        # Artifact ids are generated by save(); never allow path traversal
+        safe_id = os.path.basename(artifact_id)
+        return os.path.join(self.directory, f"{safe_id}.txt")
+
+
+class OutputCompactor:
+    """
+    Enforces a per-call token budget on tool outputs.
+
+    Outputs within budget pass through untouched. Larger outputs are stored
+    in the artifact store and replaced by a deterministic summary: structured
+    (JSON) results keep their shape with lists and strings shortened, and
+    indented text such as accessibility trees loses its deepest levels first
+    before falling back to a head/tail cut.
+    """
+
+    def __init__(self, token_budget: int = 2000, store: Optional[ArtifactStore] = None):
+        self.token_budget = token_budget
+        self.store = store or ArtifactStore()
+
+    def compact(self, tool_name: str, output: Any) -> str:
+        """Return the output reduced to fit the token budget"""
+        text = output if isinstance(output, str) else json.dumps(output, default=str)
+        original_tokens = estimate_tokens(text)
+        if original_tokens <= self.token_budget:
+            return text
+
+        artifact_id = self.store.save(tool_name, text)
+        footer = (
+            f"\n[Output compacted from ~{original_tokens} tokens. "
+            f"Full output stored as artifact '{artifact_id}'; "
+            f"call read_tool_artifact to read it in pages.]"
+        )
+        char_budget = max(self.token_budget * CHARS_PER_TOKEN - len(footer), 200)
+
+        compacted = self._compact_structured(text, char_budget)
+        if compacted is None:
+            compacted = self._compact_text(text, char_budget)
+        return compacted + footer
+
+    def _compact_structured(self, text: str, char_budget: int) -> Optional[str]:
+        start = min((i for i in (text.find("{"), text.find("[")) if i >= 0), default=-1)
+        if start < 0:
+            return None
+        try:
+            data, end = json.JSONDecoder().raw_decode(text[start:])
+        except ValueError:
+            return None
+
+        prefix = text[:start]
+        suffix = text[start + end:]
+        for max_items, max_chars, max_depth in _STRUCTURE_LIMITS:
+            summary = _summarize(data, max_items, max_chars, max_depth)
+            candidate = prefix + json.dumps(summary, ensure_ascii=False) + suffix
+            if len(candidate) <= char_budget:
+                return candidate
+        return self._compact_text(candidate, char_budget)
+
+    def _compact_text(self, text: str, char_budget: int) -> str:
+        lines = text.splitlines()
+        total_lines = len(lines)
+        depths = sorted({_indent(line) for line in lines if line.strip()}, reverse=True)
+
+        # Drop the deepest indentation levels of tree-shaped output first
+        for depth in depths[:-1]:
+            if len(text) <= char_budget:
+                break
+            lines = [line for line in lines if not line.strip() or _indent(line) < depth]
+            text = "\n".join(lines) + f"\n... [{total_lines - len(lines)} nested lines omitted]"
+
+        if len(text) <= char_budget:
+            return text
+
+        head_budget = int(char_budget * 0.7)
+        tail_budget = char_budget - head_budget
+        head = text[:head_budget].rsplit("\n", 1)[0]
+        tail = text[-tail_budget:].split("\n", 1)[-1]
+        omitted = len(text) - len(head) - len(tail)
+        return f"{head}\n... [{omitted} characters omitted] ...\n{tail}"
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip())
+
+
+def _summarize(data: Any, max_items: int, max_chars: int, max_depth: int) -> Any:
+    """Shorten a JSON-compatible value while keeping its shape"""
+    if isinstance(data, str):
+        if len(data) > max_chars:
+            return data[:max_chars] + f"... (+{len(data) - max_chars} chars)"
+        return data
+    if max_depth <= 0 and isinstance(data, (dict, list)):
+        return f"<{type(data).__name__} with {len(data)} entries>"
+    if isinstance(data, list):
+        items = [_summarize(item, max_items, max_chars, max_depth - 1) for item in data[:max_items]]
+        if len(data) > max_items:
+            items.append(f"... ({len(data) - max_items} more items)")
+        return items
+    if isinstance(data, dict):
+        keys = list(data)
+        result = {
+            key: _summarize(data[key], max_items, max_chars, max_depth - 1)
+            for key in keys[:max_items * 2]
+        }
+        if len(keys) > max_items * 2:
+            result["..."] = f"{len(keys) - max_items * 2} more keys"
+        return result
+    return data
+
+
+class CompactedTool(ToolWrapper):
+    """Wraps a tool so its output is passed through an OutputCompactor"""
+
+    compactor: Any = Field(..., exclude=True)
+
+    def _run(self, **kwargs) -> str:
+        return self.compactor.compact(self.name, self._call_inner(**kwargs))
+
+
+def compact_tools(tools: List[BaseTool], compactor: OutputCompactor) -> List[BaseTool]:
+    """Wrap every tool in the list with output compaction"""
+    return [CompactedTool(tool, compactor=compactor) for tool in tools]
+
+
+class ReadArtifactInput(BaseModel):
+    """Input for Read Artifact tool"""
+    artifact_id: str = Field(..., description="Artifact id reported in a compacted tool output")
+    offset: int = Field(0, description="Character offset to start reading from")
+    limit: int = Field(4000, description="Maximum number of characters to return")
+
+
+class ReadArtifactTool(BaseTool):
+    name: str = "read_tool_artifact"
+    description: str = (
+        "Read the full output of an earlier tool call that was compacted. "
+        "Provide the artifact id and optionally an offset and limit to page through it."
+    )
+    args_schema: Type[BaseModel] = ReadArtifactInput
+    store: Any = Field(default_factory=ArtifactStore, exclude=True)
+
+    def _run(self, artifact_id: str, offset: int = 0, limit: int = 4000) -> str:
+        try:
+            payload = self.store.read(artifact_id)
+        except OSError:
+            return f"✗ Artifact not found: {artifact_id}"
+
+        chunk = payload[offset:offset + limit]
+        end = offset + len(chunk)
+        if end < len(payload):
+            return f"{chunk}\n[Characters {offset}-{end} of {len(payload)}; continue with offset={end}]"
+        return chunk
@@ -1,21 +1,65 @@
 """Playwright MCP integration tools for CrewAI agents"""
 
-from typing import Optional, Any, Dict, Type
-from crewai_tools import BaseTool
+from typing import Optional, Any, Callable, Dict, List, Type, TypeVar
+from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
+from concurrent.futures import Future, ThreadPoolExecutor
 import json
+import os
+import threading
+
+from .retry_policy import RetryPolicy, RetryError, describe_retries, describe_failure, is_timeout
+from .resource_monitor import RecyclePolicy, ResourceMonitor
+from .memoization import DOM_VERSION_SCRIPT
+from .tracing import TracingOptions
+
+T = TypeVar("T")
 
 
 # Shared browser context manager
 class BrowserManager:
-    """Manages a shared Playwright browser instance across tools"""
+    """
+    Manages a shared Playwright browser instance across tools.
+
+    Tools use the process-wide instance from `get_instance` unless they are
+    given their own manager, which is how concurrent sessions (matrix or
+    pipelined runs) each get a separate browser.
+
+    Playwright's sync API is bound to the thread that started it, so all
+    browser work runs on a dedicated browser thread and tools submit actions
+    to it with `run`. This also lets `warm_up` launch the browser in the
+    background: actions queue behind the warm-up and only block if it has
+    not finished yet.
+    """
 
     _instance = None
     _browser: Optional[Browser] = None
     _context: Optional[BrowserContext] = None
     _page: Optional[Page] = None
     _playwright = None
+    _executor: Optional[ThreadPoolExecutor] = None
+    _thread_id: Optional[int] = None
+    _warmup: Optional[Future] = None
+    _monitor: Optional[ResourceMonitor] = None
+    # (title, path) of the open trace chunk
+    _trace_chunk: Optional[tuple] = None
+    retry_policy: RetryPolicy = RetryPolicy()
+    recycle_policy: RecyclePolicy = RecyclePolicy()
+    context_options: Dict[str, Any] = {'viewport': {'width': 1280, 'height': 720}}
+
+    def __init__(self, browser: str = "chromium", headless: bool = True, tracing: Optional[TracingOptions] = None):
+        """
+        Args:
+            browser: Browser type - chromium, firefox, webkit (default: chromium)
+            headless: Run browser in headless mode (default: True)
+            tracing: Record a Playwright trace in every context, saved in
+                chunks with start_trace_chunk / stop_trace_chunk (default: off)
+        """
+        self.browser_type = browser
+        self.headless = headless
+        self.tracing = tracing
+        self._trace_parts: List[str] = []
 
     @classmethod
     def get_instance(cls):
@@ -23,43 +67,290 @@ class BrowserManager:
             cls._instance = cls()
         return cls._instance
 
+    def _submit(self, fn: Callable[[], T]) -> "Future[T]":
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="playwright",
+                initializer=self._register_thread
+            )
+        return self._executor.submit(fn)
+
+    def _register_thread(self):
+        self._thread_id = threading.get_ident()
+
+    def _on_browser_thread(self) -> bool:
+        return threading.get_ident() == self._thread_id
+
+    @property
+    def monitor(self) -> ResourceMonitor:
+        if self._monitor is None:
+            self._monitor = ResourceMonitor(self.recycle_policy)
+        return self._monitor
+
+    def run(self, action: Callable[[Page], T]) -> T:
+        """Run an action against the page on the browser thread and return its result"""
+        def call() -> T:
+            page = self.get_page()
+            try:
+                return action(page)
+            finally:
+                self.monitor.record_operation(page)
+
+        if self._on_browser_thread():
+            return call()
+        return self._submit(call).result()
+
+    def warm_up(self, url: Optional[str] = None) -> Future:
+        """
+        Launch the browser in the background, optionally pre-navigating to a URL.
+
+        Returns immediately; tool actions submitted afterwards wait for the
+        warm-up to finish. A failed warm-up is not fatal: the first action
+        starts the browser again if needed.
+        """
+        def start():
+            page = self.get_page()
+            if url:
+                page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+        self._warmup = self._submit(start)
+        return self._warmup
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until a pending warm-up has finished; True if the browser is up"""
+        if self._warmup is not None:
+            try:
+                self._warmup.result(timeout=timeout)
+            except Exception:
+                pass
+        return self._page is not None
+
     def get_page(self) -> Page:
-        """Get or create the browser page"""
+        """Get or create the browser page (browser thread only)"""
         if self._page is None:
             self.start_browser()
         return self._page
 
     def start_browser(self):
         """Start the Playwright browser"""
+        if not self._on_browser_thread():
+            return self._submit(self.start_browser).result()
         if self._playwright is None:
             self._playwright = sync_playwright().start()
-            self._browser = self._playwright.chromium.launch(headless=True)
-            self._context = self._browser.new_context(
-                viewport={'width': 1280, 'height': 720}
-            )
-            self._page = self._context.new_page()
+            self._browser = getattr(self._playwright, self.browser_type).launch(headless=self.headless)
+            self.monitor.root_pid = _driver_pid(self._playwright)
+            self._new_context()
+
+    def _new_context(self, storage_state: Optional[Dict[str, Any]] = None):
+        options = dict(self.context_options)
+        if storage_state is not None:
+            options['storage_state'] = storage_state
+        self._context = self._browser.new_context(**options)
+        if self.tracing is not None:
+            self._context.tracing.start(**self.tracing.start_options())
+            if self._trace_chunk is not None:
+                # A case that spans a context reset or recycle continues in a new part
+                self._context.tracing.start_chunk(title=self._trace_chunk[0])
+        self._page = self._context.new_page()
+
+    def _close_context(self):
+        """Close the context, saving an open trace chunk as a part of its case"""
+        if self._trace_chunk is not None:
+            path = self._trace_chunk[1]
+            part = f"{os.path.splitext(path)[0]}.part{len(self._trace_parts) + 1}.zip"
+            try:
+                os.makedirs(os.path.dirname(part) or ".", exist_ok=True)
+                self._context.tracing.stop_chunk(path=part)
+                self._trace_parts.append(part)
+            except Exception:
+                pass
+        self._context.close()
+
+    def reset_context(self):
+        """
+        Discard the browser context and open a fresh page on the running browser.
+
+        Drops cookies, storage, service workers and open pages of the previous
+        scenario without paying for a browser relaunch. Starts the browser if
+        it is not running yet.
+        """
+        if not self._on_browser_thread():
+            return self._submit(self.reset_context).result()
+        if self._browser is None:
+            return self.start_browser()
+        if self._context:
+            self._close_context()
+        self._page = None
+        self._context = None
+        self._new_context()
+        self.monitor.context_reset()
+
+    def recycle_if_needed(self) -> Optional[str]:
+        """
+        Recycle the context if the resource monitor exceeded a threshold.
+
+        Cookies and local storage are carried over to the new context, so a
+        logged-in session survives; leaked JS heap, DOM and listeners do not.
+        Called before navigations, where no in-page state is lost.
+
+        Returns:
+            The recycle reason, or None if no recycle was needed
+        """
+        if not self._on_browser_thread():
+            return self._submit(self.recycle_if_needed).result()
+        reason = self.monitor.pending_reason
+        if reason is None or self._context is None:
+            return None
+        storage_state = self._context.storage_state()
+        self._close_context()
+        self._page = None
+        self._context = None
+        self._new_context(storage_state=storage_state)
+        self.monitor.context_recycled(reason)
+        return reason
+
+    def resource_metrics(self) -> Dict[str, Any]:
+        """Resource usage and recycle history, with a fresh sample if the browser is up"""
+        if self._page is not None:
+            if self._on_browser_thread():
+                self.monitor.sample(self._page)
+            else:
+                self._submit(lambda: self.monitor.sample(self._page)).result()
+        return self.monitor.metrics()
 
     def close_browser(self):
-        """Close the browser and cleanup"""
+        """
+        Close the browser and cleanup.
+
+        Meant for shutdown; use reset_context between scenarios.
+        """
+        if self._executor is not None and not self._on_browser_thread():
+            return self._submit(self.close_browser).result()
         if self._page:
             self._page.close()
             self._page = None
         if self._context:
-            self._context.close()
+            self._close_context()
             self._context = None
+        self._trace_chunk = None
         if self._browser:
             self._browser.close()
             self._browser = None
         if self._playwright:
             self._playwright.stop()
             self._playwright = None
+            self.monitor.root_pid = None
+        self._warmup = None
+        self.monitor.context_reset()
+
+    def shutdown(self):
+        """Close the browser and stop the browser thread"""
+        self.close_browser()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._thread_id = None
+
+    def start_trace_chunk(self, title: str, path: str):
+        """
+        Start recording a trace chunk, e.g. for one test case.
+
+        An open chunk is discarded. Starts the browser if needed.
+        """
+        if not self._on_browser_thread():
+            return self._submit(lambda: self.start_trace_chunk(title, path)).result()
+        if self.tracing is None:
+            raise RuntimeError("Tracing is not enabled for this browser")
+        self.get_page()
+        if self._trace_chunk is not None:
+            self.stop_trace_chunk(keep=False)
+        self._context.tracing.start_chunk(title=title)
+        self._trace_chunk = (title, path)
+        self._trace_parts = []
+
+    def stop_trace_chunk(self, keep: bool) -> List[str]:
+        """
+        Stop the open chunk. Kept chunks are written to the path given at
+        start; discarded ones never touch the disk.
+
+        Returns:
+            The trace files of the chunk (parts from earlier contexts first),
+            or an empty list if it was discarded or none was open
+        """
+        if not self._on_browser_thread():
+            return self._submit(lambda: self.stop_trace_chunk(keep)).result()
+        if self._trace_chunk is None:
+            return []
+        _, path = self._trace_chunk
+        parts, self._trace_parts = self._trace_parts, []
+        self._trace_chunk = None
+        if self._context is not None:
+            if keep:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                self._context.tracing.stop_chunk(path=path)
+                parts.append(path)
+            else:
+                self._context.tracing.stop_chunk()
+        if keep:
+            return parts
+        for part in parts:
+            try:
+                os.remove(part)
+            except OSError:
+                pass
+        return []
 
     def get_current_url(self) -> str:
         """Get current page URL"""
         if self._page:
-            return self._page.url
+            return self.run(lambda page: page.url)
         return ""
 
+    def dom_version(self) -> str:
+        """
+        Token that changes whenever the page's DOM mutates or a new document
+        loads. Used to validate memoized reads; not counted as an operation.
+        """
+        if self._on_browser_thread():
+            return self.get_page().evaluate(DOM_VERSION_SCRIPT)
+        return self._submit(lambda: self.get_page().evaluate(DOM_VERSION_SCRIPT)).result()
+
+    def set_retry_policy(self, policy: RetryPolicy):
+        """Replace the retry policy used by interaction tools"""
+        self.retry_policy = policy
+
+    def set_recycle_policy(self, policy: RecyclePolicy):
+        """Replace the thresholds that trigger context recycling"""
+        self.recycle_policy = policy
+        self.monitor.policy = policy
+
+
+def _driver_pid(playwright: Any) -> Optional[int]:
+    """
+    Pid of the Playwright driver process of a manager. The browser it
+    launched runs below it, apart from other managers' browsers and MCP
+    servers. Read from Playwright internals; None if they change.
+    """
+    try:
+        return playwright._impl_obj._connection._transport._proc.pid
+    except AttributeError:
+        return None
+
+
+class PlaywrightTool(BaseTool):
+    """Base class for native tools; runs against its own manager or the shared one"""
+
+    browser_manager: Optional[Any] = Field(None, exclude=True, description="BrowserManager to use")
+
+    def _manager(self) -> BrowserManager:
+        return self.browser_manager or BrowserManager.get_instance()
+
+
+def _wait_actionable(page: Page, selector: str, timeout: int, state: str = "visible"):
+    """Wait until the selector reaches the given state within the attempt's timeout"""
+    return page.wait_for_selector(selector, state=state, timeout=timeout)
+
 
 # Input schemas for tools
 class NavigateInput(BaseModel):
@@ -115,8 +406,25 @@ class VerifyElementInput(BaseModel):
     should_be_visible: bool = Field(True, description="Whether element should be visible")
 
 
+class PressKeyInput(BaseModel):
+    """Input for Press Key tool"""
+    key: str = Field(..., description="Key or combination to press, e.g. 'Enter', 'Escape', 'Control+A'")
+    selector: Optional[str] = Field(None, description="CSS selector of the element to focus first")
+
+
+class SelectOptionInput(BaseModel):
+    """Input for Select Option tool"""
+    selector: str = Field(..., description="CSS selector of the select element")
+    values: List[str] = Field(..., description="Values or visible labels of the options to select")
+
+
+class HoverInput(BaseModel):
+    """Input for Hover tool"""
+    selector: str = Field(..., description="CSS selector of the element to hover")
+
+
 # Tool implementations
-class NavigateTool(BaseTool):
+class NavigateTool(PlaywrightTool):
     name: str = "navigate_to_url"
     description: str = (
         "Navigate the browser to a specific URL. "
@@ -126,15 +434,21 @@ class NavigateTool(BaseTool):
 
     def _run(self, url: str) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
-            page = browser_manager.get_page()
-            page.goto(url, wait_until="networkidle", timeout=30000)
-            return f"✓ Successfully navigated to: {url}"
+            browser_manager = self._manager()
+            recycled = browser_manager.recycle_if_needed()
+
+            def navigate(page: Page) -> str:
+                page.goto(url, wait_until="networkidle", timeout=30000)
+                if recycled:
+                    return f"✓ Successfully navigated to: {url} (browser context recycled: {recycled})"
+                return f"✓ Successfully navigated to: {url}"
+
+            return browser_manager.run(navigate)
         except Exception as e:
             return f"✗ Navigation failed: {str(e)}"
 
 
-class ClickTool(BaseTool):
+class ClickTool(PlaywrightTool):
     name: str = "click_element"
     description: str = (
         "Click on an element on the page. "
@@ -145,22 +459,31 @@ class ClickTool(BaseTool):
 
     def _run(self, selector: str, by_text: bool = False) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
-            page = browser_manager.get_page()
+            browser_manager = self._manager()
 
-            if by_text:
-                # Click by text content
-                page.get_by_text(selector).click()
-            else:
-                # Click by CSS selector
-                page.click(selector)
+            def click_element(page: Page) -> str:
+                policy = browser_manager.retry_policy
 
-            return f"✓ Successfully clicked: {selector}"
+                if by_text:
+                    # Click by text content
+                    target = page.get_by_text(selector)
+                else:
+                    # Click by CSS selector
+                    target = page.locator(selector).first
+
+                def click(timeout: int):
+                    target.wait_for(state="visible", timeout=timeout)
+                    target.click(timeout=timeout)
+
+                _, retries = policy.execute(click)
+                return f"✓ Successfully clicked: {selector}{describe_retries(retries)}"
+
+            return browser_manager.run(click_element)
         except Exception as e:
-            return f"✗ Click failed: {str(e)}"
+            return f"✗ Click failed: {describe_failure(e)}"
 
 
-class TypeTool(BaseTool):
+class TypeTool(PlaywrightTool):
     name: str = "type_text"
     description: str = (
         "Type text into an input field. "
@@ -171,19 +494,27 @@ class TypeTool(BaseTool):
 
     def _run(self, selector: str, text: str, press_enter: bool = False) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
-            page = browser_manager.get_page()
+            browser_manager = self._manager()
+
+            def type_text(page: Page) -> str:
+                policy = browser_manager.retry_policy
+
+                def fill(timeout: int):
+                    _wait_actionable(page, selector, timeout)
+                    page.fill(selector, text, timeout=timeout)
+
+                _, retries = policy.execute(fill)
+                if press_enter:
+                    page.press(selector, "Enter")
 
-            page.fill(selector, text)
-            if press_enter:
-                page.press(selector, "Enter")
+                return f"✓ Successfully typed '{text}' into: {selector}{describe_retries(retries)}"
 
-            return f"✓ Successfully typed '{text}' into: {selector}"
+            return browser_manager.run(type_text)
         except Exception as e:
-            return f"✗ Type failed: {str(e)}"
+            return f"✗ Type failed: {describe_failure(e)}"
 
 
-class SnapshotTool(BaseTool):
+class SnapshotTool(PlaywrightTool):
     name: str = "take_snapshot"
     description: str = (
         "Take an accessibility snapshot of the current page. "
@@ -193,32 +524,27 @@ class SnapshotTool(BaseTool):
 
     def _run(self, save_to_file: bool = False) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
-            page = browser_manager.get_page()
-
-            # Get page content
-            content = page.content()
-            title = page.title()
-            url = page.url
-
-            snapshot = {
-                "url": url,
-                "title": title,
-                "content_length": len(content),
-                "timestamp": "now"
-            }
-
-            if save_to_file:
-                with open("page_snapshot.json", "w") as f:
-                    json.dump(snapshot, f, indent=2)
-                return f"✓ Snapshot saved to page_snapshot.json\nURL: {url}\nTitle: {title}"
-
-            return f"✓ Snapshot captured\nURL: {url}\nTitle: {title}"
+            browser_manager = self._manager()
+
+            def snapshot(page: Page) -> str:
+                # The ARIA tree carries roles, names and states the agents can target;
+                # large pages are left to output compaction rather than cut here
+                tree = page.locator("body").aria_snapshot()
+                header = f"URL: {page.url}\nTitle: {page.title()}"
+
+                if save_to_file:
+                    with open("page_snapshot.yaml", "w") as f:
+                        f.write(tree)
+                    return f"✓ Snapshot saved to page_snapshot.yaml\n{header}"
+
+                return f"✓ Snapshot captured\n{header}\nSnapshot:\n```yaml\n{tree}\n```"
+
+            return browser_manager.run(snapshot)
         except Exception as e:
             return f"✗ Snapshot failed: {str(e)}"
 
 
-class ScreenshotTool(BaseTool):
+class ScreenshotTool(PlaywrightTool):
     name: str = "take_screenshot"
     description: str = (
         "Take a screenshot of the current page. "
@@ -228,20 +554,23 @@ class ScreenshotTool(BaseTool):
 
     def _run(self, filename: Optional[str] = None, full_page: bool = False) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
-            page = browser_manager.get_page()
-
+            browser_manager = self._manager()
             if filename is None:
                 import time
-                filename = f"screenshot_{int(time.time())}.png"
+                path = f"screenshot_{int(time.time())}.png"
+            else:
+                path = filename
 
-            page.screenshot(path=filename, full_page=full_page)
-            return f"✓ Screenshot saved to: {filename}"
+            def screenshot(page: Page) -> str:
+                page.screenshot(path=path, full_page=full_page)
+                return f"✓ Screenshot saved to: {path}"
+
+            return browser_manager.run(screenshot)
         except Exception as e:
             return f"✗ Screenshot failed: {str(e)}"
 
 
-class FillFormTool(BaseTool):
+class FillFormTool(PlaywrightTool):
     name: str = "fill_form"
     description: str = (
         "Fill multiple form fields at once. "
@@ -252,20 +581,28 @@ class FillFormTool(BaseTool):
 
     def _run(self, form_data: Dict[str, str]) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
-            page = browser_manager.get_page()
+            browser_manager = self._manager()
+
+            def fill_form(page: Page) -> str:
+                policy = browser_manager.retry_policy
+
+                results = []
+                for selector, value in form_data.items():
+                    def fill(timeout: int):
+                        _wait_actionable(page, selector, timeout)
+                        page.fill(selector, value, timeout=timeout)
 
-            results = []
-            for selector, value in form_data.items():
-                page.fill(selector, value)
-                results.append(f"  • Filled {selector}")
+                    _, retries = policy.execute(fill)
+                    results.append(f"  • Filled {selector}{describe_retries(retries)}")
 
-            return "✓ Form filled successfully:\n" + "\n".join(results)
+                return "✓ Form filled successfully:\n" + "\n".join(results)
+
+            return browser_manager.run(fill_form)
         except Exception as e:
-            return f"✗ Form fill failed: {str(e)}"
+            return f"✗ Form fill failed: {describe_failure(e)}"
 
 
-class WaitForTool(BaseTool):
+class WaitForTool(PlaywrightTool):
     name: str = "wait_for_element"
     description: str = (
         "Wait for an element to appear, disappear, or reach a certain state. "
@@ -275,20 +612,22 @@ class WaitForTool(BaseTool):
 
     def _run(self, selector: Optional[str] = None, timeout: int = 5000, state: str = "visible") -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
-            page = browser_manager.get_page()
+            browser_manager = self._manager()
 
-            if selector:
-                page.wait_for_selector(selector, timeout=timeout, state=state)
-                return f"✓ Element {selector} reached state: {state}"
-            else:
-                page.wait_for_timeout(timeout)
-                return f"✓ Waited for {timeout}ms"
+            def wait(page: Page) -> str:
+                if selector:
+                    page.wait_for_selector(selector, timeout=timeout, state=state)
+                    return f"✓ Element {selector} reached state: {state}"
+                else:
+                    page.wait_for_timeout(timeout)
+                    return f"✓ Waited for {timeout}ms"
+
+            return browser_manager.run(wait)
         except Exception as e:
             return f"✗ Wait failed: {str(e)}"
 
 
-class EvaluateTool(BaseTool):
+class EvaluateTool(PlaywrightTool):
     name: str = "evaluate_javascript"
     description: str = (
         "Execute JavaScript code on the page and return the result. "
@@ -298,16 +637,21 @@ class EvaluateTool(BaseTool):
 
     def _run(self, script: str) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
-            page = browser_manager.get_page()
+            browser_manager = self._manager()
 
-            result = page.evaluate(script)
-            return f"✓ Script executed successfully\nResult: {result}"
+            def evaluate(page: Page) -> str:
+                result = page.evaluate(script)
+                if isinstance(result, (dict, list)):
+                    # Serialize structured results as JSON so they can be compacted by shape
+                    result = json.dumps(result, default=str)
+                return f"✓ Script executed successfully\nResult: {result}"
+
+            return browser_manager.run(evaluate)
         except Exception as e:
             return f"✗ Script execution failed: {str(e)}"
 
 
-class VerifyElementTool(BaseTool):
+class VerifyElementTool(PlaywrightTool):
     name: str = "verify_element"
     description: str = (
         "Verify that an element exists and optionally check its text content and visibility. "
@@ -317,46 +661,57 @@ class VerifyElementTool(BaseTool):
 
     def _run(self, selector: str, expected_text: Optional[str] = None, should_be_visible: bool = True) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
-            page = browser_manager.get_page()
-
-            # Check if element exists
-            element = page.query_selector(selector)
-            if not element:
-                return f"✗ Element not found: {selector}"
-
-            # Check visibility
-            is_visible = element.is_visible()
-            if should_be_visible and not is_visible:
-                return f"✗ Element exists but is not visible: {selector}"
-            if not should_be_visible and is_visible:
-                return f"✗ Element exists but should not be visible: {selector}"
-
-            # Check text content if provided
-            if expected_text:
-                actual_text = element.text_content()
-                if expected_text not in actual_text:
-                    return f"✗ Text mismatch. Expected: '{expected_text}', Got: '{actual_text}'"
-
-            return f"✓ Element verified successfully: {selector}"
+            browser_manager = self._manager()
+
+            def verify(page: Page) -> str:
+                policy = browser_manager.retry_policy
+
+                # Check if element exists, giving late-rendered content a chance to attach
+                try:
+                    element, retries = policy.execute(
+                        lambda timeout: _wait_actionable(page, selector, timeout, state="attached")
+                    )
+                except RetryError as e:
+                    if not is_timeout(e.error) and not policy.is_retryable(e.error):
+                        raise
+                    return f"✗ Element not found: {selector}{describe_retries(e.attempts - 1)}"
+                if not element:
+                    return f"✗ Element not found: {selector}"
+
+                # Check visibility
+                is_visible = element.is_visible()
+                if should_be_visible and not is_visible:
+                    return f"✗ Element exists but is not visible: {selector}"
+                if not should_be_visible and is_visible:
+                    return f"✗ Element exists but should not be visible: {selector}"
+
+                # Check text content if provided
+                if expected_text:
+                    actual_text = element.text_content()
+                    if expected_text not in actual_text:
+                        return f"✗ Text mismatch. Expected: '{expected_text}', Got: '{actual_text}'"
+
+                return f"✓ Element verified successfully: {selector}{describe_retries(retries)}"
+
+            return browser_manager.run(verify)
         except Exception as e:
-            return f"✗ Verification failed: {str(e)}"
+            return f"✗ Verification failed: {describe_failure(e)}"
 
 
-class GetCurrentUrlTool(BaseTool):
+class GetCurrentUrlTool(PlaywrightTool):
     name: str = "get_current_url"
     description: str = "Get the current URL of the browser page"
 
     def _run(self) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
+            browser_manager = self._manager()
             url = browser_manager.get_current_url()
             return f"Current URL: {url}"
         except Exception as e:
             return f"✗ Failed to get URL: {str(e)}"
 
 
-class GetPageTextTool(BaseTool):
+class GetPageTextTool(PlaywrightTool):
     name: str = "get_page_text"
     description: str = (
         "Get all visible text content from the current page. "
@@ -365,28 +720,156 @@ class GetPageTextTool(BaseTool):
 
     def _run(self) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
-            page = browser_manager.get_page()
+            browser_manager = self._manager()
+
+            def page_text(page: Page) -> str:
+                text = page.evaluate("() => document.body.innerText")
+                return f"Page text content:\n{text}"
 
-            text = page.evaluate("() => document.body.innerText")
-            return f"Page text content:\n{text[:1000]}..." if len(text) > 1000 else f"Page text content:\n{text}"
+            return browser_manager.run(page_text)
         except Exception as e:
             return f"✗ Failed to get page text: {str(e)}"
 
 
-class CloseBrowserTool(BaseTool):
+class PressKeyTool(PlaywrightTool):
+    name: str = "press_key"
+    description: str = (
+        "Press a key or key combination, optionally on a specific element. "
+        "Useful for submitting with Enter, closing dialogs with Escape or keyboard navigation."
+    )
+    args_schema: Type[BaseModel] = PressKeyInput
+
+    def _run(self, key: str, selector: Optional[str] = None) -> str:
+        try:
+            browser_manager = self._manager()
+
+            def press(page: Page) -> str:
+                if selector:
+                    policy = browser_manager.retry_policy
+                    _, retries = policy.execute(lambda timeout: page.press(selector, key, timeout=timeout))
+                    return f"✓ Pressed {key} on {selector}{describe_retries(retries)}"
+                page.keyboard.press(key)
+                return f"✓ Pressed {key}"
+
+            return browser_manager.run(press)
+        except Exception as e:
+            return f"✗ Key press failed: {describe_failure(e)}"
+
+
+class SelectOptionTool(PlaywrightTool):
+    name: str = "select_option"
+    description: str = "Select one or more options in a dropdown (select element) by value or label."
+    args_schema: Type[BaseModel] = SelectOptionInput
+
+    def _run(self, selector: str, values: List[str]) -> str:
+        try:
+            browser_manager = self._manager()
+
+            def select(page: Page) -> str:
+                policy = browser_manager.retry_policy
+
+                def select_values(timeout: int):
+                    _wait_actionable(page, selector, timeout)
+                    try:
+                        return page.select_option(selector, values, timeout=timeout)
+                    except Exception:
+                        # Fall back to matching the visible labels
+                        labels = [{'label': value} for value in values]
+                        return page.select_option(selector, labels, timeout=timeout)
+
+                selected, retries = policy.execute(select_values)
+                return f"✓ Selected {', '.join(selected)} in {selector}{describe_retries(retries)}"
+
+            return browser_manager.run(select)
+        except Exception as e:
+            return f"✗ Select failed: {describe_failure(e)}"
+
+
+class HoverTool(PlaywrightTool):
+    name: str = "hover_element"
+    description: str = "Move the mouse over an element, e.g. to open menus or show tooltips."
+    args_schema: Type[BaseModel] = HoverInput
+
+    def _run(self, selector: str) -> str:
+        try:
+            browser_manager = self._manager()
+
+            def hover(page: Page) -> str:
+                policy = browser_manager.retry_policy
+                _, retries = policy.execute(lambda timeout: page.hover(selector, timeout=timeout))
+                return f"✓ Hovered: {selector}{describe_retries(retries)}"
+
+            return browser_manager.run(hover)
+        except Exception as e:
+            return f"✗ Hover failed: {describe_failure(e)}"
+
+
+class GoBackTool(PlaywrightTool):
+    name: str = "go_back"
+    description: str = "Navigate back to the previous page in the browser history."
+
+    def _run(self) -> str:
+        try:
+            browser_manager = self._manager()
+
+            def go_back(page: Page) -> str:
+                response = page.go_back(wait_until="networkidle", timeout=30000)
+                if response is None and page.url in ("", "about:blank"):
+                    return "✗ No previous page in history"
+                return f"✓ Navigated back to: {page.url}"
+
+            return browser_manager.run(go_back)
+        except Exception as e:
+            return f"✗ Go back failed: {str(e)}"
+
+
+class ResetBrowserContextTool(PlaywrightTool):
+    name: str = "reset_browser_context"
+    description: str = (
+        "Start a clean browser session: clears cookies, storage and open pages "
+        "while keeping the browser running. Use this between test scenarios."
+    )
+
+    def _run(self) -> str:
+        try:
+            browser_manager = self._manager()
+            browser_manager.reset_context()
+            return "✓ Browser context reset"
+        except Exception as e:
+            return f"✗ Failed to reset browser context: {str(e)}"
+
+
+class CloseBrowserTool(PlaywrightTool):
     name: str = "close_browser"
-    description: str = "Close the browser and cleanup resources. Use this at the end of testing."
+    description: str = (
+        "Close the browser and cleanup resources. "
+        "Only use this when no further testing will happen; use reset_browser_context between scenarios."
+    )
 
     def _run(self) -> str:
         try:
-            browser_manager = BrowserManager.get_instance()
+            browser_manager = self._manager()
             browser_manager.close_browser()
             return "✓ Browser closed successfully"
         except Exception as e:
             return f"✗ Failed to close browser: {str(e)}"
 
 
+def native_tools(browser_manager: Optional[BrowserManager] = None) -> List[BaseTool]:
+    """
+    The native tool set for agents, bound to one browser manager.
+
+    CloseBrowserTool is left out: the session owner closes the browser, and
+    agents closing it mid-run only forces a relaunch.
+    """
+    tool_classes = [
+        NavigateTool, ClickTool, TypeTool, SnapshotTool, ScreenshotTool, FillFormTool,
+        WaitForTool, EvaluateTool, VerifyElementTool, GetCurrentUrlTool, GetPageTextTool,
+        PressKeyTool, SelectOptionTool, HoverTool, GoBackTool, ResetBrowserContextTool,
+    ]
+    return [tool_class(browser_manager=browser_manager) for tool_class in tool_classes]
+
+
 # Export all tools
 __all__ = [
     "NavigateTool",
@@ -400,6 +883,13 @@ __all__ = [
     "VerifyElementTool",
     "GetCurrentUrlTool",
     "GetPageTextTool",
+    "PressKeyTool",
+    "SelectOptionTool",
+    "HoverTool",
+    "GoBackTool",
+    "ResetBrowserContextTool",
     "CloseBrowserTool",
-    "BrowserManager"
+    "BrowserManager",
+    "PlaywrightTool",
+    "native_tools"
 ]
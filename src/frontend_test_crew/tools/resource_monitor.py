@@ -0,0 +1,180 @@
+"""Browser resource monitoring and context recycling thresholds"""
+
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+# One round trip for both page-level metrics; performance.memory is Chromium-only
+_PAGE_METRICS_SCRIPT = """() => ({
+    jsHeap: (performance.memory && performance.memory.usedJSHeapSize) || null,
+    domNodes: document.getElementsByTagName('*').length
+})"""
+
+
+class RecyclePolicy(BaseModel):
+    """Thresholds after which the browser context is recycled. None disables a limit."""
+
+    max_js_heap_mb: Optional[float] = Field(512, description="Used JS heap of the page")
+    max_dom_nodes: Optional[int] = Field(50000, description="Element count of the page")
+    max_rss_mb: Optional[float] = Field(3072, description="Resident memory of the browser's processes")
+    max_operations: Optional[int] = Field(500, description="Tool operations run in one context")
+    sample_every: int = Field(10, description="Operations between two metric samples")
+
+
+class ResourceSample(BaseModel):
+    """A point-in-time measurement of the browser"""
+    timestamp: float
+    operations: int
+    js_heap_mb: Optional[float] = None
+    dom_nodes: Optional[int] = None
+    rss_mb: Optional[float] = None
+
+
+class ResourceMonitor:
+    """
+    Tracks page and browser resource usage and decides when to recycle.
+
+    Sampling is cheap (one evaluate plus reading /proc) and only happens every
+    `sample_every` operations. Once a threshold is exceeded the monitor keeps
+    a pending recycle reason until the owner recycles the context.
+
+    RSS covers the process tree below `root_pid`, which the owner sets to its
+    own Playwright driver, so other browsers and MCP servers of the same
+    process are not counted. Without a root pid RSS is not sampled.
+    """
+
+    def __init__(self, policy: Optional[RecyclePolicy] = None, history: int = 50):
+        self.policy = policy or RecyclePolicy()
+        self.history = history
+        self.root_pid: Optional[int] = None
+        self.context_operations = 0
+        self.total_operations = 0
+        self.recycles: List[Dict[str, Any]] = []
+        self.samples: List[ResourceSample] = []
+        self.peak: Dict[str, float] = {}
+        self.pending_reason: Optional[str] = None
+
+    def record_operation(self, page: Any):
+        """Count an operation on the current context and sample when due"""
+        self.context_operations += 1
+        self.total_operations += 1
+        limit = self.policy.max_operations
+        if limit is not None and self.context_operations >= limit:
+            self.pending_reason = f"{self.context_operations} operations >= {limit}"
+        elif self.policy.sample_every > 0 and self.context_operations % self.policy.sample_every == 0:
+            self.check(self.sample(page))
+
+    def sample(self, page: Any) -> ResourceSample:
+        """Measure the page and the browser's processes"""
+        js_heap_mb = dom_nodes = None
+        try:
+            metrics = page.evaluate(_PAGE_METRICS_SCRIPT)
+            if metrics.get("jsHeap"):
+                js_heap_mb = round(metrics["jsHeap"] / 1024 / 1024, 1)
+            dom_nodes = metrics.get("domNodes")
+        except Exception:
+            # The page may be navigating; skip page metrics for this sample
+            pass
+
+        sample = ResourceSample(
+            timestamp=time.time(),
+            operations=self.context_operations,
+            js_heap_mb=js_heap_mb,
+            dom_nodes=dom_nodes,
+            rss_mb=process_tree_rss_mb(self.root_pid) if self.root_pid else None,
+        )
+        self.samples = (self.samples + [sample])[-self.history:]
+        for key in ("js_heap_mb", "dom_nodes", "rss_mb"):
+            value = getattr(sample, key)
+            if value is not None:
+                self.peak[key] = max(self.peak.get(key, 0), value)
+        return sample
+
+    def check(self, sample: ResourceSample) -> Optional[str]:
+        """Set and return the recycle reason if the sample exceeds a threshold"""
+        limits = [
+            ("js_heap_mb", self.policy.max_js_heap_mb, "MB JS heap"),
+            ("dom_nodes", self.policy.max_dom_nodes, "DOM nodes"),
+            ("rss_mb", self.policy.max_rss_mb, "MB RSS"),
+        ]
+        for key, limit, unit in limits:
+            value = getattr(sample, key)
+            if limit is not None and value is not None and value > limit:
+                self.pending_reason = f"{value} {unit} > {limit}"
+                break
+        return self.pending_reason
+
+    def context_recycled(self, reason: str):
+        """Log a threshold-triggered recycle and reset the per-context counters"""
+        self.recycles.append({
+            "timestamp": time.time(),
+            "operations": self.context_operations,
+            "reason": reason,
+        })
+        self.context_reset()
+
+    def context_reset(self):
+        """Reset the per-context counters after the context was replaced"""
+        self.context_operations = 0
+        self.pending_reason = None
+
+    def metrics(self) -> Dict[str, Any]:
+        """Summary suitable for inclusion in run results"""
+        return {
+            "total_operations": self.total_operations,
+            "context_operations": self.context_operations,
+            "contexts_recycled": len(self.recycles),
+            "recycles": list(self.recycles),
+            "peak": dict(self.peak),
+            "last_sample": self.samples[-1].model_dump() if self.samples else None,
+        }
+
+
+def child_processes_rss_mb(root_pid: Optional[int] = None) -> Optional[float]:
+    """
+    Resident memory of all descendants of a process (by default this one:
+    every Playwright driver, browser and MCP server it started), read from /proc.
+
+    Returns None where /proc is not available.
+    """
+    return _tree_rss_mb(root_pid or os.getpid(), include_root=False)
+
+
+def process_tree_rss_mb(root_pid: int) -> Optional[float]:
+    """
+    Resident memory of a process and its descendants, read from /proc.
+
+    Returns None where /proc is not available or the process is gone.
+    """
+    return _tree_rss_mb(root_pid, include_root=True)
+
+
+def _tree_rss_mb(root_pid: int, include_root: bool) -> Optional[float]:
+    try:
+        pids = [int(entry) for entry in os.listdir("/proc") if entry.isdigit()]
+    except OSError:
+        return None
+
+    children: Dict[int, List[int]] = {}
+    rss_pages: Dict[int, int] = {}
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                # The command name may contain spaces; fields resume after the last ')'
+                fields = f.read().rsplit(")", 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(pid)
+            rss_pages[pid] = int(fields[21])
+        except (OSError, IndexError, ValueError):
+            continue
+
+    if include_root and root_pid not in rss_pages:
+        return None
+    total = 0
+    stack = [root_pid] if include_root else list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        total += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return round(total * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024, 1)
@@ -0,0 +1,123 @@
+"""Retry and auto-wait policy for Playwright tool actions"""
+
+import time
+from typing import Callable, Tuple, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+# Error fragments that indicate a transient condition (SPA re-render swapping
+# the element, an overlay fading out, a navigation replacing the page) which
+# is likely to clear on its own. Visibility, stability and enabled state are
+# already awaited by Playwright's actionability checks, so failing those ends
+# in a timeout, which is not retried.
+RETRYABLE_ERROR_PATTERNS: Tuple[str, ...] = (
+    "not attached",
+    "detached",
+    "intercepts pointer events",
+    "execution context was destroyed",
+)
+
+# Error fragments that will fail the same way on every attempt.
+NON_RETRYABLE_ERROR_PATTERNS: Tuple[str, ...] = (
+    "is not a valid selector",
+    "unexpected token",
+    "syntaxerror",
+    "strict mode violation",
+    "target page, context or browser has been closed",
+    "browser has been closed",
+)
+
+
+def is_timeout(error: Exception) -> bool:
+    """Whether the error is an actionability or wait timeout"""
+    message = str(error).lower()
+    return type(error).__name__ == "TimeoutError" or ("timeout" in message and "exceeded" in message)
+
+
+class RetryError(Exception):
+    """Raised when an action keeps failing after the policy gave up"""
+
+    def __init__(self, error: Exception, attempts: int):
+        super().__init__(str(error))
+        self.error = error
+        self.attempts = attempts
+
+
+class RetryPolicy(BaseModel):
+    """
+    Bounded retry with exponential backoff for browser actions.
+
+    Transient failures are absorbed inside the tool call instead of being
+    reported back to the agent, which would cost a full LLM round trip.
+    Timeouts are not retried: the attempt already waited for the element,
+    and waiting again only delays the failure. All attempts share one
+    deadline, so a retried action never takes much longer than a single one.
+    """
+
+    max_attempts: int = Field(3, description="Total attempts including the first one")
+    initial_delay_ms: int = Field(100, description="Delay before the first retry")
+    backoff_factor: float = Field(2.0, description="Multiplier applied to the delay after each retry")
+    max_delay_ms: int = Field(2000, description="Upper bound for a single retry delay")
+    actionability_timeout_ms: int = Field(
+        3000, description="How long to wait for an element to become actionable per attempt"
+    )
+    deadline_ms: int = Field(4000, description="Overall time for all attempts and delays")
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Classify an error as transient (retryable) or permanent"""
+        message = str(error).lower()
+        if is_timeout(error) or any(pattern in message for pattern in NON_RETRYABLE_ERROR_PATTERNS):
+            return False
+        return any(pattern in message for pattern in RETRYABLE_ERROR_PATTERNS)
+
+    def delay_for(self, retry: int) -> float:
+        """Backoff delay in seconds before the given retry (1-based)"""
+        delay_ms = self.initial_delay_ms * (self.backoff_factor ** (retry - 1))
+        return min(delay_ms, self.max_delay_ms) / 1000
+
+    def execute(self, action: Callable[[int], T]) -> Tuple[T, int]:
+        """
+        Run an action under this policy.
+
+        Args:
+            action: Callable performing the browser interaction; receives the
+                timeout in milliseconds for this attempt (the actionability
+                timeout, capped by what is left of the deadline)
+
+        Returns:
+            Tuple of (action result, number of retries performed)
+
+        Raises:
+            RetryError: If the action failed permanently, attempts ran out or
+                the deadline passed
+        """
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            remaining_ms = self.deadline_ms - (time.monotonic() - started) * 1000
+            try:
+                return action(int(max(1, min(self.actionability_timeout_ms, remaining_ms)))), attempt - 1
+            except Exception as e:
+                delay = self.delay_for(attempt)
+                out_of_time = (time.monotonic() - started + delay) * 1000 >= self.deadline_ms
+                if attempt >= self.max_attempts or out_of_time or not self.is_retryable(e):
+                    raise RetryError(e, attempt) from e
+                time.sleep(delay)
+                attempt += 1
+
+
+def describe_retries(retries: int) -> str:
+    """Suffix appended to tool output when retries were needed"""
+    if retries == 0:
+        return ""
+    return f" (after {retries} {'retry' if retries == 1 else 'retries'})"
+
+
+def describe_failure(error: Exception) -> str:
+    """Failure detail including the number of attempts when known"""
+    if isinstance(error, RetryError) and error.attempts > 1:
+        return f"{error} (gave up after {error.attempts} attempts)"
+    return str(error)
@@ -0,0 +1,148 @@
+"""Per-agent tool profiles and minified tool schemas to keep prompts small"""
+
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field, create_model
+
+from .output_compaction import estimate_tokens
+from .tool_wrapper import ToolWrapper, raw_description
+
+# Browser tools per agent role, native and Playwright MCP names. Tools that
+# are not browser tools (file tools, artifact reads, suite publishing) are
+# always kept.
+TOOL_PROFILES: Dict[str, Set[str]] = {
+    # Read-mostly exploration; typing and clicks stay available for logins and menus
+    "planner": {
+        "navigate_to_url", "go_back", "take_snapshot", "get_page_text", "get_current_url",
+        "evaluate_javascript", "click_element", "type_text", "press_key", "hover_element",
+        "wait_for_element",
+        "browser_navigate", "browser_navigate_back", "browser_snapshot", "browser_evaluate",
+        "browser_click", "browser_type", "browser_press_key", "browser_hover", "browser_wait_for",
+    },
+    # Actions and assertions needed to run test steps
+    "executor": {
+        "navigate_to_url", "go_back", "click_element", "type_text", "fill_form", "select_option",
+        "press_key", "hover_element", "wait_for_element", "verify_element", "evaluate_javascript",
+        "take_snapshot", "take_screenshot", "get_current_url", "get_page_text", "reset_browser_context",
+        "browser_navigate", "browser_navigate_back", "browser_click", "browser_type",
+        "browser_fill_form", "browser_select_option", "browser_press_key", "browser_hover",
+        "browser_drag", "browser_file_upload", "browser_handle_dialog", "browser_wait_for",
+        "browser_evaluate", "browser_snapshot", "browser_take_screenshot", "browser_tabs",
+        "browser_console_messages", "assert_visual_match", "start_test_case", "end_test_case",
+    },
+}
+
+# Every Playwright MCP tool is named with this prefix
+MCP_TOOL_PREFIX = "browser_"
+
+# Native and crew-provided tools that drive the browser. MCP tools are
+# recognized by their prefix instead, so tools added by newer servers are
+# filtered by the profiles too.
+NATIVE_BROWSER_TOOLS: Set[str] = {
+    name for profile in TOOL_PROFILES.values() for name in profile if not name.startswith(MCP_TOOL_PREFIX)
+} | {"close_browser"}
+
+
+def is_browser_tool(name: str) -> bool:
+    """Whether a tool belongs to a browser backend; only these are filtered by profiles"""
+    return name.startswith(MCP_TOOL_PREFIX) or name in NATIVE_BROWSER_TOOLS
+
+
+# Optional parameters kept when minifying; other optional parameters of these
+# tools are dropped and fall back to their defaults. Tools not listed keep all.
+KEEP_OPTIONAL: Dict[str, Set[str]] = {
+    "click_element": {"by_text"},
+    "type_text": {"press_enter"},
+    "take_snapshot": set(),
+    "take_screenshot": {"full_page"},
+    "wait_for_element": {"selector", "timeout", "state"},
+    "verify_element": {"expected_text", "should_be_visible"},
+    "press_key": {"selector"},
+    "browser_click": set(),
+    "browser_type": {"submit"},
+    "browser_evaluate": set(),
+    "browser_hover": set(),
+    "browser_take_screenshot": {"filename", "fullPage"},
+    "browser_snapshot": set(),
+    "browser_wait_for": {"text", "textGone", "time"},
+    "browser_tabs": {"index"},
+    "browser_console_messages": set(),
+}
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def shorten(text: Optional[str], max_chars: int) -> str:
+    """Keep the first sentence of a description, cut to max_chars"""
+    text = " ".join((text or "").split())
+    first = _SENTENCE_END.split(text, 1)[0]
+    return first if len(first) <= max_chars else first[:max_chars - 1].rstrip() + "…"
+
+
+def minify_schema(tool: BaseTool, field_chars: int = 60) -> Optional[type]:
+    """
+    Build a smaller args schema: optional parameters not in KEEP_OPTIONAL
+    are dropped and field descriptions are shortened.
+    """
+    schema = tool.args_schema
+    if schema is None or not hasattr(schema, "model_fields"):
+        return schema
+    keep = KEEP_OPTIONAL.get(tool.name)
+    fields = {}
+    for name, info in schema.model_fields.items():
+        if keep is not None and not info.is_required() and name not in keep:
+            continue
+        default = ... if info.is_required() else info.get_default(call_default_factory=True)
+        fields[name] = (info.annotation, Field(default, description=shorten(info.description, field_chars)))
+    return create_model(f"{schema.__name__}Min", __base__=BaseModel, **fields)
+
+
+class MinifiedTool(ToolWrapper):
+    """Exposes a tool with a shortened description and a reduced args schema"""
+
+    def __init__(self, inner: BaseTool, description_chars: int = 120, **data):
+        data.setdefault("description", shorten(raw_description(inner), description_chars))
+        data.setdefault("args_schema", minify_schema(inner))
+        super().__init__(inner, **data)
+
+
+def tool_prompt_tokens(tools: List[BaseTool]) -> int:
+    """Estimated prompt tokens of the tool definitions the agent is given on every turn"""
+    return sum(estimate_tokens(tool.description or "") for tool in tools)
+
+
+def select_tools(role: str, tools: List[BaseTool], profiles: Optional[Dict[str, Set[str]]] = None) -> List[BaseTool]:
+    """Keep the browser tools in the role's profile and every non-browser tool"""
+    profile = (profiles or TOOL_PROFILES).get(role)
+    if profile is None:
+        return list(tools)
+    return [tool for tool in tools if tool.name in profile or not is_browser_tool(tool.name)]
+
+
+def prepare_agent_tools(
+    role: str,
+    tools: List[BaseTool],
+    use_profile: bool = True,
+    minify: bool = True
+) -> Tuple[List[BaseTool], Dict[str, Any]]:
+    """
+    Apply the role's tool profile and schema minification.
+
+    Returns:
+        Tuple of (tools for the agent, report with tool counts and the
+        estimated prompt tokens before and after, per turn)
+    """
+    selected = select_tools(role, tools) if use_profile else list(tools)
+    if minify:
+        selected = [MinifiedTool(tool) for tool in selected]
+    baseline = tool_prompt_tokens(tools)
+    tokens = tool_prompt_tokens(selected)
+    return selected, {
+        "tools": len(selected),
+        "baseline_tools": len(tools),
+        "prompt_tokens": tokens,
+        "baseline_prompt_tokens": baseline,
+        "saved_tokens_per_turn": baseline - tokens,
+    }
@@ -0,0 +1,42 @@
+"""Base class for tools that decorate another CrewAI tool"""
+
+from typing import Any
+
+from crewai.tools import BaseTool
+from pydantic import Field
+
+# CrewAI prefixes tool descriptions with a generated header; this marks where
+# the original description starts.
+_DESCRIPTION_MARKER = "Tool Description: "
+
+
+def raw_description(tool: BaseTool) -> str:
+    """Return the tool description without CrewAI's generated header"""
+    description = tool.description or ""
+    if _DESCRIPTION_MARKER in description:
+        return description.split(_DESCRIPTION_MARKER, 1)[1].strip()
+    return description
+
+
+class ToolWrapper(BaseTool):
+    """
+    Tool that exposes another tool's name and schema and delegates to it.
+
+    Works for native tools and for the tools returned by MCPServerAdapter,
+    so post-processing can be layered on either backend. Subclasses override
+    `_run` and call `_call_inner` to reach the wrapped tool.
+    """
+
+    inner: Any = Field(..., exclude=True, description="The wrapped tool")
+
+    def __init__(self, inner: BaseTool, **data):
+        data.setdefault("name", inner.name)
+        data.setdefault("description", raw_description(inner))
+        data.setdefault("args_schema", inner.args_schema)
+        super().__init__(inner=inner, **data)
+
+    def _call_inner(self, **kwargs) -> Any:
+        return self.inner.run(**kwargs)
+
+    def _run(self, **kwargs) -> Any:
+        return self._call_inner(**kwargs)
@@ -0,0 +1,288 @@
+"""Playwright tracing in chunks per test case, keeping only failed cases"""
+
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+# Playwright MCP tools behind `--caps tracing`; driven by the case tools, not by agents
+MCP_START_TRACING = "browser_start_tracing"
+MCP_STOP_TRACING = "browser_stop_tracing"
+MCP_TRACING_TOOLS = {MCP_START_TRACING, MCP_STOP_TRACING}
+
+_TRACE_FILE = re.compile(r"(/[^\s`'\"()\[\]]+\.(?:zip|trace|network))")
+# Files of a trace that the viewer opens; the others (network log) sit next to them
+_VIEWER_EXTENSIONS = (".zip", ".trace")
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+class TracingOptions(BaseModel):
+    """
+    What a trace records and which traces are kept.
+
+    The Playwright MCP server applies snapshots, screenshots and sources only
+    if its start tool accepts them; servers whose tool takes no arguments
+    record with their own defaults.
+    """
+    snapshots: bool = Field(True, description="DOM snapshot per action, for the trace viewer's timeline")
+    screenshots: bool = Field(False, description="Screencast frames; the most expensive part of a trace")
+    sources: bool = Field(False, description="Source files of the test code (not useful for agent runs)")
+    output_dir: str = Field("traces", description="Where kept traces are written")
+    keep_passed: bool = Field(False, description="Also keep traces of passing cases")
+
+    def start_options(self) -> Dict[str, bool]:
+        return {"snapshots": self.snapshots, "screenshots": self.screenshots, "sources": self.sources}
+
+
+# (test case ID, browser, suite index) of a kept trace; the suite is None outside pipelined runs
+TraceKey = Tuple[str, str, Optional[int]]
+
+
+class TraceRecorder:
+    """
+    Trace files kept in a run, by test case ID, browser and suite.
+
+    Shared by every browser session of a run, so the report can link each
+    failed case to its trace. Pipelined suites may reuse case IDs, so their
+    traces are kept apart by the suite index.
+    """
+
+    def __init__(self, options: Optional[TracingOptions] = None):
+        self.options = options or TracingOptions()
+        self.traces: Dict[TraceKey, str] = {}
+        self._resource_dirs: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def path_for(self, case_id: str, browser: str, suite: Optional[int] = None) -> str:
+        name = _UNSAFE_NAME.sub("_", case_id).strip("._") or "case"
+        parts = [self.options.output_dir, browser] + ([f"suite-{suite:02d}"] if suite is not None else [])
+        return os.path.abspath(os.path.join(*parts, f"{name}.zip"))
+
+    def record(self, case_id: str, browser: str, path: str, suite: Optional[int] = None):
+        with self._lock:
+            self.traces[(case_id.strip(), browser, suite)] = path
+
+    def reset(self):
+        with self._lock:
+            self.traces = {}
+
+    def paths(self) -> List[str]:
+        with self._lock:
+            return list(self.traces.values())
+
+    def add_resource_dir(self, trace_dir: str):
+        """Register a directory whose shared trace resources are pruned by prune_resources"""
+        with self._lock:
+            self._resource_dirs.add(trace_dir)
+
+    def prune_resources(self):
+        """
+        Delete the resources that no remaining trace refers to.
+
+        Playwright writes each resource only once per browser context, so a
+        resource of a discarded trace may still be needed by a later trace of
+        the same session. Call this only after every session has ended.
+        """
+        with self._lock:
+            trace_dirs, self._resource_dirs = self._resource_dirs, set()
+        for trace_dir in trace_dirs:
+            prune_trace_resources(trace_dir)
+
+
+class CaseTracer(ABC):
+    """
+    Test-case trace chunks of one browser session.
+
+    Subclasses start and stop a chunk on their backend; this class tracks
+    the open case and decides what is kept. A session running pipelined
+    suites sets `suite` to the index of the suite it is executing.
+    """
+
+    def __init__(self, recorder: TraceRecorder, browser: str):
+        self.recorder = recorder
+        self.browser = browser
+        self.suite: Optional[int] = None
+        self.case_id: Optional[str] = None
+        self._case_suite: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _start(self, case_id: str, path: str):
+        """Start a chunk for the case, written to path if the backend allows choosing it"""
+
+    @abstractmethod
+    def _stop(self, keep: bool) -> List[str]:
+        """Stop the open chunk; returns the kept trace files"""
+
+    def begin(self, case_id: str) -> str:
+        with self._lock:
+            note = ""
+            if self.case_id is not None:
+                # The previous case was never ended; its outcome is unknown, so keep its trace
+                note = f" ({self._end(True)})"
+            self._start(case_id, self.recorder.path_for(case_id, self.browser, self.suite))
+            self.case_id, self._case_suite = case_id, self.suite
+            return f"✓ Tracing test case {case_id}{note}"
+
+    def end(self, case_id: str, passed: bool) -> str:
+        with self._lock:
+            if self.case_id is None:
+                return f"✗ No test case is being traced (call start_test_case before {case_id})"
+            return f"✓ {self._end(not passed or self.recorder.options.keep_passed)}"
+
+    def close(self):
+        """End an unfinished case at session end, keeping its trace"""
+        with self._lock:
+            if self.case_id is not None:
+                try:
+                    self._end(True)
+                except Exception:
+                    pass
+
+    def _end(self, keep: bool) -> str:
+        case_id, self.case_id = self.case_id, None
+        paths = self._stop(keep)
+        if not paths:
+            return f"Test case {case_id} ended, trace discarded"
+        self.recorder.record(case_id, self.browser, paths[-1], self._case_suite)
+        return f"Test case {case_id} ended, trace saved to {', '.join(paths)}"
+
+
+class NativeCaseTracer(CaseTracer):
+    """Chunks on a BrowserManager started with tracing options"""
+
+    def __init__(self, recorder: TraceRecorder, browser: str, browser_manager: Any):
+        super().__init__(recorder, browser)
+        self.browser_manager = browser_manager
+
+    def _start(self, case_id: str, path: str):
+        self.browser_manager.start_trace_chunk(case_id, path)
+
+    def _stop(self, keep: bool) -> List[str]:
+        return self.browser_manager.stop_trace_chunk(keep)
+
+
+class McpCaseTracer(CaseTracer):
+    """
+    Chunks through the Playwright MCP tracing tools.
+
+    The server records live into its output directory: an action log and
+    a network log per trace, plus a resources directory shared by all
+    traces. Both logs of a passing case are deleted when it ends; resources
+    only a deleted trace used are pruned by the recorder at the end of the run.
+    """
+
+    def __init__(self, recorder: TraceRecorder, browser: str, start_tool: BaseTool, stop_tool: BaseTool):
+        super().__init__(recorder, browser)
+        self.start_tool = start_tool
+        self.stop_tool = stop_tool
+        self._files: List[str] = []
+
+    def _start_args(self) -> Dict[str, bool]:
+        """The tracing options the server's start tool accepts"""
+        fields = getattr(self.start_tool.args_schema, "model_fields", None) or {}
+        return {key: value for key, value in self.recorder.options.start_options().items() if key in fields}
+
+    def _start(self, case_id: str, path: str):
+        self._files = _TRACE_FILE.findall(str(self.start_tool.run(**self._start_args())))
+
+    def _stop(self, keep: bool) -> List[str]:
+        files = list(dict.fromkeys(self._files + _TRACE_FILE.findall(str(self.stop_tool.run()))))
+        self._files = []
+        for trace_dir in {os.path.dirname(path) for path in files}:
+            self.recorder.add_resource_dir(trace_dir)
+        if keep:
+            return [path for path in files if path.endswith(_VIEWER_EXTENSIONS)]
+        for path in files:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return []
+
+
+def prune_trace_resources(trace_dir: str) -> int:
+    """
+    Delete the files in a trace directory's resources/ that none of its
+    remaining traces or network logs refers to.
+
+    Returns:
+        The number of deleted resources
+    """
+    resources_dir = os.path.join(trace_dir, "resources")
+    try:
+        resources = os.listdir(resources_dir)
+        logs = [name for name in os.listdir(trace_dir) if name.endswith((".trace", ".network"))]
+    except OSError:
+        return 0
+
+    referenced = []
+    for name in logs:
+        try:
+            with open(os.path.join(trace_dir, name), encoding="utf-8", errors="replace") as f:
+                referenced.append(f.read())
+        except OSError:
+            continue
+    text = "\n".join(referenced)
+
+    removed = 0
+    for name in resources:
+        if name in text:
+            continue
+        try:
+            os.remove(os.path.join(resources_dir, name))
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+class StartTestCaseInput(BaseModel):
+    """Input for Start Test Case tool"""
+    case_id: str = Field(..., description="Test case ID from the plan, e.g. TC-001")
+
+
+class EndTestCaseInput(BaseModel):
+    """Input for End Test Case tool"""
+    case_id: str = Field(..., description="Test case ID from the plan, e.g. TC-001")
+    passed: bool = Field(..., description="True if every step of the case passed")
+
+
+class StartTestCaseTool(BaseTool):
+    name: str = "start_test_case"
+    description: str = (
+        "Call before the first step of each test case to start recording its trace. "
+        "Use the case's ID from the test plan."
+    )
+    args_schema: Type[BaseModel] = StartTestCaseInput
+    tracer: Any = Field(..., exclude=True, description="CaseTracer of the session")
+
+    def _run(self, case_id: str) -> str:
+        try:
+            return self.tracer.begin(case_id)
+        except Exception as e:
+            return f"✗ Could not start tracing: {str(e)}"
+
+
+class EndTestCaseTool(BaseTool):
+    name: str = "end_test_case"
+    description: str = (
+        "Call after the last step of each test case with its outcome. "
+        "Traces of failed cases are kept for debugging; passing ones are discarded."
+    )
+    args_schema: Type[BaseModel] = EndTestCaseInput
+    tracer: Any = Field(..., exclude=True, description="CaseTracer of the session")
+
+    def _run(self, case_id: str, passed: bool) -> str:
+        try:
+            return self.tracer.end(case_id, passed)
+        except Exception as e:
+            return f"✗ Could not stop tracing: {str(e)}"
+
+
+def case_tools(tracer: CaseTracer) -> List[BaseTool]:
+    return [StartTestCaseTool(tracer=tracer), EndTestCaseTool(tracer=tracer)]
@@ -0,0 +1,72 @@
+"""Visual assertion tool: compare the page with a stored baseline screenshot"""
+
+from typing import Any, List, Optional, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+
+class VisualAssertInput(BaseModel):
+    """Input for Visual Assert tool"""
+    name: str = Field(..., description="Baseline name, unique per test and view, e.g. 'TC-003 checkout summary'")
+    screenshot_path: Optional[str] = Field(
+        None, description="Screenshot file to compare; omit to capture the current page"
+    )
+    full_page: bool = Field(True, description="Capture the full scrollable page")
+    mask_selectors: Optional[List[str]] = Field(
+        None, description="CSS selectors of dynamic elements to ignore (dates, ads)"
+    )
+    masks: Optional[List[List[int]]] = Field(
+        None, description="Regions to ignore as [x, y, width, height] in page pixels"
+    )
+
+
+class VisualAssertTool(BaseTool):
+    """
+    Compares a screenshot with its stored baseline (VisualBaselines).
+
+    With a BrowserManager the tool captures the page itself; without one
+    (MCP backend) it compares a screenshot file saved by the screenshot tool.
+    """
+
+    name: str = "assert_visual_match"
+    description: str = (
+        "Assert that the page looks like its stored baseline screenshot. "
+        "The first capture of a name becomes its baseline. "
+        "Reports the share of changed pixels and writes a diff image on mismatch."
+    )
+    args_schema: Type[BaseModel] = VisualAssertInput
+    baselines: Any = Field(..., exclude=True, description="VisualBaselines to compare against")
+    browser_manager: Optional[Any] = Field(None, exclude=True, description="BrowserManager used to capture")
+    variant: Optional[str] = Field(None, description="Baseline variant, e.g. the browser name")
+
+    def _capture(self, full_page: bool, mask_selectors: Optional[List[str]]) -> bytes:
+        def screenshot(page) -> bytes:
+            # Playwright paints masked elements in a fixed color, identically in every capture
+            masked = [page.locator(selector) for selector in mask_selectors or []]
+            return page.screenshot(full_page=full_page, mask=masked, animations="disabled", caret="hide")
+
+        return self.browser_manager.run(screenshot)
+
+    def _run(
+        self,
+        name: str,
+        screenshot_path: Optional[str] = None,
+        full_page: bool = True,
+        mask_selectors: Optional[List[str]] = None,
+        masks: Optional[List[List[int]]] = None
+    ) -> str:
+        try:
+            if screenshot_path:
+                with open(screenshot_path, "rb") as f:
+                    data = f.read()
+            elif self.browser_manager is not None:
+                data = self._capture(full_page, mask_selectors)
+            else:
+                return "✗ Visual assertion failed: take a screenshot first and pass its screenshot_path"
+
+            regions = [tuple(region) for region in masks or [] if len(region) == 4]
+            result = self.baselines.compare(name, data, masks=regions, variant=self.variant)
+            return result.summary(self.baselines.tolerance)
+        except Exception as e:
+            return f"✗ Visual assertion failed: {str(e)}"
@@ -0,0 +1,76 @@
+"""Background browser warm-up that overlaps browser startup with LLM latency"""
+
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from crewai.tools import BaseTool
+from pydantic import Field
+
+from .tool_wrapper import ToolWrapper
+
+# Playwright MCP launches its browser lazily on the first browser tool call
+MCP_NAVIGATE_TOOL = "browser_navigate"
+
+
+class BrowserWarmup:
+    """Runs a warm-up action on a background thread that tools can wait on"""
+
+    def __init__(self, action: Callable[[], Any], timeout: float = 60.0):
+        """
+        Args:
+            action: Callable that starts the browser (and optionally navigates)
+            timeout: Maximum time tools wait for the warm-up before proceeding
+        """
+        self.action = action
+        self.timeout = timeout
+        self.error: Optional[str] = None
+        self.duration_s: Optional[float] = None
+        self._done = threading.Event()
+
+    def start(self) -> "BrowserWarmup":
+        thread = threading.Thread(target=self._run, name="browser-warmup", daemon=True)
+        thread.start()
+        return self
+
+    def _run(self):
+        started = time.monotonic()
+        try:
+            self.action()
+        except Exception as e:
+            # A failed warm-up only loses the head start; the tools still work
+            self.error = str(e)
+        finally:
+            self.duration_s = round(time.monotonic() - started, 2)
+            self._done.set()
+
+    def wait(self) -> bool:
+        """Block until the warm-up finished or timed out; True if it finished"""
+        return self._done.wait(self.timeout)
+
+
+class WarmupGatedTool(ToolWrapper):
+    """Wraps a tool so its calls wait for a pending browser warm-up"""
+
+    warmup: Any = Field(..., exclude=True)
+
+    def _run(self, **kwargs) -> Any:
+        self.warmup.wait()
+        return self._call_inner(**kwargs)
+
+
+def gate_tools(tools: List[BaseTool], warmup: BrowserWarmup) -> List[BaseTool]:
+    """Make every tool wait for the warm-up before its first use"""
+    return [WarmupGatedTool(tool, warmup=warmup) for tool in tools]
+
+
+def start_mcp_warmup(tools: List[BaseTool], url: Optional[str] = None) -> Optional[BrowserWarmup]:
+    """
+    Warm up a Playwright MCP browser by navigating in the background.
+
+    Returns None if the MCP server exposes no navigate tool.
+    """
+    navigate = next((tool for tool in tools if tool.name == MCP_NAVIGATE_TOOL), None)
+    if navigate is None:
+        return None
+    return BrowserWarmup(lambda: navigate.run(url=url or "about:blank")).start()
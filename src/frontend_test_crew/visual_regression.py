@@ -0,0 +1,350 @@
+"""Visual regression: screenshots compared with stored baselines using NumPy"""
+
+import glob
+import hashlib
+import io
+import os
+import re
+from typing import Any, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field, ValidationError
+
+from .atomic_file import write_atomic
+
+# A region as (x, y, width, height) in page pixels
+Region = Tuple[int, int, int, int]
+
+# Side of the grayscale thumbnail the perceptual hash is computed from, and
+# of the low-frequency DCT block that forms the 64-bit hash
+_HASH_SAMPLE = 32
+_HASH_SIZE = 8
+
+# Rows compared per step, so tall full-page captures don't allocate a full
+# difference array
+_CHUNK_ROWS = 1024
+
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+_ACTUAL_SUFFIX = ".actual.png"
+
+
+def _require():
+    """Import NumPy and Pillow, which are an optional extra"""
+    try:
+        import numpy as np
+        from PIL import Image
+    except ImportError as e:
+        raise ImportError(
+            "Visual regression needs NumPy and Pillow: pip install 'frontend-test-crew[visual]'"
+        ) from e
+    return np, Image
+
+
+def load_pixels(data: bytes) -> Any:
+    """Decode an encoded image into an RGB uint8 array of shape (height, width, 3)"""
+    np, Image = _require()
+    with Image.open(io.BytesIO(data)) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def apply_masks(pixels: Any, regions: Sequence[Region]) -> Any:
+    """Return a copy with the regions blacked out (the input if there are none)"""
+    if not regions:
+        return pixels
+    masked = pixels.copy()
+    height, width = masked.shape[:2]
+    for x, y, w, h in regions:
+        masked[max(0, y):min(height, y + h), max(0, x):min(width, x + w)] = 0
+    return masked
+
+
+def pixel_digest(pixels: Any) -> str:
+    return hashlib.sha1(repr(pixels.shape).encode("ascii") + pixels.tobytes()).hexdigest()
+
+
+def perceptual_hash(pixels: Any) -> str:
+    """
+    64-bit DCT perceptual hash of a downscaled grayscale copy.
+
+    Similar frames have hashes a few bits apart; the distance is a cheap
+    similarity score that needs neither image at full resolution.
+    """
+    np, Image = _require()
+    gray = Image.fromarray(pixels).convert("L").resize((_HASH_SAMPLE, _HASH_SAMPLE), Image.Resampling.BOX)
+    sample = np.asarray(gray, dtype=np.float64)
+    n = np.arange(_HASH_SAMPLE)
+    dct = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * _HASH_SAMPLE))
+    low = (dct @ sample @ dct.T)[:_HASH_SIZE, :_HASH_SIZE].flatten()
+    # The DC term only reflects overall brightness
+    bits = low > np.median(low[1:])
+    return f"{int(''.join('1' if bit else '0' for bit in bits), 2):016x}"
+
+
+def hash_distance(a: str, b: str) -> int:
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def changed_pixels(baseline: Any, actual: Any, threshold: int) -> Any:
+    """
+    Boolean (height, width) array of pixels whose largest channel difference
+    exceeds threshold. Works in uint8 and in row chunks to bound memory.
+    """
+    np, _ = _require()
+    changed = np.empty(baseline.shape[:2], dtype=bool)
+    for start in range(0, baseline.shape[0], _CHUNK_ROWS):
+        a = baseline[start:start + _CHUNK_ROWS]
+        b = actual[start:start + _CHUNK_ROWS]
+        difference = np.maximum(a, b) - np.minimum(a, b)
+        changed[start:start + _CHUNK_ROWS] = difference.max(axis=2) > threshold
+    return changed
+
+
+def diff_image(baseline: Any, changed: Any) -> Any:
+    """Faded grayscale baseline with the changed pixels in red"""
+    np, _ = _require()
+    gray = baseline.mean(axis=2, dtype=np.float32).astype(np.uint8) // 3 + 170
+    image = np.repeat(gray[:, :, None], 3, axis=2)
+    image[changed] = (255, 0, 0)
+    return image
+
+
+def _bounding_box(changed: Any) -> Optional[Region]:
+    np, _ = _require()
+    rows = np.flatnonzero(changed.any(axis=1))
+    if rows.size == 0:
+        return None
+    columns = np.flatnonzero(changed.any(axis=0))
+    return (
+        int(columns[0]), int(rows[0]),
+        int(columns[-1] - columns[0] + 1), int(rows[-1] - rows[0] + 1)
+    )
+
+
+class BaselineMeta(BaseModel):
+    """Stored next to each baseline image"""
+    width: int
+    height: int
+    file_digest: str = Field(..., description="SHA-1 of the encoded baseline file")
+    pixel_digest: str = Field(..., description="SHA-1 of the pixels with the stored masks applied")
+    phash: str
+    masks: List[Region] = Field(default_factory=list, description="Regions always ignored for this baseline")
+
+
+class VisualDiff(BaseModel):
+    """Result of comparing one capture with its baseline"""
+    name: str
+    status: str = Field(
+        ..., description="identical, match, mismatch, size_mismatch, created or updated"
+    )
+    passed: bool
+    diff_ratio: float = 0.0
+    diff_pixels: int = 0
+    perceptual_distance: Optional[int] = None
+    changed_region: Optional[Region] = None
+    baseline_path: str
+    actual_path: Optional[str] = None
+    diff_path: Optional[str] = None
+
+    def summary(self, tolerance: float) -> str:
+        if self.status in ("identical", "match"):
+            return f"✓ Visual match '{self.name}': {self.status} ({self.diff_ratio:.3%} of pixels differ)"
+        if self.status in ("created", "updated"):
+            return f"✓ Baseline '{self.name}' {self.status}: {self.baseline_path}"
+        if self.status == "size_mismatch":
+            return (f"✗ Visual mismatch '{self.name}': page size differs from the baseline; "
+                    f"capture saved to {self.actual_path}")
+        region = ""
+        if self.changed_region:
+            x, y, w, h = self.changed_region
+            region = f" within x={x}, y={y}, {w}x{h}"
+        return (f"✗ Visual mismatch '{self.name}': {self.diff_ratio:.3%} of pixels differ "
+                f"(tolerance {tolerance:.3%}){region}; diff saved to {self.diff_path}")
+
+
+class VisualBaselines:
+    """
+    Baseline screenshots per test, compared with NumPy.
+
+    Checks run from cheapest to most expensive: a capture whose encoded bytes
+    or masked pixels equal the baseline's is identical and the baseline image
+    is never decoded; only other captures get a full pixel comparison. Masked
+    regions (stored with the baseline or given per comparison) are ignored.
+    A capture passes if at most `tolerance` of its pixels differ by more than
+    `threshold` in some channel; failures leave the capture and a diff image
+    in diff_dir for review and approval.
+    """
+
+    def __init__(
+        self,
+        directory: str = "visual_baselines",
+        diff_dir: str = "visual_diffs",
+        threshold: int = 16,
+        tolerance: float = 0.001,
+        phash_skip_distance: Optional[int] = None,
+        update: bool = False
+    ):
+        """
+        Args:
+            directory: Where baseline images and their metadata are stored
+            diff_dir: Where failing captures and diff images are written
+            threshold: Channel difference (0-255) below which a pixel counts as unchanged
+            tolerance: Fraction of pixels allowed to differ
+            phash_skip_distance: Treat captures whose perceptual hash is at most
+                 this many bits from the baseline's as matching, without the
+                 pixel comparison. Faster, but misses small changes such as a
+                 single word; None (default) always compares pixels
+            update: Replace baselines with new captures instead of comparing
+        """
+        self.directory = directory
+        self.diff_dir = diff_dir
+        self.threshold = threshold
+        self.tolerance = tolerance
+        self.phash_skip_distance = phash_skip_distance
+        self.update = update
+
+    @staticmethod
+    def key(name: str, variant: Optional[str] = None) -> str:
+        """File-safe baseline key; variant separates e.g. browsers"""
+        key = _UNSAFE_NAME.sub("_", name).strip("._") or "baseline"
+        return f"{key}@{_UNSAFE_NAME.sub('_', variant)}" if variant else key
+
+    def image_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def meta_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load_meta(self, key: str) -> Optional[BaselineMeta]:
+        try:
+            with open(self.meta_path(key), encoding="utf-8") as f:
+                return BaselineMeta.model_validate_json(f.read())
+        except (OSError, ValueError, ValidationError):
+            return None
+
+    def keys(self) -> List[str]:
+        return sorted(
+            os.path.basename(path)[:-len(".json")]
+            for path in glob.glob(os.path.join(self.directory, "*.json"))
+        )
+
+    def save(self, key: str, data: bytes, masks: Sequence[Region] = ()) -> BaselineMeta:
+        """Store an encoded PNG as the baseline for key"""
+        pixels = load_pixels(data)
+        masked = apply_masks(pixels, masks)
+        meta = BaselineMeta(
+            width=pixels.shape[1],
+            height=pixels.shape[0],
+            file_digest=hashlib.sha1(data).hexdigest(),
+            pixel_digest=pixel_digest(masked),
+            phash=perceptual_hash(masked),
+            masks=list(masks)
+        )
+        # Parallel workers never read a partial baseline; the metadata goes last
+        # so it never describes an image that isn't there yet
+        write_atomic(self.image_path(key), data)
+        write_atomic(self.meta_path(key), meta.model_dump_json())
+        return meta
+
+    def delete(self, key: str) -> bool:
+        removed = False
+        for path in (self.image_path(key), self.meta_path(key)):
+            if os.path.exists(path):
+                os.remove(path)
+                removed = True
+        return removed
+
+    def approve(self, search_dirs: Sequence[str], keys: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Promote failing captures found under search_dirs to baselines,
+        keeping each baseline's stored masks.
+
+        Returns:
+            The approved keys
+        """
+        approved = []
+        for search_dir in search_dirs:
+            pattern = os.path.join(search_dir, "**", f"*{_ACTUAL_SUFFIX}")
+            for path in sorted(glob.glob(pattern, recursive=True)):
+                key = os.path.basename(path)[:-len(_ACTUAL_SUFFIX)]
+                if keys is not None and key not in keys:
+                    continue
+                with open(path, "rb") as f:
+                    data = f.read()
+                meta = self.load_meta(key)
+                self.save(key, data, meta.masks if meta else ())
+                approved.append(key)
+        return approved
+
+    def compare(
+        self,
+        name: str,
+        data: bytes,
+        masks: Sequence[Region] = (),
+        variant: Optional[str] = None
+    ) -> VisualDiff:
+        """
+        Compare an encoded screenshot with the baseline for name and variant.
+
+        Without a baseline (or with update=True) the capture becomes the
+        baseline and the comparison passes.
+        """
+        key = self.key(name, variant)
+        meta = self.load_meta(key)
+        baseline_path = self.image_path(key)
+        if meta is None or self.update:
+            self.save(key, data, meta.masks if meta else masks)
+            return VisualDiff(
+                name=key, status="updated" if meta else "created", passed=True, baseline_path=baseline_path
+            )
+
+        if hashlib.sha1(data).hexdigest() == meta.file_digest:
+            return VisualDiff(name=key, status="identical", passed=True, perceptual_distance=0,
+                              baseline_path=baseline_path)
+
+        regions = list(meta.masks) + [tuple(region) for region in masks if tuple(region) not in meta.masks]
+        actual = apply_masks(load_pixels(data), regions)
+        if actual.shape[:2] != (meta.height, meta.width):
+            return VisualDiff(
+                name=key, status="size_mismatch", passed=False, diff_ratio=1.0,
+                diff_pixels=int(actual.shape[0] * actual.shape[1]),
+                baseline_path=baseline_path, actual_path=self._write_actual(key, data)
+            )
+        # The stored digest only covers the stored masks
+        if len(regions) == len(meta.masks) and pixel_digest(actual) == meta.pixel_digest:
+            return VisualDiff(name=key, status="identical", passed=True, perceptual_distance=0,
+                              baseline_path=baseline_path)
+
+        distance = hash_distance(perceptual_hash(actual), meta.phash)
+        if self.phash_skip_distance is not None and distance <= self.phash_skip_distance:
+            return VisualDiff(name=key, status="match", passed=True, perceptual_distance=distance,
+                              baseline_path=baseline_path)
+
+        with open(baseline_path, "rb") as f:
+            baseline = apply_masks(load_pixels(f.read()), regions)
+        changed = changed_pixels(baseline, actual, self.threshold)
+        count = int(changed.sum())
+        ratio = count / changed.size
+        result = VisualDiff(
+            name=key, status="match", passed=ratio <= self.tolerance, diff_ratio=ratio, diff_pixels=count,
+            perceptual_distance=distance, changed_region=_bounding_box(changed), baseline_path=baseline_path
+        )
+        if not result.passed:
+            result.status = "mismatch"
+            result.actual_path = self._write_actual(key, data)
+            result.diff_path = self._write_diff(key, diff_image(baseline, changed))
+        return result
+
+    def _write_actual(self, key: str, data: bytes) -> str:
+        os.makedirs(self.diff_dir, exist_ok=True)
+        path = os.path.join(self.diff_dir, f"{key}{_ACTUAL_SUFFIX}")
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _write_diff(self, key: str, pixels: Any) -> str:
+        _, Image = _require()
+        os.makedirs(self.diff_dir, exist_ok=True)
+        path = os.path.join(self.diff_dir, f"{key}.diff.png")
+        # Fast compression: diff images are for review, not archival
+        Image.fromarray(pixels).save(path, compress_level=1)
+        return path
@@ -0,0 +1,121 @@
+import argparse
+import json
+
+import pytest
+
+from frontend_test_crew.cli import (
+    build_parser,
+    collect_report,
+    load_planned_suites,
+    load_scenarios,
+    parse_shard,
+    select_shard,
+)
+
+
+def report(success=True, **fields):
+    return {
+        "pass_count": 1 if success else 0, "fail_count": 0 if success else 1, "error_count": 0,
+        "test_cases": 1, "success": success, "fails": [] if success else ["TC-1: a"], "errors": [],
+        "summary": [], "recommendations": [], **fields,
+    }
+
+
+def run_command(argv):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+def test_planned_suites_are_split_across_shards(tmp_path):
+    path = tmp_path / "plans.json"
+    path.write_text(json.dumps([
+        {"id": "checkout", "website_url": "https://example.com", "test_scenario": "Checkout",
+         "suites": [{"index": i, "title": f"Suite {i}", "plan": f"plan {i}"} for i in range(1, 5)]},
+        {"id": "search", "website_url": "https://example.com", "test_scenario": "Search",
+         "suites": [], "error": "planner crashed"},
+    ]))
+    scenarios = load_planned_suites(str(path))
+    assert [s["id"] for s in scenarios] == ["checkout-01", "checkout-02", "checkout-03", "checkout-04", "search"]
+    assert scenarios[0]["test_plan"] == "plan 1" and scenarios[0]["test_scenario"] == "Checkout"
+    assert scenarios[-1]["plan_error"] == "planner crashed"
+
+    shards = [[s["id"] for s in select_shard(scenarios, index, 2)] for index in (1, 2)]
+    assert shards == [["checkout-01", "checkout-03", "search"], ["checkout-02", "checkout-04"]]
+
+
+@pytest.mark.parametrize("value, expected", [("1/1", (1, 1)), ("2/4", (2, 4)), ("4/4", (4, 4))])
+def test_parse_shard(value, expected):
+    assert parse_shard(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "2", "a/b", "1/2/3", "1-2", "0/4", "5/4", "-1/4", "1/0"])
+def test_parse_shard_rejects_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_shard(value)
+
+
+def test_invalid_shard_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as exc:
+        build_parser().parse_args(["run", "a.json", "--shard", "3/2"])
+    assert exc.value.code == 2
+    assert "between 1 and N" in capsys.readouterr().err
+
+
+class TestLoadScenarios:
+    def test_ids_from_file_names(self, tmp_path):
+        (tmp_path / "login.txt").write_text("Log in")
+        (tmp_path / "single.json").write_text(json.dumps({"test_scenario": "One"}))
+        (tmp_path / "many.json").write_text(json.dumps([
+            {"test_scenario": "First"}, {"id": "custom", "test_scenario": "Second"}, {"test_scenario": "Third"},
+        ]))
+        scenarios = load_scenarios(
+            [str(tmp_path / name) for name in ("login.txt", "single.json", "many.json")],
+            default_url="https://example.com"
+        )
+        assert [s["id"] for s in scenarios] == ["login", "single", "many-1", "custom", "many-3"]
+        assert scenarios[0]["test_scenario"] == "Log in"
+        assert all(s["website_url"] == "https://example.com" for s in scenarios)
+
+    def test_own_url_wins_over_default(self, tmp_path):
+        (tmp_path / "a.json").write_text(json.dumps({"website_url": "https://a.test", "test_scenario": "A"}))
+        assert load_scenarios([str(tmp_path / "a.json")], "https://example.com")[0]["website_url"] == "https://a.test"
+
+    def test_missing_url(self, tmp_path):
+        (tmp_path / "a.txt").write_text("A")
+        with pytest.raises(ValueError, match="'a' has no website_url"):
+            load_scenarios([str(tmp_path / "a.txt")])
+
+    def test_duplicate_ids(self, tmp_path):
+        (tmp_path / "a.txt").write_text("A")
+        (tmp_path / "b.json").write_text(json.dumps({"id": "a", "test_scenario": "B"}))
+        with pytest.raises(ValueError, match="Duplicate scenario id 'a'"):
+            load_scenarios([str(tmp_path / "a.txt"), str(tmp_path / "b.json")], "https://example.com")
+
+
+class TestCollectReport:
+    def test_all_reports(self):
+        merged = collect_report([{"id": "a", "report": report()}, {"id": "b", "report": report()}])
+        assert merged.success and merged.pass_count == 2 and merged.errors == []
+
+    def test_missing_report_fails_the_run(self):
+        merged = collect_report([{"id": "a", "report": report()}, {"id": "b", "error": "crashed"}, {"id": "c"}])
+        assert not merged.success
+        assert merged.errors == ["Scenario b failed: crashed", "Scenario c failed: no report produced"]
+        assert merged.error_count == 2
+
+
+class TestMergeCommand:
+    def test_exit_code_0_when_every_report_succeeded(self, tmp_path):
+        paths = []
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.json").write_text(json.dumps(report()))
+            paths.append(str(tmp_path / f"{name}.json"))
+        output = tmp_path / "merged.json"
+        assert run_command(["merge", *paths, "--output", str(output)]) == 0
+        assert json.loads(output.read_text())["pass_count"] == 2
+
+    def test_exit_code_1_when_a_report_failed(self, tmp_path, capsys):
+        (tmp_path / "a.json").write_text(json.dumps(report()))
+        (tmp_path / "b.json").write_text(json.dumps(report(success=False)))
+        assert run_command(["merge", str(tmp_path / "a.json"), str(tmp_path / "b.json")]) == 1
+        assert json.loads(capsys.readouterr().out)["fails"] == ["TC-1: a"]
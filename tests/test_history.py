@@ -0,0 +1,79 @@
+import sqlite3
+
+import pytest
+
+from frontend_test_crew.history import ResultsHistory
+
+URL = "https://example.com"
+SCENARIO = "Checkout flow"
+
+
+@pytest.fixture
+def history(tmp_path):
+    return ResultsHistory(str(tmp_path / "history.sqlite3"))
+
+
+def entry(test_id, failed=0, browser=None, **fields):
+    return {"test_id": test_id, "test_name": f"Case {test_id}", "passed": 1 - failed, "failed": failed,
+            "errors": 0, "browser": browser, **fields}
+
+
+def record(history, *entries, browser="chromium", started_at=None):
+    history.record_run({"summary": list(entries)}, URL, SCENARIO, "completed", started_at=started_at, browser=browser)
+
+
+def test_matrix_failure_on_one_browser_is_not_flaky(history):
+    for run in range(5):
+        record(
+            history,
+            entry("TC-1", failed=0, browser="chromium"),
+            entry("TC-1", failed=1, browser="firefox"),
+            browser="chromium,firefox",
+            started_at=1000 + run,
+        )
+    stats = {s.browser: s for s in history.case_stats(URL, SCENARIO)}
+    assert set(stats) == {"chromium", "firefox"}
+    assert stats["firefox"].failures == 5 and stats["firefox"].last_failed
+    assert not stats["firefox"].flaky and stats["firefox"].flip_rate == 0
+    assert stats["chromium"].failures == 0
+    assert history.flaky_cases(URL, SCENARIO) == []
+
+
+def test_single_browser_cases_use_the_run_browser(history):
+    record(history, entry("TC-1", failed=1), browser="webkit")
+    [stats] = history.case_stats(URL, SCENARIO)
+    assert stats.browser == "webkit"
+    assert "TC-1 (Case TC-1): failed 1/1 recent runs on webkit" in history.execution_hints(URL, SCENARIO)
+
+
+def test_alternating_outcomes_are_flaky(history):
+    for run in range(4):
+        record(history, entry("TC-1", failed=run % 2), started_at=1000 + run)
+    [stats] = history.flaky_cases(URL, SCENARIO)
+    assert stats.flip_rate == 1.0
+    assert "Known flaky cases (quarantined): TC-1 on chromium" in history.execution_hints(URL, SCENARIO)
+
+
+def test_older_databases_gain_the_browser_column(tmp_path):
+    path = str(tmp_path / "old.sqlite3")
+    with sqlite3.connect(path) as conn:
+        conn.executescript(
+            "CREATE TABLE case_results (run_id INTEGER NOT NULL, test_id TEXT NOT NULL, test_name TEXT, "
+            "passed INTEGER NOT NULL, failed INTEGER NOT NULL, errors INTEGER NOT NULL, duration_ms REAL);"
+        )
+    history = ResultsHistory(path)
+    record(history, entry("TC-1"))
+    assert history.case_stats(URL, SCENARIO)[0].browser == "chromium"
+
+
+def test_skipped_cases_are_not_counted_as_runs(history):
+    record(history, entry("TC-1", failed=1), started_at=1000)
+    record(
+        history,
+        entry("TC-1", failed=0, status="skipped"),
+        entry("SKIPPED", failed=0, status="skipped"),
+        started_at=1001,
+    )
+    [stats] = history.case_stats(URL, SCENARIO)
+    assert (stats.test_id, stats.runs, stats.last_failed) == ("TC-1", 1, True)
+    assert "SKIPPED" not in history.execution_hints(URL, SCENARIO)
@@ -0,0 +1,131 @@
+import pytest
+
+from frontend_test_crew import models
+from frontend_test_crew.report_builder import (
+    attach_traces,
+    build_report,
+    merge_reports,
+    parse_execution_results,
+    tag_report,
+)
+
+
+def case(test_id, status, **fields):
+    return models.TestCaseResult(test_id=test_id, test_name=f"Case {test_id}", status=status, **fields)
+
+
+def results(*cases, recommendations=()):
+    return models.ExecutionResultsModel(test_cases=list(cases), recommendations=list(recommendations))
+
+
+class TestParseExecutionResults:
+    def test_dict(self):
+        parsed = parse_execution_results({"test_cases": [{"test_id": "TC-1", "test_name": "a", "status": "passed"}]})
+        assert parsed.test_cases[0].status == "passed"
+
+    def test_json_in_prose(self):
+        raw = 'Done.\n```json\n{"test_cases": [{"test_id": "TC-1", "test_name": "a", "status": "failed"}]}\n```'
+        assert parse_execution_results(raw).test_cases[0].status == "failed"
+
+    def test_unstructured_output_raises(self):
+        with pytest.raises(ValueError):
+            parse_execution_results("All tests passed!")
+        with pytest.raises(ValueError):
+            parse_execution_results(None)
+
+
+class TestCaseStatus:
+    @pytest.mark.parametrize("raw, status", [
+        ("PASSED", "passed"), ("Pass", "passed"), ("FAIL", "failed"), ("failure", "failed"),
+        ("Error", "error"), ("not run", "skipped"), ("Skipped", "skipped"),
+    ])
+    def test_spellings_are_normalized(self, raw, status):
+        assert case("TC-1", raw).status == status
+
+    @pytest.mark.parametrize("raw", ["blocked", "timeout", ""])
+    def test_unknown_status_is_an_error(self, raw):
+        result = case("TC-1", raw, errors=["boom"])
+        assert result.status == "error"
+        assert result.errors == ["boom", f"unrecognized status '{raw}'"]
+
+
+class TestBuildReport:
+    def test_counts_and_success(self):
+        report = build_report(results(
+            case("TC-1", "passed", passed=3),
+            case("TC-2", "passed", passed=1, duration_ms=12.5),
+            recommendations=["Add alt text", "Add alt text "],
+        ))
+        assert (report.pass_count, report.fail_count, report.error_count, report.test_cases) == (2, 0, 0, 2)
+        assert report.success
+        assert report.recommendations == ["Add alt text"]
+        assert report.summary[1].duration_ms == 12.5
+
+    def test_failures_and_errors(self):
+        report = build_report(results(
+            case("TC-1", "failed", failed=1, errors=["button missing"]),
+            case("TC-2", "error"),
+        ))
+        assert report.fails == ["TC-1: Case TC-1"]
+        assert report.errors == ["TC-1: button missing", "TC-2: execution error"]
+        assert report.error_count == 2
+        assert not report.success
+
+    def test_unknown_statuses_fail_the_run(self):
+        report = build_report(results(case("TC-1", "passed"), case("TC-2", "FAIL"), case("TC-3", "blocked")))
+        assert (report.pass_count, report.fail_count, report.error_count) == (1, 1, 1)
+        assert report.errors == ["TC-3: unrecognized status 'blocked'"]
+        assert not report.success
+
+    def test_skipped_cases_are_neither_errors_nor_success(self):
+        report = build_report(results(case("TC-1", "passed"), case("TC-2", "skipped", errors=["budget exhausted"])))
+        assert report.skip_count == 1
+        assert report.skipped == ["TC-2: Case TC-2"]
+        assert [entry.status for entry in report.summary] == ["passed", "skipped"]
+        assert report.errors == []
+        assert not report.success
+
+    def test_run_errors_and_several_executions(self):
+        report = build_report(
+            [results(case("TC-1", "passed")), results(case("TC-2", "passed"))],
+            run_errors=["Suite 3 (Checkout): crashed"],
+        )
+        assert report.test_cases == 2
+        assert report.errors == ["Suite 3 (Checkout): crashed"]
+        assert not report.success
+
+    def test_no_cases_is_not_a_success(self):
+        assert not build_report(results()).success
+
+
+def test_tag_and_merge_reports():
+    chromium = tag_report(build_report(results(case("TC-1", "passed"))), "chromium")
+    firefox = tag_report(build_report(results(case("TC-1", "failed"), case("TC-2", "skipped"))), "firefox")
+    merged = merge_reports([chromium, firefox.model_dump()])
+    assert (merged.pass_count, merged.fail_count, merged.skip_count, merged.test_cases) == (1, 1, 1, 3)
+    assert merged.fails == ["[firefox] TC-1: Case TC-1"]
+    assert merged.skipped == ["[firefox] TC-2: Case TC-2"]
+    assert [entry.browser for entry in merged.summary] == ["chromium", "firefox", "firefox"]
+    assert not merged.success
+
+
+def test_attach_traces():
+    report = tag_report(build_report(results(case("TC-1", "failed"), case("TC-2", "passed"))), "webkit")
+    traced = attach_traces(report, {("TC-1", "webkit", None): "/traces/webkit/TC-1.zip"})
+    assert [entry.trace_path for entry in traced.summary] == ["/traces/webkit/TC-1.zip", None]
+
+
+def test_attach_traces_keeps_suites_with_the_same_case_ids_apart():
+    report = build_report([results(case("TC-1", "failed")), results(case("TC-1", "failed"))], suites=[1, 2])
+    traced = attach_traces(report, {
+        ("TC-1", "chromium", 1): "/traces/chromium/suite-01/TC-1.zip",
+        ("TC-1", "chromium", 2): "/traces/chromium/suite-02/TC-1.zip",
+    })
+    assert [entry.trace_path for entry in traced.summary] == [
+        "/traces/chromium/suite-01/TC-1.zip", "/traces/chromium/suite-02/TC-1.zip"
+    ]
+
+
+@pytest.mark.parametrize("report", [None, {"pass_count": 1}])
+def test_attach_traces_leaves_invalid_reports_unchanged(report):
+    assert attach_traces(report, {("TC-1", "chromium", None): "/traces/TC-1.zip"}) == report
@@ -0,0 +1,65 @@
+import time
+
+import pytest
+
+from frontend_test_crew.tools.retry_policy import RetryError, RetryPolicy, is_timeout
+
+
+class TimeoutError(Exception):
+    """Stands in for playwright's TimeoutError, matched by name"""
+
+
+def failing(error, calls):
+    def action(timeout):
+        calls.append(timeout)
+        raise error
+    return action
+
+
+def test_timeouts_are_not_retried():
+    calls = []
+    with pytest.raises(RetryError) as info:
+        RetryPolicy().execute(failing(TimeoutError("Timeout 3000ms exceeded."), calls))
+    assert info.value.attempts == 1
+    assert calls == [3000]
+
+
+def test_detached_elements_are_retried():
+    calls = []
+
+    def action(timeout):
+        calls.append(timeout)
+        if len(calls) < 3:
+            raise Exception("Element is not attached to the DOM")
+        return "clicked"
+
+    assert RetryPolicy(initial_delay_ms=1).execute(action) == ("clicked", 2)
+
+
+def test_permanent_errors_fail_immediately():
+    calls = []
+    with pytest.raises(RetryError):
+        RetryPolicy().execute(failing(Exception("'div[' is not a valid selector"), calls))
+    assert len(calls) == 1
+
+
+def test_attempts_share_one_deadline():
+    calls = []
+
+    def action(timeout):
+        calls.append(timeout)
+        time.sleep(0.05)
+        raise Exception("element was detached from the DOM")
+
+    policy = RetryPolicy(max_attempts=10, initial_delay_ms=10, deadline_ms=120, actionability_timeout_ms=100)
+    started = time.monotonic()
+    with pytest.raises(RetryError):
+        policy.execute(action)
+    assert time.monotonic() - started < 0.2
+    assert calls[0] == 100 and all(timeout < 100 for timeout in calls[1:])
+
+
+def test_is_timeout():
+    assert is_timeout(TimeoutError("anything"))
+    assert is_timeout(Exception("Timeout 500ms exceeded while waiting for locator"))
+    assert not is_timeout(Exception("element was detached"))
@@ -0,0 +1,141 @@
+import io
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from frontend_test_crew.visual_regression import (  # noqa: E402
+    VisualBaselines,
+    apply_masks,
+    changed_pixels,
+    load_pixels,
+)
+
+
+def png(pixels, **options):
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG", **options)
+    return buffer.getvalue()
+
+
+def page(width=40, height=30, color=(255, 255, 255)):
+    pixels = np.zeros((height, width, 3), dtype=np.uint8)
+    pixels[:] = color
+    return pixels
+
+
+@pytest.fixture
+def baselines(tmp_path):
+    return VisualBaselines(directory=str(tmp_path / "baselines"), diff_dir=str(tmp_path / "diffs"))
+
+
+class TestPixelDiff:
+    def test_threshold_applies_to_largest_channel(self):
+        baseline = page(4, 1)
+        actual = baseline.copy()
+        actual[0, 0] = (255, 255, 250)
+        actual[0, 1] = (255, 200, 255)
+        actual[0, 2] = (0, 0, 0)
+        assert changed_pixels(baseline, actual, threshold=16).tolist() == [[False, True, True, False]]
+
+    def test_unsigned_differences_in_both_directions(self):
+        baseline, actual = page(2, 1, (10, 10, 10)), page(2, 1, (10, 10, 10))
+        actual[0, 0] = (200, 200, 200)
+        baseline[0, 1] = (200, 200, 200)
+        assert changed_pixels(baseline, actual, threshold=16).tolist() == [[True, True]]
+
+    def test_masks_are_clipped_to_the_image(self):
+        masked = apply_masks(page(4, 4), [(2, 2, 10, 10)])
+        assert masked[2:, 2:].max() == 0
+        assert masked[:2].min() == 255 and masked[:, :2].min() == 255
+
+    def test_no_masks_returns_input(self):
+        pixels = page(2, 2)
+        assert apply_masks(pixels, []) is pixels
+
+
+class TestCompare:
+    def test_first_capture_creates_baseline(self, baselines):
+        result = baselines.compare("home", png(page()), variant="chromium")
+        assert result.status == "created" and result.passed
+        assert os.path.exists(result.baseline_path)
+        assert baselines.keys() == ["home@chromium"]
+        assert baselines.load_meta("home@chromium").width == 40
+
+    def test_same_bytes_are_identical(self, baselines):
+        data = png(page())
+        baselines.compare("home", data)
+        assert baselines.compare("home", data).status == "identical"
+
+    def test_same_pixels_skip_the_baseline_image(self, baselines):
+        baselines.compare("home", png(page(), compress_level=9))
+        # The pixel digest decides without decoding the baseline
+        os.remove(baselines.image_path("home"))
+        result = baselines.compare("home", png(page(), compress_level=1))
+        assert result.status == "identical" and result.passed
+
+    def test_small_change_within_tolerance_matches(self, baselines):
+        baselines.tolerance = 0.01
+        baselines.compare("home", png(page()))
+        actual = page()
+        actual[0, 0] = (0, 0, 0)
+        result = baselines.compare("home", png(actual))
+        assert result.status == "match" and result.passed
+        assert result.diff_pixels == 1
+
+    def test_mismatch_writes_capture_and_diff(self, baselines):
+        baselines.compare("home", png(page()))
+        actual = page()
+        actual[10:20, 5:15] = (0, 0, 0)
+        result = baselines.compare("home", png(actual))
+        assert result.status == "mismatch" and not result.passed
+        assert result.diff_pixels == 100
+        assert result.changed_region == (5, 10, 10, 10)
+        assert os.path.exists(result.actual_path)
+        with open(result.diff_path, "rb") as f:
+            diff = load_pixels(f.read())
+        assert tuple(diff[15, 10]) == (255, 0, 0)
+
+    def test_masked_region_is_ignored(self, baselines):
+        baselines.compare("home", png(page()))
+        actual = page()
+        actual[0:5, 0:5] = (0, 0, 0)
+        assert not baselines.compare("home", png(actual)).passed
+        assert baselines.compare("home", png(actual), masks=[(0, 0, 5, 5)]).passed
+
+    def test_stored_masks_apply_to_every_comparison(self, baselines):
+        baselines.compare("home", png(page()), masks=[(0, 0, 5, 5)])
+        actual = page()
+        actual[0:5, 0:5] = (0, 0, 0)
+        assert baselines.compare("home", png(actual)).status == "identical"
+
+    def test_size_mismatch_fails(self, baselines):
+        baselines.compare("home", png(page()))
+        result = baselines.compare("home", png(page(width=41)))
+        assert result.status == "size_mismatch" and not result.passed
+        assert result.diff_ratio == 1.0
+        assert os.path.exists(result.actual_path)
+
+    def test_update_replaces_baseline(self, baselines):
+        baselines.compare("home", png(page()))
+        baselines.update = True
+        result = baselines.compare("home", png(page(color=(0, 0, 0))))
+        assert result.status == "updated"
+        # Written through temporary files that are renamed into place
+        assert sorted(os.listdir(baselines.directory)) == ["home.json", "home.png"]
+
+
+class TestApprove:
+    def test_failing_capture_becomes_baseline(self, baselines):
+        baselines.compare("home", png(page()), masks=[(0, 0, 2, 2)])
+        baselines.compare("about", png(page()))
+        actual = png(page(color=(0, 0, 0)))
+        assert not baselines.compare("home", actual).passed
+        assert not baselines.compare("about", actual).passed
+
+        assert baselines.approve([baselines.diff_dir], keys=["home"]) == ["home"]
+        assert baselines.compare("home", actual).status == "identical"
+        assert baselines.load_meta("home").masks == [(0, 0, 2, 2)]
+        assert not baselines.compare("about", actual).passed